@@ -126,6 +126,16 @@ def update(ctx: Context) -> None:
     ctx.run(["uvx", "uv-upx", "upgrade", "run"], title="uv-upx upgrade")
 
 
+@duty(capture=CI)
+def bench(ctx: Context, *cli_args: str) -> None:
+    """Run the benchmark suite and compare it against the stored baseline."""
+    ctx.run(
+        [sys.executable, "scripts/benchmark.py", *cli_args],
+        title=pyprefix("Running benchmarks"),
+        command=f"python scripts/benchmark.py {' '.join(cli_args)}",
+    )
+
+
 @duty()
 def test(ctx: Context, *cli_args: str) -> None:
     """Test package and generate coverage reports."""
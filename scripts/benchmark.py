@@ -0,0 +1,295 @@
+"""Benchmark nd's startup, end-to-end commands, and model decoding against a stored baseline.
+
+Run through ``duty bench``. Four groups of metrics are collected:
+
+- ``import``: the cumulative ``python -X importtime`` cost of ``nd.cli``.
+- ``command``: wall time of each network-only subcommand, run in a fresh interpreter
+  against the test suite's fake Nomad API serving a generated cluster.
+- ``decode``: msgspec decode throughput of the list models in ``nd.nomad.models``.
+- ``aggregate``: time to turn a cluster with a long allocation history (50,000 allocations
+  by default) into the ``nd status`` views, from scratch and after a one-allocation change.
+
+Each metric is compared to the baseline and the run fails when one is worse by more
+than the threshold. Baselines are machine-specific, so they live in an untracked file;
+record one with ``--save`` before comparing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+import msgspec
+from rich.console import Console
+from rich.table import Table
+
+from nd.commands.status import ReportBuilder, build_status
+from nd.nomad.config import NomadConfig
+from nd.nomad.models.allocation import AllocListStub
+from nd.nomad.models.deployment import DeploymentListStub
+from nd.nomad.models.evaluation import EvalListStub
+from nd.nomad.models.job import JobListStub
+from nd.nomad.models.node import NodeListStub
+
+# The fake Nomad API and cluster generator are shared with the test suite.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.fakes import Cluster, FakeNomad, generate_cluster  # noqa: E402
+
+console = Console()
+DEFAULT_BASELINE = PROJECT_ROOT / ".benchmarks" / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+GROUPS = ("import", "command", "decode", "aggregate")
+
+# Subcommands that only talk to the Nomad HTTP API. plan/run/update also shell out to
+# the `nomad` binary and logs/exec need a live task, so they are left out.
+COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("status",),
+    ("status", "--hosts"),
+    ("list",),
+    ("volume", "list"),
+    ("clean",),
+)
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*nd\.cli$")
+
+
+@dataclass(frozen=True)
+class Metric:
+    """One measured value and the direction in which it improves."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+    def regressed(self, baseline: float, threshold: float) -> bool:
+        """Return True when this value is worse than ``baseline`` by more than ``threshold``."""
+        if self.higher_is_better:
+            return self.value < baseline / (1 + threshold)
+        return self.value > baseline * (1 + threshold)
+
+
+def bench_import(repeat: int) -> list[Metric]:
+    """Measure the median cumulative import time of ``nd.cli`` in fresh interpreters."""
+    samples: list[float] = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import nd.cli"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        micros = [
+            int(match.group(1))
+            for line in result.stderr.splitlines()
+            if (match := _IMPORTTIME_RE.match(line.strip()))
+        ]
+        samples.append(max(micros) / 1000)
+    return [Metric("import nd.cli", statistics.median(samples), "ms")]
+
+
+def bench_commands(repeat: int, cluster: Cluster) -> list[Metric]:
+    """Measure the median wall time of each subcommand against a fake Nomad."""
+    metrics: list[Metric] = []
+    with tempfile.TemporaryDirectory() as tmp, FakeNomad(cluster) as fake:
+        env = _command_env(Path(tmp), fake.address)
+        for argv in COMMANDS:
+            samples: list[float] = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = subprocess.run(  # noqa: S603 - runs this interpreter on a fixed argv
+                    [sys.executable, "-c", "from nd.cli import main; main()", *argv],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                    check=False,
+                )
+                samples.append((time.perf_counter() - start) * 1000)
+                if result.returncode != 0:
+                    msg = f"nd {' '.join(argv)} exited {result.returncode}:\n{result.stdout}"
+                    raise RuntimeError(msg + result.stderr)
+            metrics.append(Metric(f"nd {' '.join(argv)}", statistics.median(samples), "ms"))
+    return metrics
+
+
+def _command_env(root: Path, address: str) -> dict[str, str]:
+    """Build an isolated environment: no caller NOMAD_* settings, fresh config and caches."""
+    jobs = root / "jobs"
+    volumes = root / "volumes"
+    jobs.mkdir()
+    volumes.mkdir()
+    for i in range(20):
+        (jobs / f"job-{i:05d}.hcl").write_text(
+            f'job "job-{i:05d}" {{\n  group "web" {{\n    task "app" {{}}\n  }}\n}}\n',
+            encoding="utf-8",
+        )
+    (volumes / "data.hcl").write_text('name = "data"\ntype = "host"\n', encoding="utf-8")
+    config = root / "config" / "nd" / "config.toml"
+    config.parent.mkdir(parents=True)
+    config.write_text(
+        f'[jobs]\ndirectories = ["{jobs}"]\n\n[volumes]\ndirectories = ["{volumes}"]\n',
+        encoding="utf-8",
+    )
+    env = {key: value for key, value in os.environ.items() if not key.startswith("NOMAD_")}
+    env |= {
+        "NOMAD_ADDR": address,
+        "XDG_CONFIG_HOME": str(root / "config"),
+        "XDG_CACHE_HOME": str(root / "cache"),
+        "COLUMNS": "120",
+    }
+    return env
+
+
+def bench_decode(repeat: int, cluster: Cluster) -> list[Metric]:
+    """Measure the best-of-``repeat`` decode throughput of each list model, in items/s."""
+    listings: dict[type[msgspec.Struct], list] = {
+        NodeListStub: cluster.nodes,
+        JobListStub: cluster.jobs,
+        AllocListStub: cluster.allocations,
+        DeploymentListStub: cluster.deployments,
+        EvalListStub: cluster.evaluations,
+    }
+    metrics: list[Metric] = []
+    for model, items in listings.items():
+        decoder = msgspec.json.Decoder(list[model])
+        body = msgspec.json.encode(items)
+        count = len(items)
+        timer = timeit.Timer(lambda decoder=decoder, body=body: decoder.decode(body))
+        # autorange loops until a sample takes >= 0.2s, so small payloads are not just noise.
+        best = min(total / loops for loops, total in (timer.autorange() for _ in range(repeat)))
+        metrics.append(
+            Metric(f"decode {model.__name__}", count / best, "items/s", higher_is_better=True)
+        )
+    return metrics
+
+
+def bench_aggregate(repeat: int, cluster: Cluster) -> list[Metric]:
+    """Measure the best-of-``repeat`` time to build the status views from ``cluster``."""
+    config = NomadConfig(address="http://127.0.0.1:4646")
+    listings = {
+        "nodes": cluster.nodes,
+        "jobs": cluster.jobs,
+        "allocs": cluster.allocations,
+        "members": cluster.members,
+        "leader": cluster.leader,
+        "deployments": cluster.deployments,
+        "evals": cluster.evaluations,
+        "volumes": cluster.volumes,
+    }
+    size = f"{len(cluster.allocations):,} allocs"
+
+    def build(*, hosts: bool) -> float:
+        timer = timeit.Timer(lambda: build_status(**listings, config=config, hosts=hosts))
+        return min(timer.repeat(repeat=repeat, number=1)) * 1000
+
+    builder = ReportBuilder(config)
+    builder.update(**listings)
+    flipped = [
+        msgspec.structs.replace(alloc, client_status=status)
+        for alloc in cluster.allocations[:1]
+        for status in ("failed", alloc.client_status)
+    ]
+
+    def delta() -> None:
+        for alloc in flipped:
+            builder.apply_allocs([alloc])
+            builder.report()
+            builder.host_panels()
+
+    timer = timeit.Timer(delta)
+    best = min(total / loops for loops, total in (timer.autorange() for _ in range(repeat)))
+    return [
+        Metric(f"status report ({size})", build(hosts=False), "ms"),
+        Metric(f"status --hosts ({size})", build(hosts=True), "ms"),
+        # Two deltas per loop, so the alloc ends each loop as it started.
+        Metric(f"status delta ({size})", best / len(flipped) * 1000, "ms"),
+    ]
+
+
+def _report(metrics: list[Metric], baseline: dict[str, float], threshold: float) -> bool:
+    """Print each metric beside its baseline and return True when any regressed."""
+    table = Table(title=f"nd benchmarks (regression threshold {threshold:.0%})")
+    for column in ("metric", "value", "baseline", "change", ""):
+        table.add_column(column, justify="left" if column == "metric" else "right")
+    regressed = False
+    for metric in metrics:
+        base = baseline.get(metric.name)
+        if base is None:
+            table.add_row(metric.name, f"{metric.value:,.1f} {metric.unit}", "-", "-", "new")
+            continue
+        worse = metric.regressed(base, threshold)
+        regressed |= worse
+        table.add_row(
+            metric.name,
+            f"{metric.value:,.1f} {metric.unit}",
+            f"{base:,.1f}",
+            f"{(metric.value - base) / base:+.1%}",
+            "[red]REGRESSED[/red]" if worse else "[green]ok[/green]",
+        )
+    console.print(table)
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the selected benchmark groups and compare against (or save) the baseline.
+
+    Returns:
+        int: 1 when any metric regressed beyond the threshold, else 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", choices=GROUPS, action="append", help="Run only these groups.")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per metric.")
+    parser.add_argument("--nodes", type=int, default=100, help="Synthetic cluster nodes.")
+    parser.add_argument("--jobs", type=int, default=300, help="Synthetic cluster jobs.")
+    parser.add_argument("--allocs", type=int, default=5000, help="Synthetic cluster allocations.")
+    parser.add_argument(
+        "--aggregate-allocs",
+        type=int,
+        default=50_000,
+        help="Allocations in the cluster the aggregate group builds status views from.",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline.")
+    args = parser.parse_args(argv)
+
+    groups = set(args.only or GROUPS)
+    cluster = generate_cluster(nodes=args.nodes, jobs=args.jobs, allocs=args.allocs)
+    metrics: list[Metric] = []
+    if "import" in groups:
+        metrics += bench_import(args.repeat)
+    if "command" in groups:
+        metrics += bench_commands(args.repeat, cluster)
+    if "decode" in groups:
+        metrics += bench_decode(args.repeat, cluster)
+    if "aggregate" in groups:
+        history = generate_cluster(nodes=args.nodes, jobs=args.jobs, allocs=args.aggregate_allocs)
+        metrics += bench_aggregate(args.repeat, history)
+
+    baseline: dict[str, float] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressed = _report(metrics, baseline, args.threshold)
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        merged = baseline | {metric.name: metric.value for metric in metrics}
+        args.baseline.write_text(json.dumps(merged, indent=2) + "\n", encoding="utf-8")
+        console.print(f"Saved baseline to {args.baseline}")
+        return 0
+    return int(regressed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""On-disk cache of `nomad` binary results for local job files.
+
+Compiling HCL2 (`nomad job run -output`) and validating it (`nomad job validate`) each
+spawn the binary, so a deploy pays two process launches per file even when nothing in
+the file changed since the last run. `JobSpecCache` remembers the compiled
+``{"Job": ...}`` payload and a successful validation per file, keyed by a hash of the
+file's contents, the binary's identity, the connection settings the binary sees, and
+the ``NOMAD_VAR_*`` variables that feed the job's HCL2 variables, so any of those
+changing is a miss rather than a stale hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+import msgspec
+from nclutils import pp
+
+from nd.binary.env import binary_env
+from nd.cachefiles import atomic_write_bytes, read_json
+from nd.nomad.config import default_cache_dir
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from nd.nomad.config import NomadConfig
+
+# Bump when the entry layout or the key recipe changes so old entries are ignored.
+_CACHE_VERSION = "2"
+
+# Prefix of the environment variables `nomad` reads as values for a job's HCL2 variables.
+_VAR_ENV_PREFIX = "NOMAD_VAR_"
+
+
+class _Entry(msgspec.Struct, frozen=True, kw_only=True):
+    """One fact about a job file's current contents."""
+
+    validated: bool = False
+    compiled: str | None = None
+
+
+class JobSpecCache:
+    """Per-file cache of compile output and validation, stored under the XDG cache dir.
+
+    Only successes are recorded: a failed validation or compile is re-run next time so
+    its error reflects the current cluster and file. Cache I/O failures are logged at
+    debug level and treated as a miss; the cache never fails a command. The key covers
+    the job file itself, not files it pulls in through HCL functions such as ``file()``.
+
+    Validation and compile output are separate entries, each written whole, so a
+    validate and a compile of the same file finishing together cannot drop each
+    other's result.
+    """
+
+    def __init__(self, config: NomadConfig, binary: Path, root: Path | None = None) -> None:
+        self._root = (root or default_cache_dir()) / "jobspecs"
+        variables = sorted(
+            f"{name}={value}"
+            for name, value in binary_env(config).items()
+            if name.startswith(_VAR_ENV_PREFIX)
+        )
+        self._salt = "\0".join(
+            [
+                _CACHE_VERSION,
+                _binary_identity(binary),
+                config.address,
+                config.namespace or "",
+                config.region or "",
+                *variables,
+            ]
+        ).encode()
+
+    def compiled(self, file: Path) -> bytes | None:
+        """Return the cached compile output for ``file``, or None on a miss."""
+        entry = self._load(file, "compiled")
+        if entry is None or entry.compiled is None:
+            return None
+        return entry.compiled.encode("utf-8")
+
+    def validated(self, file: Path) -> bool:
+        """Return whether ``file``'s current contents have validated before."""
+        entry = self._load(file, "validated")
+        return entry is not None and entry.validated
+
+    def store_compiled(self, file: Path, body: bytes) -> None:
+        """Record the compile output for ``file``'s current contents."""
+        self._write(file, "compiled", _Entry(compiled=body.decode("utf-8")))
+
+    def store_validated(self, file: Path) -> None:
+        """Record that ``file``'s current contents validated."""
+        self._write(file, "validated", _Entry(validated=True))
+
+    def _entry_path(self, file: Path, kind: str) -> Path | None:
+        """Return the ``kind`` entry path for ``file``'s contents, or None if unreadable."""
+        try:
+            content = file.read_bytes()
+        except OSError as exc:
+            pp.debug(f"Job spec cache skipped for {file}: {exc}")
+            return None
+        digest = hashlib.sha256(self._salt + b"\0" + content).hexdigest()
+        return self._root / f"{digest}.{kind}.json"
+
+    def _load(self, file: Path, kind: str) -> _Entry | None:
+        """Read ``file``'s ``kind`` entry, treating a missing or corrupt entry as a miss."""
+        path = self._entry_path(file, kind)
+        if path is None:
+            return None
+        return read_json(path, _Entry, what="job spec cache entry")
+
+    def _write(self, file: Path, kind: str, entry: _Entry) -> None:
+        """Write ``file``'s ``kind`` entry atomically."""
+        path = self._entry_path(file, kind)
+        if path is not None:
+            atomic_write_bytes(path, msgspec.json.encode(entry), what="job spec cache entry")
+
+
+def _binary_identity(binary: Path) -> str:
+    """Identify the installed `nomad` binary without spawning it.
+
+    The resolved path, size and modification time change whenever the binary is
+    upgraded or replaced, which is what the version check is for, and reading them
+    costs a ``stat`` rather than a `nomad version` process launch.
+    """
+    try:
+        resolved = binary.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return str(binary)
+    return f"{resolved}:{stat.st_size}:{stat.st_mtime_ns}"
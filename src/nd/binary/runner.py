@@ -15,7 +15,9 @@ from typing import TYPE_CHECKING
 from nclutils import pp
 from nclutils.sh import ShellCommandError, run_command, run_interactive
 
+from nd.binary.cache import JobSpecCache
 from nd.binary.env import NomadBinaryError, binary_env, ensure_nomad
+from nd.tracing import span
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -28,22 +30,28 @@ class NomadBinary:
 
     Build it with :meth:`create`, which resolves the binary on PATH. The job-spec
     methods (`validate`/`plan`/`compile_to_json`) act on local HCL2 files; the
-    allocation methods (`exec_command`/`stream_logs`) act on a running task.
+    allocation methods (`exec_command`/`stream_logs`) act on a running task. With a
+    ``cache``, `validate` and `compile_to_json` skip the binary for a file whose
+    contents already validated or compiled under the same binary and cluster.
     """
 
-    def __init__(self, config: NomadConfig, path: Path) -> None:
+    def __init__(self, config: NomadConfig, path: Path, cache: JobSpecCache | None = None) -> None:
         self._path = str(path)
         # Build the connection-env overlay once; it is invariant for this cluster.
         self._env = binary_env(config)
+        self._cache = cache
 
     @classmethod
     def create(cls, config: NomadConfig) -> NomadBinary:
         """Resolve the `nomad` binary on PATH and bind it to ``config``.
 
+        The handle caches compile and validation results under the XDG cache dir.
+
         Raises:
             NomadBinaryError: If the binary is not on PATH.
         """
-        return cls(config, ensure_nomad())
+        path = ensure_nomad()
+        return cls(config, path, JobSpecCache(config, path))
 
     # --- job specs (HCL2 compile/validate) -------------------------------------------
 
@@ -53,11 +61,17 @@ class NomadBinary:
         Raises:
             NomadBinaryError: If validation fails or the binary cannot run.
         """
+        if self._cache is not None and self._cache.validated(file):
+            pp.trace(f"validate {file}: unchanged since last validation, skipped")
+            return
         try:
-            run_command([self._path, "job", "validate", str(file)], env=self._env)
+            with span("nomad job validate", **{"nd.file": str(file)}):
+                run_command([self._path, "job", "validate", str(file)], env=self._env)
         except ShellCommandError as exc:
             msg = f"`nomad job validate {file}` failed: {_stderr(exc)}"
             raise NomadBinaryError(msg) from exc
+        if self._cache is not None:
+            self._cache.store_validated(file)
 
     def plan(self, file: Path) -> int:
         """Preview a job with `nomad job plan`, streaming its output verbatim.
@@ -68,9 +82,10 @@ class NomadBinary:
             NomadBinaryError: If the binary cannot be launched.
         """
         try:
-            result = run_command(
-                [self._path, "job", "plan", str(file)], env=self._env, stream=True, check=False
-            )
+            with span("nomad job plan", **{"nd.file": str(file)}):
+                result = run_command(
+                    [self._path, "job", "plan", str(file)], env=self._env, stream=True, check=False
+                )
         except ShellCommandError as exc:
             msg = f"`nomad job plan {file}` could not run: {_stderr(exc)}"
             raise NomadBinaryError(msg) from exc
@@ -84,12 +99,21 @@ class NomadBinary:
         Raises:
             NomadBinaryError: If compilation fails.
         """
+        if self._cache is not None and (cached := self._cache.compiled(file)) is not None:
+            pp.trace(f"compile {file}: unchanged since last compile, reused cached JSON")
+            return cached
         try:
-            result = run_command([self._path, "job", "run", "-output", str(file)], env=self._env)
+            with span("nomad job run -output", **{"nd.file": str(file)}):
+                result = run_command(
+                    [self._path, "job", "run", "-output", str(file)], env=self._env
+                )
         except ShellCommandError as exc:
             msg = f"`nomad job run -output {file}` failed: {_stderr(exc)}"
             raise NomadBinaryError(msg) from exc
-        return result.stdout.encode("utf-8")
+        body = result.stdout.encode("utf-8")
+        if self._cache is not None:
+            self._cache.store_compiled(file, body)
+        return body
 
     # --- allocations (interactive exec, log streaming) -------------------------------
 
@@ -0,0 +1,65 @@
+"""Read and write nd's on-disk JSON caches without ever failing the command using them.
+
+The job spec cache, the job file index and the volume spec cache all store JSON under
+the XDG cache dir and follow the same rules: a missing or corrupt file is a miss, a
+failed write is logged at debug level, and a write never leaves a half-written file
+for a concurrent nd to read.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Protocol
+
+import msgspec
+from nclutils import pp
+
+
+class Versioned(Protocol):
+    """A cache file layout that records the format version it was written with."""
+
+    @property
+    def version(self) -> int:
+        """The layout version the file was written with."""
+        ...
+
+
+def atomic_write_bytes(path: Path, payload: bytes, *, what: str) -> None:
+    """Replace ``path`` with ``payload``, logging rather than raising on failure.
+
+    The payload is written beside the target and renamed over it, so a concurrent
+    reader sees either the old file or the new one, never part of either. ``what``
+    names the file in the debug message.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            Path(tmp).replace(path)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+    except OSError as exc:
+        pp.debug(f"Could not write {what} {path}: {exc}")
+
+
+def read_json[T](path: Path, type_: type[T], *, what: str) -> T | None:
+    """Decode ``path`` as ``type_``, or return None when it is missing or unreadable."""
+    try:
+        return msgspec.json.decode(path.read_bytes(), type=type_)
+    except FileNotFoundError:
+        return None
+    except (OSError, msgspec.DecodeError) as exc:
+        pp.debug(f"Ignoring unreadable {what} {path}: {exc}")
+        return None
+
+
+def read_versioned[T: Versioned](
+    path: Path, type_: type[T], version: int, *, what: str
+) -> T | None:
+    """Like `read_json`, but also return None for a file written in another layout."""
+    stored = read_json(path, type_, what=what)
+    return stored if stored is not None and stored.version == version else None
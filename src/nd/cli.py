@@ -2,49 +2,66 @@
 
 from __future__ import annotations
 
+import importlib
 from dataclasses import dataclass
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from nclutils import pp
+from typer.core import TyperGroup
 
 from nd import __version__
-from nd.commands import (
-    clean,
-    exec,  # noqa: A004
-    logs,
-    plan,
-    run,
-    signal,
-    status,
-    stop,
-    update,
-    volume,
-)
-from nd.commands import list as list_cmd
-from nd.nomad import (
-    NomadAuthError,
-    NomadConfigError,
-    NomadConnectionError,
-    NomadError,
-)
-from nd.ui.prompts import PromptUnavailableError
+
+if TYPE_CHECKING:
+    from typer._click import Command as ClickCommand
+    from typer._click import Context as ClickContext
+
+# Subcommand name -> module defining its Typer ``app``, in the order `nd --help` lists
+# them. Modules are imported only when their command is invoked (or help lists them).
+COMMANDS: dict[str, str] = {
+    "status": "nd.commands.status",
+    "stop": "nd.commands.stop",
+    "clean": "nd.commands.clean",
+    "list": "nd.commands.list",
+    "plan": "nd.commands.plan",
+    "run": "nd.commands.run",
+    "update": "nd.commands.update",
+    "logs": "nd.commands.logs",
+    "exec": "nd.commands.exec",
+    "signal": "nd.commands.signal",
+    "volume": "nd.commands.volume",
+    "daemon": "nd.commands.daemon",
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Resolve subcommands from `COMMANDS` on first use instead of at import time.
+
+    Each command module pulls in its own dependencies (Rich layouts, the HCL parser,
+    the Nomad client and models), so importing them all up front made every
+    invocation, even ``nd --version``, pay for the whole tree. Only the invoked
+    subcommand's module is imported; listing help imports each to read its summary.
+    """
+
+    def list_commands(self, ctx: ClickContext) -> list[str]:  # noqa: ARG002
+        """Return the subcommand names in registry order."""
+        return list(COMMANDS)
+
+    def get_command(self, ctx: ClickContext, cmd_name: str) -> ClickCommand | None:
+        """Import the module behind ``cmd_name`` and build its Click command once."""
+        if cmd_name not in self.commands and cmd_name in COMMANDS:
+            module = importlib.import_module(COMMANDS[cmd_name])
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
+    cls=LazyCommandGroup,
     add_completion=False,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
-app.add_typer(status.app, name="status")
-app.add_typer(stop.app, name="stop")
-app.add_typer(clean.app, name="clean")
-app.add_typer(list_cmd.app, name="list")
-app.add_typer(plan.app, name="plan")
-app.add_typer(run.app, name="run")
-app.add_typer(update.app, name="update")
-app.add_typer(logs.app, name="logs")
-app.add_typer(exec.app, name="exec")
-app.add_typer(signal.app, name="signal")
-app.add_typer(volume.app, name="volume")
 
 
 @dataclass
@@ -52,6 +69,8 @@ class AppState:
     """Shared CLI state passed to subcommands via the Typer context object."""
 
     verbose: int = 0
+    profile: bool = False
+    trace: str | None = None
 
 
 def _version_callback(value: bool) -> None:  # noqa: FBT001
@@ -70,6 +89,22 @@ def root(
             "-v", "--verbose", count=True, help="Increase verbosity (-v debug, -vv trace)."
         ),
     ] = 0,
+    profile: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--profile", help="Summarize every Nomad request per endpoint when the command exits."
+        ),
+    ] = False,
+    trace: Annotated[
+        str | None,
+        typer.Option(
+            "--trace",
+            envvar="ND_TRACE",
+            metavar="FILE",
+            help="Write an OTLP JSON trace of the command's phases and requests to FILE "
+            "('-' for stdout).",
+        ),
+    ] = None,
     version: Annotated[  # noqa: ARG001, FBT002
         bool,
         typer.Option(
@@ -82,11 +117,23 @@ def root(
 ) -> None:
     """Manage Nomad jobs, allocations, and host volumes from the command line."""
     pp.configure(verbosity=verbose)
-    ctx.obj = AppState(verbose=verbose)
+    ctx.obj = AppState(verbose=verbose, profile=profile, trace=trace)
+    if trace:
+        from nd.tracing import start_tracing
+
+        command = f"nd {ctx.invoked_subcommand or 'status'}"
+        ctx.call_on_close(start_tracing(trace, command))
+    if profile:
+        from nd.ui.profile import start_profile
+
+        # Closing the root context runs after the subcommand, even when it fails.
+        ctx.call_on_close(start_profile())
 
     # With no subcommand, default to the status dashboard rather than printing help.
     if ctx.invoked_subcommand is None:
-        status.status(ctx, verbose=verbose)
+        from nd.commands.status import status
+
+        status(ctx, verbose=verbose)
 
 
 def main() -> None:
@@ -97,18 +144,36 @@ def main() -> None:
         # 130 = 128 + SIGINT(2), the conventional shell exit code for Ctrl-C.
         pp.warning("Aborted")
         raise SystemExit(130) from exc
-    except PromptUnavailableError as exc:
-        pp.error(str(exc))
+    except Exception as exc:
+        if not _report_error(exc):
+            raise
         raise SystemExit(1) from exc
-    except NomadConnectionError as exc:
+
+
+def _report_error(exc: Exception) -> bool:
+    """Print a clean message for a known nd error, returning False for anything else.
+
+    The error types are imported here rather than at module level so a command that
+    never touches Nomad or prompts does not load the client or questionary to start.
+    """
+    from nd.nomad import (
+        NomadAuthError,
+        NomadConfigError,
+        NomadConnectionError,
+        NomadError,
+    )
+    from nd.ui.prompts import PromptUnavailableError
+
+    if isinstance(exc, PromptUnavailableError):
+        pp.error(str(exc))
+    elif isinstance(exc, NomadConnectionError):
         pp.error("Could not reach the Nomad agent", details=[str(exc)])
-        raise SystemExit(1) from exc
-    except NomadAuthError as exc:
+    elif isinstance(exc, NomadAuthError):
         pp.error("Not authorized by Nomad (check NOMAD_TOKEN)", details=[str(exc)])
-        raise SystemExit(1) from exc
-    except NomadConfigError as exc:
+    elif isinstance(exc, NomadConfigError):
         pp.error("Invalid Nomad configuration", details=[str(exc)])
-        raise SystemExit(1) from exc
-    except NomadError as exc:
+    elif isinstance(exc, NomadError):
         pp.error("Nomad request failed", details=[str(exc)])
-        raise SystemExit(1) from exc
+    else:
+        return False
+    return True
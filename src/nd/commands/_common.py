@@ -11,7 +11,9 @@ from nclutils import pp
 from nclutils.pp import Verbosity
 
 from nd.binary import NomadBinary, NomadBinaryError
+from nd.commands._watch_mode import WatchMode
 from nd.targets import resolve_target
+from nd.ui.output import ProgressOutput
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -24,16 +26,60 @@ VerboseOption = Annotated[
     typer.Option("-v", "--verbose", count=True, help="Increase verbosity (-v debug, -vv trace)."),
 ]
 
+# run/stop/update choose how they follow progress: per-job blocking queries, the event
+# stream, or one cluster-wide poll shared by every watched job.
+WatchModeOption = Annotated[
+    WatchMode,
+    typer.Option(
+        "--watch-mode",
+        help="How to follow progress: per-job blocking queries, Nomad's event stream "
+        "(falls back to blocking queries when unavailable), or one shared cluster-wide "
+        "poll (cheapest for many jobs).",
+        case_sensitive=False,
+    ),
+]
+
+# run/stop/update draw a live panel, or report progress as JSON lines for CI logs.
+OutputOption = Annotated[
+    ProgressOutput,
+    typer.Option(
+        "--output",
+        help="How to report progress: a live panel, or one JSON event per line on stdout "
+        "(for CI logs; info messages are silenced, warnings and errors go to stderr).",
+        case_sensitive=False,
+    ),
+]
+
+# run/update/plan validate and compile their job files on a bounded worker pool.
+WorkersOption = Annotated[
+    int,
+    typer.Option(
+        "--workers",
+        min=1,
+        help="How many job files to validate and compile at once.",
+    ),
+]
+
+# File-aware commands trust the job-file discovery index unless asked to re-read.
+RescanOption = Annotated[
+    bool,
+    typer.Option(
+        "--rescan",
+        help="Re-read every job file instead of trusting the discovery index.",
+    ),
+]
+
 
-def configure_verbosity(ctx: typer.Context, verbose: int) -> int:
+def configure_verbosity(ctx: typer.Context, verbose: int, *, quiet: bool = False) -> int:
     """Apply the effective verbosity and return it.
 
     A subcommand accepts ``-v``/``-vv`` either before it (the root callback, which
     stores its count on ``ctx.obj``) or after it; take the louder of the two so
-    either position works, then configure ``pp`` with the result.
+    either position works, then configure ``pp`` with the result. ``quiet`` silences
+    info and success messages, keeping stdout for machine-readable output.
     """
     verbose = max(getattr(ctx.obj, "verbose", 0), verbose)
-    pp.configure(verbosity=verbose)
+    pp.configure(verbosity=verbose, quiet=quiet)
     return verbose
 
 
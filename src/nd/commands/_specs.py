@@ -0,0 +1,115 @@
+"""Concurrent validation and compilation of the job files a command acts on.
+
+Validating (`nomad job validate`) and compiling (`nomad job run -output`) each spawn
+the `nomad` binary, so a multi-file run that does them one file at a time spends most
+of its wall time waiting on sequential subprocesses. `SpecPipeline` runs them on a
+bounded worker pool instead: every selected file's validation and compile start at
+once, and each consumer awaits only the result it needs, so the first job can start
+registering while later files are still compiling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Self
+
+from nd.constants import DEFAULT_SPEC_WORKERS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from nd.binary import NomadBinary
+
+
+class SpecPipeline:
+    """Validate and compile job files on a bounded pool, each file at most once.
+
+    Results are memoized per path, so a multi-job file is validated and compiled once
+    however many of its jobs are selected. The pool uses threads: the work is a child
+    process, so a thread only waits on it. Use as an async context manager so work
+    still queued when the command returns early is cancelled.
+    """
+
+    def __init__(self, nomad: NomadBinary, *, workers: int = DEFAULT_SPEC_WORKERS) -> None:
+        self._nomad = nomad
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="nd")
+        self._validations: dict[Path, asyncio.Future[None]] = {}
+        self._compiles: dict[Path, asyncio.Future[bytes]] = {}
+
+    async def __aenter__(self) -> Self:
+        """Return the pipeline."""
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Cancel queued work; a process already running finishes in the background."""
+        pending = [*self._validations.values(), *self._compiles.values()]
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def prefetch(self, paths: Iterable[Path], *, compile_specs: bool = True) -> None:
+        """Start validating (and compiling) every path now, without waiting on any.
+
+        Results are then ready, or already in flight, when a consumer asks for them.
+        A caller that only needs validation (a plan, a dry run) skips the compile.
+        """
+        for path in paths:
+            self._validation(path)
+            if compile_specs:
+                self._compilation(path)
+
+    async def validate_all(self, paths: Iterable[Path]) -> None:
+        """Validate every path concurrently, waiting for all of them.
+
+        Raises:
+            NomadBinaryError: The first failure in ``paths`` order, so the error reported
+                does not depend on which subprocess happened to finish first.
+        """
+        futures = [self._validation(path) for path in dict.fromkeys(paths)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def validated(self, path: Path) -> None:
+        """Wait for ``path``'s validation, starting it if needed.
+
+        Raises:
+            NomadBinaryError: If validation fails.
+        """
+        await asyncio.shield(self._validation(path))
+
+    async def compiled(self, path: Path) -> bytes:
+        """Return ``path``'s compiled ``{"Job": ...}`` JSON, starting the compile if needed.
+
+        Raises:
+            NomadBinaryError: If compilation fails.
+        """
+        # Shielded so one cancelled consumer does not cancel a compile a sibling job
+        # from the same multi-job file is also waiting on.
+        return await asyncio.shield(self._compilation(path))
+
+    def _validation(self, path: Path) -> asyncio.Future[None]:
+        """Return the (possibly already running) validation of ``path``."""
+        if path not in self._validations:
+            self._validations[path] = self._submit(self._nomad.validate, path)
+        return self._validations[path]
+
+    def _compilation(self, path: Path) -> asyncio.Future[bytes]:
+        """Return the (possibly already running) compile of ``path``."""
+        if path not in self._compiles:
+            self._compiles[path] = self._submit(self._nomad.compile_to_json, path)
+        return self._compiles[path]
+
+    def _submit[T](self, call: Callable[[Path], T], path: Path) -> asyncio.Future[T]:
+        """Run ``call(path)`` on the worker pool, in a copy of the caller's context.
+
+        Unlike `asyncio.to_thread`, an executor does not carry context variables over, so
+        without the copy a traced subprocess would lose its parent span.
+        """
+        context = contextvars.copy_context()
+        return asyncio.get_running_loop().run_in_executor(self._executor, context.run, call, path)
@@ -0,0 +1,440 @@
+"""Where the deploy and drain watchers read job state from, and how they wait for change.
+
+``watch_deploy`` and ``stop_and_wait`` share one loop shape: read the job's
+allocations (and, for a deploy, its deployments), judge the tick, then wait until the
+state is worth reading again. A `JobFeed` owns the read and the wait so the loops stay
+the same whichever way change is detected:
+
+- `BlockingFeed` long-polls each job's allocations with Nomad blocking queries.
+- `EventFeed` subscribes once to the event stream for every watched job and wakes
+  each watcher when an event names its job, falling back to blocking queries when the
+  stream is unavailable (older Nomad, or a token without the ACL).
+- `SharedFeed` long-polls the cluster-wide allocation and deployment listings once
+  for all watched jobs and fans each listing out by job id, so the request rate no
+  longer grows with the number of jobs being watched.
+
+Where a feed has nothing to block on (no index, a change it cannot observe, a transient
+error), it paces re-reads with a `PollSchedule`, which backs off while the job sits
+still and snaps back to fast ticks as soon as it moves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Protocol, Self
+
+from nclutils import pp
+
+from nd.commands._watch_mode import WatchMode
+from nd.constants import BLOCKING_QUERY_WAIT_SECONDS, POLL_INTERVAL_SECONDS
+from nd.nomad.errors import NomadDecodeError, NomadError
+from nd.nomad.filters import any_equal
+from nd.nomad.models.deployment import DeploymentListStub
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+
+    from nd.nomad import NomadClient
+    from nd.nomad.models.allocation import AllocListStub
+    from nd.nomad.models.deployment import Deployment
+    from nd.nomad.resources.base import QueryResult
+
+# Event topics that can move a deploy or drain forward, each filtered by job id.
+_EVENT_TOPICS = ("Job", "Allocation", "Deployment")
+
+
+class JobFeed(Protocol):
+    """Source of a watched job's state and of the signal that it changed."""
+
+    async def allocations(self, job_id: str) -> list[AllocListStub]:
+        """Return the job's allocations."""
+        ...
+
+    async def deployments(self, job_id: str) -> list[DeploymentListStub]:
+        """Return the job's deployments."""
+        ...
+
+    async def deployment(self, deployment_id: str) -> Deployment:
+        """Return one deployment with its per-task-group health counts."""
+        ...
+
+    async def changed(self, job_id: str, *, deadline: float, poll: bool = False) -> None:
+        """Wait until the job's state is worth reading again, but not past ``deadline``.
+
+        ``poll`` asks for a short paced wait instead of waiting for a change: the
+        caller hit a transient error, or expects a change the feed cannot observe.
+        """
+        ...
+
+
+class PollSchedule:
+    """Adaptive pacing for the re-reads a feed cannot block on, one interval per key.
+
+    A key (a job id, or a cluster-wide listing) starts at ``POLL_INTERVAL_SECONDS``, so
+    the first ticks after a register or stop are quick. Every paced wait that follows
+    without a change doubles the interval, up to ``maximum``; `observe` seeing different
+    state, or `reset`, brings it back to the start.
+    """
+
+    def __init__(self, maximum: float) -> None:
+        self._maximum = maximum
+        self._quiet: dict[str, int] = {}
+        self._seen: dict[tuple[str, str], object] = {}
+
+    def observe(self, key: str, part: str, state: object) -> None:
+        """Record a read of ``key``'s ``part``, resetting the key if it differs from the last."""
+        seen = (key, part)
+        if seen not in self._seen or self._seen[seen] != state:
+            self._seen[seen] = state
+            self.reset(key)
+
+    def reset(self, key: str) -> None:
+        """Return ``key`` to the fast interval."""
+        self._quiet.pop(key, None)
+
+    def delay(self, key: str, deadline: float | None = None) -> float:
+        """Return how long the next paced wait for ``key`` holds, and back the key off.
+
+        Never holds past ``deadline``, so a timeout is still reported on time.
+        """
+        interval = min(self._maximum, POLL_INTERVAL_SECONDS * 2 ** self._quiet.get(key, 0))
+        if interval < self._maximum:
+            self._quiet[key] = self._quiet.get(key, 0) + 1
+        if deadline is not None:
+            interval = min(interval, max(0.0, deadline - time.monotonic()))
+        return interval
+
+    async def wait(self, key: str, deadline: float | None = None) -> None:
+        """Sleep for ``key``'s next interval, bounded by ``deadline``."""
+        await asyncio.sleep(self.delay(key, deadline))
+
+
+def blocking_wait(deadline: float) -> float:
+    """Return how long the next wait may hold, bounded by the watch's ``deadline``.
+
+    Never holds past the wall-clock deadline, so a timeout is reported on time rather
+    than after a full wait, and never asks for less than a second.
+    """
+    remaining = deadline - time.monotonic()
+    return max(1.0, min(BLOCKING_QUERY_WAIT_SECONDS, remaining))
+
+
+class BlockingFeed:
+    """Read each job's allocations with blocking queries so a read returns on change.
+
+    The wait lives inside the next ``allocations`` read: once Nomad has reported an
+    index for the job, ``changed`` only sets how long that read may hold. Without an
+    index (a server or proxy that does not report one) it sleeps between polls instead,
+    on a `PollSchedule` that is reset whenever a read returns different state.
+    """
+
+    def __init__(self, client: NomadClient, schedule: PollSchedule | None = None) -> None:
+        self._client = client
+        self._schedule = schedule or PollSchedule(client.config.poll_max_interval)
+        self._indexes: dict[str, int] = {}
+        self._waits: dict[str, float] = {}
+
+    async def allocations(self, job_id: str) -> list[AllocListStub]:
+        """Return the job's allocations, holding until they move past the last index."""
+        result = await self._client.jobs.allocations_indexed(
+            job_id,
+            index=self._indexes.get(job_id, 0),
+            wait=self._waits.get(job_id, BLOCKING_QUERY_WAIT_SECONDS),
+        )
+        self._indexes[job_id] = result.index
+        self._schedule.observe(job_id, "allocations", result.value)
+        return result.value
+
+    async def deployments(self, job_id: str) -> list[DeploymentListStub]:
+        """Return the job's deployments."""
+        deployments = await self._client.jobs.deployments(job_id)
+        self._schedule.observe(job_id, "deployments", deployments)
+        return deployments
+
+    async def deployment(self, deployment_id: str) -> Deployment:
+        """Return one deployment."""
+        dep = await self._client.deployments.read(deployment_id)
+        self._schedule.observe(dep.job_id, "deployment", dep)
+        return dep
+
+    async def changed(self, job_id: str, *, deadline: float, poll: bool = False) -> None:
+        """Arm the next read to block, or sleep when there is no index to block on.
+
+        A ``poll`` request also drops the index so a read that failed part-way does not
+        spin on an index the server has already moved past.
+        """
+        if poll:
+            self._indexes[job_id] = 0
+        if not self._indexes.get(job_id):
+            await self._schedule.wait(job_id, deadline)
+            return
+        self._waits[job_id] = blocking_wait(deadline)
+
+
+class EventFeed:
+    """Wake every watcher from one shared event-stream subscription.
+
+    Subscribes to the ``Job``, ``Allocation`` and ``Deployment`` topics filtered to the
+    watched job ids, and sets a per-job signal whenever an event names that job. Reads
+    are plain GETs, issued only when a signal fires (or a bounded wait elapses, which
+    keeps the deadline and the live panel moving). If the stream is refused or drops,
+    every watcher is woken and the feed degrades to `BlockingFeed` for the rest of the
+    run. Use as an async context manager so the subscription is torn down on exit.
+    """
+
+    def __init__(self, client: NomadClient, job_ids: Iterable[str]) -> None:
+        self._client = client
+        self._signals = {job_id: asyncio.Event() for job_id in job_ids}
+        self._schedule = PollSchedule(client.config.poll_max_interval)
+        self._fallback = BlockingFeed(client, self._schedule)
+        self._live = True
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def live(self) -> bool:
+        """Whether the event stream is still delivering (False once it has fallen back)."""
+        return self._live
+
+    async def __aenter__(self) -> Self:
+        """Start the shared subscription in the background."""
+        self._task = asyncio.create_task(self._pump())
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Cancel the subscription and wait for it to close."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def allocations(self, job_id: str) -> list[AllocListStub]:
+        """Return the job's allocations."""
+        if not self._live:
+            return await self._fallback.allocations(job_id)
+        allocs = await self._client.jobs.allocations(job_id)
+        self._schedule.observe(job_id, "allocations", allocs)
+        return allocs
+
+    async def deployments(self, job_id: str) -> list[DeploymentListStub]:
+        """Return the job's deployments."""
+        return await self._fallback.deployments(job_id)
+
+    async def deployment(self, deployment_id: str) -> Deployment:
+        """Return one deployment."""
+        return await self._fallback.deployment(deployment_id)
+
+    async def changed(self, job_id: str, *, deadline: float, poll: bool = False) -> None:
+        """Wait for an event naming the job, a bounded timeout, or the stream to fail."""
+        if not self._live:
+            await self._fallback.changed(job_id, deadline=deadline, poll=poll)
+            return
+        if poll:
+            await self._schedule.wait(job_id, deadline)
+            return
+        signal = self._signals.setdefault(job_id, asyncio.Event())
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(signal.wait(), timeout=blocking_wait(deadline))
+        # Cleared after waking, not before reading: an event that lands while the caller
+        # is mid-read leaves the signal set, so the next wait returns at once.
+        signal.clear()
+
+    async def _pump(self) -> None:
+        """Route streamed events to the per-job signals until the stream ends."""
+        topics = {topic: sorted(self._signals) for topic in _EVENT_TOPICS}
+        try:
+            async for batch in self._client.events.stream(topics):
+                for event in batch.events:
+                    for key in (event.key, *event.filter_keys):
+                        if (signal := self._signals.get(key)) is not None:
+                            signal.set()
+        except NomadError as exc:
+            pp.debug(f"Event stream unavailable, falling back to blocking queries: {exc}")
+        else:
+            pp.debug("Event stream closed, falling back to blocking queries")
+        self._live = False
+        # Wake every waiter so each switches to the fallback rather than sleeping out
+        # its current wait on a stream that will never fire again.
+        for signal in self._signals.values():
+            signal.set()
+
+
+class SharedFeed:
+    """Serve every watched job from one cluster-wide poll instead of one loop per job.
+
+    Two background loops long-poll ``GET /v1/allocations`` and ``GET /v1/deployments``
+    with blocking queries, group each listing by job id, and wake only the watchers
+    whose slice changed. Each watcher's reads are answered from the latest listing, so
+    a batch of N jobs costs two outstanding requests rather than 3N per tick; the
+    deployment listing already carries health counts, so no per-deployment read is
+    needed. Both listings are filtered server-side to the watched jobs, so the rest of
+    the cluster's allocations never cross the wire. A Nomad failure does not stop a
+    loop: it re-reads on the `PollSchedule` while watchers keep the last listing, so an
+    outage only ends a watch through the watcher's own deadline. Until a listing has
+    loaded there is nothing to serve, so a failure then is raised to every watcher on
+    its next read, as a per-job poll's first read would. Use as an async context manager
+    so the loops are stopped on exit.
+    """
+
+    def __init__(self, client: NomadClient, job_ids: Iterable[str]) -> None:
+        self._client = client
+        self._signals = {job_id: asyncio.Event() for job_id in job_ids}
+        self._filter = any_equal("JobID", self._signals)
+        self._allocs: dict[str, list[AllocListStub]] = {}
+        self._deployments: dict[str, list[Deployment]] = {}
+        self._allocs_ready = asyncio.Event()
+        self._deployments_ready = asyncio.Event()
+        self._errors: dict[str, NomadError] = {}
+        self._schedule = PollSchedule(client.config.poll_max_interval)
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def __aenter__(self) -> Self:
+        """Start the allocation and deployment loops in the background."""
+        self._tasks = [
+            asyncio.create_task(
+                self._follow(
+                    "/allocations",
+                    lambda index, wait: self._client.allocations.list_indexed(
+                        index=index, wait=wait, filter_expr=self._filter
+                    ),
+                    self._allocs,
+                    self._allocs_ready,
+                )
+            ),
+            asyncio.create_task(
+                self._follow(
+                    "/deployments",
+                    lambda index, wait: self._client.deployments.list_detailed_indexed(
+                        index=index, wait=wait, filter_expr=self._filter
+                    ),
+                    self._deployments,
+                    self._deployments_ready,
+                )
+            ),
+        ]
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Cancel both loops and wait for them to stop."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def allocations(self, job_id: str) -> list[AllocListStub]:
+        """Return the job's allocations from the latest cluster-wide listing."""
+        await self._allocs_ready.wait()
+        self._raise_if_failed("/allocations")
+        return self._allocs.get(job_id, [])
+
+    async def deployments(self, job_id: str) -> list[DeploymentListStub]:
+        """Return the job's deployments from the latest cluster-wide listing."""
+        await self._deployments_ready.wait()
+        self._raise_if_failed("/deployments")
+        return [
+            DeploymentListStub(
+                id=d.id,
+                job_id=d.job_id,
+                namespace=d.namespace,
+                status=d.status,
+                status_description=d.status_description,
+                job_version=d.job_version,
+                create_index=d.create_index,
+                modify_index=d.modify_index,
+            )
+            for d in self._deployments.get(job_id, [])
+        ]
+
+    async def deployment(self, deployment_id: str) -> Deployment:
+        """Return one deployment from the listing, reading it directly if not yet listed."""
+        await self._deployments_ready.wait()
+        self._raise_if_failed("/deployments")
+        for deployments in self._deployments.values():
+            for dep in deployments:
+                if dep.id == deployment_id:
+                    return dep
+        return await self._client.deployments.read(deployment_id)
+
+    async def changed(self, job_id: str, *, deadline: float, poll: bool = False) -> None:
+        """Wait until a listing changes the job's slice, or a bounded timeout elapses."""
+        timeout = self._schedule.delay(job_id, deadline) if poll else blocking_wait(deadline)
+        signal = self._signals.setdefault(job_id, asyncio.Event())
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(signal.wait(), timeout=timeout)
+        signal.clear()
+
+    def _raise_if_failed(self, listing: str) -> None:
+        """Re-raise the failure that kept ``listing`` from ever loading."""
+        if (error := self._errors.get(listing)) is not None:
+            raise error
+
+    async def _follow[T: (AllocListStub, Deployment)](
+        self,
+        listing: str,
+        read: Callable[[int, float], Awaitable[QueryResult[list[T]]]],
+        store: dict[str, list[T]],
+        ready: asyncio.Event,
+    ) -> None:
+        """Long-poll one cluster-wide listing and publish each job's slice into ``store``."""
+        index = 0
+        while True:
+            try:
+                result = await read(index, BLOCKING_QUERY_WAIT_SECONDS)
+            except NomadDecodeError as exc:
+                # One half-written record should not fail every watcher; re-read shortly.
+                pp.debug(f"Skipping shared poll after transient decode error: {exc}")
+                index = 0
+                await self._schedule.wait(listing)
+                continue
+            except NomadError as exc:
+                pp.debug(f"Shared poll of {listing} failed, retrying: {exc}")
+                if not ready.is_set():
+                    # Nothing to serve yet: fail the waiting reads rather than hang them.
+                    self._errors[listing] = exc
+                    ready.set()
+                    for signal in self._signals.values():
+                        signal.set()
+                index = 0
+                await self._schedule.wait(listing)
+                continue
+            self._errors.pop(listing, None)
+            self._publish(result.value, store)
+            ready.set()
+            index = result.index
+            if not index:
+                # No index to block on, so the next read would return at once; pace it,
+                # backing off while the filtered listing stays the same.
+                self._schedule.observe(listing, "items", result.value)
+                await self._schedule.wait(listing)
+
+    def _publish[T: (AllocListStub, Deployment)](
+        self, items: list[T], store: dict[str, list[T]]
+    ) -> None:
+        """Group a listing by job id and wake each watched job whose slice changed."""
+        by_job: dict[str, list[T]] = defaultdict(list)
+        for item in items:
+            if item.job_id in self._signals:
+                by_job[item.job_id].append(item)
+        for job_id, signal in self._signals.items():
+            current = by_job.get(job_id, [])
+            if store.get(job_id) != current:
+                store[job_id] = current
+                self._schedule.reset(job_id)
+                signal.set()
+
+
+@contextlib.asynccontextmanager
+async def open_feed(
+    client: NomadClient, mode: WatchMode, job_ids: Iterable[str]
+) -> AsyncGenerator[JobFeed]:
+    """Open the feed for ``mode`` over ``job_ids``, closing any subscription on exit."""
+    if mode is WatchMode.EVENTS:
+        async with EventFeed(client, job_ids) as feed:
+            yield feed
+        return
+    if mode is WatchMode.SHARED:
+        async with SharedFeed(client, job_ids) as shared:
+            yield shared
+        return
+    yield BlockingFeed(client)
@@ -0,0 +1,13 @@
+"""The ``--watch-mode`` choices, kept apart from the feeds so option wiring stays light."""
+
+from __future__ import annotations
+
+import enum
+
+
+class WatchMode(enum.StrEnum):
+    """How ``run``/``stop``/``update`` follow their jobs' progress."""
+
+    BLOCKING = "blocking"
+    EVENTS = "events"
+    SHARED = "shared"
@@ -0,0 +1,61 @@
+"""The ``nd daemon`` command: keep a warm mirror of the cluster for other commands."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from pathlib import Path  # noqa: TC003
+from typing import Annotated
+
+import typer
+from nclutils import pp
+
+from nd.commands._common import VerboseOption, configure_verbosity
+from nd.daemon import default_socket_path
+from nd.daemon.server import DaemonRunningError, serve
+from nd.nomad import NomadConfig
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def daemon(
+    ctx: typer.Context,
+    socket: Annotated[
+        Path | None,
+        typer.Option("--socket", help="Listen on this Unix socket instead of the default."),
+    ] = None,
+    verbose: VerboseOption = 0,
+) -> None:
+    """Mirror cluster state in memory so status, list, logs and exec answer instantly.
+
+    Holds one connection to Nomad and keeps nodes, jobs, allocations, deployments and
+    evaluations current with blocking queries. While it runs, other nd commands using
+    the same Nomad address, namespace, region and token read from it instead of
+    querying Nomad. Runs in the foreground until interrupted.
+    """
+    configure_verbosity(ctx, verbose)
+    config = NomadConfig.resolve()
+    path = socket or default_socket_path()
+    # Ctrl-C is how a foreground daemon is stopped, not an abort worth a non-zero exit.
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_run(config, path))
+    pp.info("Daemon stopped")
+
+
+async def _run(config: NomadConfig, path: Path) -> None:
+    """Serve until interrupted, reporting where the daemon listens."""
+    ready = asyncio.Event()
+    server = asyncio.create_task(serve(config, path, ready=ready))
+    started = asyncio.create_task(ready.wait())
+    await asyncio.wait({server, started}, return_when=asyncio.FIRST_COMPLETED)
+    started.cancel()
+    if server.done():
+        try:
+            server.result()
+        except DaemonRunningError as exc:
+            pp.error(str(exc))
+            raise typer.Exit(1) from exc
+        return
+    pp.info(f"Mirroring {config.address} on {path} (Ctrl-C to stop)")
+    await server
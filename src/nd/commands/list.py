@@ -9,8 +9,9 @@ from typing import TYPE_CHECKING, Annotated
 import typer
 from nclutils import pp
 
-from nd.commands._common import VerboseOption, configure_verbosity
-from nd.jobfiles import discover_job_files, load_job_directories
+from nd.commands._common import RescanOption, VerboseOption, configure_verbosity
+from nd.daemon.client import fetch_snapshot
+from nd.jobfiles import JobFileIndex, discover_job_files, load_job_directories
 from nd.nomad import NomadClient, NomadConfig
 from nd.ui.links import WebUi
 from nd.ui.panels import status_table, titled_panel
@@ -102,19 +103,32 @@ def list_(
             help="Hide jobs that are currently running, leaving only dead and not-deployed files.",
         ),
     ] = False,
+    rescan: RescanOption = False,  # noqa: FBT002
     verbose: VerboseOption = 0,
 ) -> None:
     """List known job files and whether each is running, dead, or not deployed."""
     configure_verbosity(ctx, verbose)
-    asyncio.run(_run(hide_running=hide_running))
+    asyncio.run(_run(hide_running=hide_running, rescan=rescan))
 
 
-async def _run(*, hide_running: bool = False) -> None:
-    """Discover job files, fetch cluster jobs, and render the joined table."""
+async def _run(*, hide_running: bool = False, rescan: bool = False) -> None:
+    """Discover job files, fetch cluster jobs, and render the joined table.
+
+    Jobs come from a running ``nd daemon`` when one mirrors this cluster.
+    """
     directories = load_job_directories()
-    files = discover_job_files(directories)
+    files = discover_job_files(directories, JobFileIndex(rescan=rescan))
     pp.debug(f"Discovered {len(files)} job file(s) in {len(directories)} dir(s)")
     config = NomadConfig.resolve()
-    async with NomadClient.from_config(config) as client:
-        jobs = await client.jobs.list()
+    snapshot = await fetch_snapshot(config)
+    if snapshot is not None:
+        jobs = snapshot.jobs
+    else:
+        wanted = {name for jf in files for name in jf.job_names}
+        async with NomadClient.from_config(config) as client:
+            # Stream the listing and keep only jobs some file names, so a cluster with far
+            # more jobs than files is never held whole.
+            jobs = [
+                job async for page in client.jobs.iter_pages() for job in page if job.name in wanted
+            ]
     _render(build_rows(files, jobs, hide_running=hide_running), config.ui_base)
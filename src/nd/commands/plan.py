@@ -9,8 +9,20 @@ import typer
 from nclutils import pp
 
 from nd.binary import NomadBinary, NomadBinaryError
-from nd.commands._common import VerboseOption, configure_verbosity
-from nd.jobfiles import candidates_for, discover_job_files, load_job_directories
+from nd.commands._common import (
+    RescanOption,
+    VerboseOption,
+    WorkersOption,
+    configure_verbosity,
+)
+from nd.commands._specs import SpecPipeline
+from nd.constants import DEFAULT_SPEC_WORKERS
+from nd.jobfiles import (
+    JobFileIndex,
+    candidates_for,
+    discover_job_files,
+    load_job_directories,
+)
 from nd.nomad import NomadConfig
 from nd.targets import resolve_targets, select_candidates
 
@@ -37,18 +49,30 @@ def plan(
         bool,
         typer.Option("--dry-run", "-n", help="Resolve and report targets without planning them."),
     ] = False,
+    workers: WorkersOption = DEFAULT_SPEC_WORKERS,
+    rescan: RescanOption = False,  # noqa: FBT002
     verbose: VerboseOption = 0,
 ) -> None:
-    """Preview the changes one or more job files would apply, including to running jobs."""
+    """Preview the changes one or more job files would apply, including to running jobs.
+
+    Selected files are validated concurrently (--workers at a time), then planned one
+    after another so each plan's output stays together.
+    """
     configure_verbosity(ctx, verbose)
-    exit_code = asyncio.run(_run(job_arg=job, dry_run=dry_run))
+    exit_code = asyncio.run(_run(job_arg=job, dry_run=dry_run, workers=workers, rescan=rescan))
     if exit_code != 0:
         raise typer.Exit(exit_code)
 
 
-async def _run(*, job_arg: str | None, dry_run: bool) -> int:
+async def _run(
+    *,
+    job_arg: str | None,
+    dry_run: bool,
+    workers: int = DEFAULT_SPEC_WORKERS,
+    rescan: bool = False,
+) -> int:
     """Resolve candidates (all files), then validate + plan each selected one."""
-    files = discover_job_files(load_job_directories())
+    files = discover_job_files(load_job_directories(), JobFileIndex(rescan=rescan))
     candidates = candidates_for(files)
     if not candidates:
         pp.info("No job files found; set [jobs] directories in your nd config.")
@@ -74,12 +98,16 @@ async def _run(*, job_arg: str | None, dry_run: bool) -> int:
             pp.dryrun(f"would plan {c.name} ({c.file.path})")
         return 0
 
-    return _plan_all(targets)
+    return await _plan_all(targets, workers=workers)
 
 
-def _plan_all(targets: list[JobCandidate]) -> int:
+async def _plan_all(targets: list[JobCandidate], *, workers: int = DEFAULT_SPEC_WORKERS) -> int:
     """Validate then plan each unique file, surfacing `nomad job plan` verbatim.
 
+    Every file's validation starts at once on a bounded worker pool, so by the time
+    one plan's output has streamed the next file is usually validated. The plans
+    themselves still run one at a time, in order, so their output never interleaves.
+
     Returns 0 when every plan ran (including "changes present"); 1 if any file
     failed validation or the binary could not run.
     """
@@ -94,12 +122,17 @@ def _plan_all(targets: list[JobCandidate]) -> int:
 
     failures = 0
     # dict.fromkeys dedups while preserving order, so a multi-job file is planned once.
-    for path in dict.fromkeys(c.file.path for c in targets):
-        pp.header(f"plan: {path.name}")
-        try:
-            nomad.validate(path)
-            nomad.plan(path)
-        except NomadBinaryError as exc:
-            pp.error(str(exc))
-            failures += 1
+    paths = list(dict.fromkeys(c.file.path for c in targets))
+    async with SpecPipeline(nomad, workers=workers) as specs:
+        specs.prefetch(paths, compile_specs=False)
+        for path in paths:
+            pp.header(f"plan: {path.name}")
+            try:
+                await specs.validated(path)
+                # Run in the foreground: the plan streams straight to the terminal,
+                # while the remaining validations carry on in the pool's threads.
+                nomad.plan(path)
+            except NomadBinaryError as exc:
+                pp.error(str(exc))
+                failures += 1
     return 1 if failures else 0
@@ -13,7 +13,14 @@ import typer
 from nclutils import pp
 
 from nd.binary import NomadBinary, NomadBinaryError
-from nd.commands._common import VerboseOption, configure_verbosity
+from nd.commands._common import (
+    OutputOption,
+    RescanOption,
+    VerboseOption,
+    WatchModeOption,
+    WorkersOption,
+    configure_verbosity,
+)
 from nd.commands._orchestration import (
     confirm_jobs,
     fail_row,
@@ -23,19 +30,32 @@ from nd.commands._orchestration import (
     report_outcomes,
     warn_row,
 )
-from nd.constants import DEPLOY_TIMEOUT_SECONDS, HEALTHY_ALLOC_STATUSES, POLL_INTERVAL_SECONDS
-from nd.jobfiles import candidates_for, discover_job_files, load_job_directories
+from nd.commands._specs import SpecPipeline
+from nd.commands._watch import BlockingFeed, open_feed
+from nd.commands._watch_mode import WatchMode
+from nd.constants import DEFAULT_SPEC_WORKERS, DEPLOY_TIMEOUT_SECONDS, HEALTHY_ALLOC_STATUSES
+from nd.jobfiles import (
+    JobFileIndex,
+    candidates_for,
+    discover_job_files,
+    load_job_directories,
+)
 from nd.nomad import NomadClient, NomadConfig
 from nd.nomad.errors import NomadDecodeError, NomadError
 from nd.targets import resolve_targets, select_candidates
+from nd.tracing import span
 from nd.ui.alloc_rows import alloc_children
 from nd.ui.live_panel import PanelUpdate, run_rows
+from nd.ui.output import ProgressOutput
 from nd.ui.prompts import can_prompt
 
 if TYPE_CHECKING:
+    from nd.commands._watch import JobFeed
     from nd.jobfiles import JobCandidate
-    from nd.nomad.models.deployment import Deployment
+    from nd.nomad.models.allocation import AllocListStub
+    from nd.nomad.models.deployment import Deployment, DeploymentListStub
     from nd.ui.alloc_rows import TaskLifecycle
+    from nd.ui.live_panel import LiveChild
 
 # Deployment statuses that mean the rollout is finished, one way or the other.
 _DEPLOY_SUCCESS = "successful"
@@ -71,6 +91,18 @@ def deploy_phase(dep: Deployment) -> str:
     return f"{dep.status}: {healthy}/{desired} healthy"
 
 
+def deployment_settling(dep: Deployment | None) -> bool:
+    """Return True when a running deployment has every desired allocation healthy.
+
+    Nomad flips such a deployment to ``successful`` moments later without touching any
+    allocation, so a blocking query on the allocations would sleep through the flip.
+    The watcher polls instead while a deployment is in this state.
+    """
+    if dep is None or dep.status != "running" or not dep.task_groups:
+        return False
+    return all(tg.healthy_allocs >= tg.desired_total > 0 for tg in dep.task_groups.values())
+
+
 def task_lifecycle(body: bytes) -> TaskLifecycle:
     """Parse task lifecycle order and labels from a compiled job spec.
 
@@ -196,7 +228,7 @@ app = typer.Typer(context_settings={"allow_interspersed_args": True})
 
 
 @app.callback(invoke_without_command=True)
-def run(
+def run(  # noqa: PLR0913
     ctx: typer.Context,
     job: Annotated[
         str | None,
@@ -224,6 +256,10 @@ def run(
             "skipping the prompt.",
         ),
     ] = False,
+    watch_mode: WatchModeOption = WatchMode.BLOCKING,
+    output: OutputOption = ProgressOutput.PANEL,
+    workers: WorkersOption = DEFAULT_SPEC_WORKERS,
+    rescan: RescanOption = False,  # noqa: FBT002
     verbose: VerboseOption = 0,
 ) -> None:
     """Deploy one or more not-yet-running job files and watch them roll out.
@@ -234,20 +270,44 @@ def run(
     follow their allocations. Use --detach to register and return without watching.
     If a selected job is still present in the cluster as a dead job (stopped without
     purge), you are offered to garbage-collect it first; --clean purges without asking.
+    Use --watch-mode events to follow the rollouts on Nomad's event stream, and
+    --workers to set how many files are validated and compiled at once. Use
+    --output jsonl in CI to report progress as JSON lines instead of a live panel.
     """
-    configure_verbosity(ctx, verbose)
-    exit_code = asyncio.run(_run(job_arg=job, detach=detach, dry_run=dry_run, clean=clean))
+    configure_verbosity(ctx, verbose, quiet=output is ProgressOutput.JSONL)
+    exit_code = asyncio.run(
+        _run(
+            job_arg=job,
+            detach=detach,
+            dry_run=dry_run,
+            clean=clean,
+            watch_mode=watch_mode,
+            output=output,
+            workers=workers,
+            rescan=rescan,
+        )
+    )
     if exit_code != 0:
         raise typer.Exit(exit_code)
 
 
-async def _run(*, job_arg: str | None, detach: bool, dry_run: bool, clean: bool) -> int:  # noqa: PLR0911
+async def _run(  # noqa: PLR0913
+    *,
+    job_arg: str | None,
+    detach: bool,
+    dry_run: bool,
+    clean: bool,
+    watch_mode: WatchMode = WatchMode.BLOCKING,
+    output: ProgressOutput = ProgressOutput.PANEL,
+    workers: int = DEFAULT_SPEC_WORKERS,
+    rescan: bool = False,
+) -> int:
     """Resolve not-running candidates, validate, register, and watch the rollout.
 
     Returns the exit code: 0 on clean success, 1 on any failure. With ``detach`` the
     jobs are compiled and registered but the rollout is not watched.
     """
-    files = discover_job_files(load_job_directories())
+    files = discover_job_files(load_job_directories(), JobFileIndex(rescan=rescan))
     config = NomadConfig.resolve()
     async with NomadClient.from_config(config) as client:
         running, dead = await _cluster_job_states(client)
@@ -271,31 +331,65 @@ async def _run(*, job_arg: str | None, detach: bool, dry_run: bool, clean: bool)
 
         try:
             nomad = NomadBinary.create(config)
-            # dict.fromkeys dedups so a multi-job file is validated once.
-            for path in dict.fromkeys(c.file.path for c in targets):
-                nomad.validate(path)
         except NomadBinaryError as exc:
             pp.error(str(exc))
             return 1
 
-        dead_targets = [t for t in targets if t.name in dead]
+        async with SpecPipeline(nomad, workers=workers) as specs:
+            return await _validate_and_deploy(
+                client,
+                targets,
+                specs,
+                dead=dead,
+                detach=detach,
+                dry_run=dry_run,
+                clean=clean,
+                watch_mode=watch_mode,
+                output=output,
+            )
 
-        if dry_run:
-            _report_dry_run(targets, dead=dead, clean=clean)
-            return 0
 
-        await _maybe_purge_dead(client, dead_targets, clean=clean)
+async def _validate_and_deploy(  # noqa: PLR0913
+    client: NomadClient,
+    targets: list[JobCandidate],
+    specs: SpecPipeline,
+    *,
+    dead: set[str],
+    detach: bool,
+    dry_run: bool,
+    clean: bool,
+    watch_mode: WatchMode,
+    output: ProgressOutput = ProgressOutput.PANEL,
+) -> int:
+    """Validate every target's file, then purge leftovers, register, and watch.
 
-        if detach:
-            return await _register_detached(client, targets, nomad)
+    Every file is validated before anything is purged or registered, so one bad file
+    aborts the run without touching the cluster. Compiles start alongside the
+    validations, so each job's payload is usually ready by the time it registers.
+    """
+    paths = [c.file.path for c in targets]
+    specs.prefetch(paths, compile_specs=not dry_run)
+    try:
+        await specs.validate_all(paths)
+    except NomadBinaryError as exc:
+        pp.error(str(exc))
+        return 1
 
-        outcomes = await _deploy_all(client, targets, nomad)
+    if dry_run:
+        _report_dry_run(targets, dead=dead, clean=clean)
+        return 0
 
+    await _maybe_purge_dead(client, [t for t in targets if t.name in dead], clean=clean)
+
+    if detach:
+        return await _register_detached(client, targets, specs)
+
+    outcomes = await _deploy_all(client, targets, specs, watch_mode=watch_mode, output=output)
     return 0 if all(o.status is DeployStatus.DEPLOYED for o in outcomes) else 1
 
 
 async def _register_detached(
-    client: NomadClient, targets: list[JobCandidate], nomad: NomadBinary
+    client: NomadClient, targets: list[JobCandidate], specs: SpecPipeline
 ) -> int:
     """Compile and register every target concurrently, then return without watching.
 
@@ -307,8 +401,9 @@ async def _register_detached(
 
     async def register_one(candidate: JobCandidate) -> tuple[str, str | None, str]:
         try:
-            body = await asyncio.to_thread(nomad.compile_to_json, candidate.file.path)
-            resp = await client.jobs.register(body)
+            body = await specs.compiled(candidate.file.path)
+            with span("register", **{"nd.job": candidate.name}):
+                resp = await client.jobs.register(body)
         except (NomadBinaryError, NomadError) as exc:
             return (candidate.name, str(exc), "")
         return (candidate.name, None, resp.warnings)
@@ -326,14 +421,21 @@ async def _register_detached(
 
 
 async def _deploy_all(
-    client: NomadClient, targets: list[JobCandidate], nomad: NomadBinary
+    client: NomadClient,
+    targets: list[JobCandidate],
+    specs: SpecPipeline,
+    *,
+    watch_mode: WatchMode = WatchMode.BLOCKING,
+    output: ProgressOutput = ProgressOutput.PANEL,
 ) -> list[DeployOutcome]:
     """Register and watch every target concurrently under one live panel.
 
     Args:
         client: Authenticated Nomad client.
         targets: The job candidates to register and watch.
-        nomad: Configured `nomad` binary handle for the compile step.
+        specs: Validate/compile pipeline the job payloads are drawn from.
+        watch_mode: How the rollouts are followed; one feed is shared by every target.
+        output: Render a live panel, or write JSON-lines progress events instead.
 
     Returns:
         Ordered list of outcomes, one per target.
@@ -343,18 +445,20 @@ async def _deploy_all(
 
     async def do_work(candidate: JobCandidate, update: PanelUpdate) -> DeployOutcome:
         return await _deploy_one(
-            client, candidate, node_names=node_names, update=update, nomad=nomad
+            client, candidate, node_names=node_names, update=update, specs=specs, feed=feed
         )
 
-    ordered = await run_rows(
-        targets,
-        do_work,
-        label_of=lambda c: c.name,
-        initial_phase="registering",
-        finish_of=lambda o: _OUTCOME_ROW[o.status],
-        running_title=f"Deploying {len(targets)} job(s)",
-        final_title=_final_title,
-    )
+    async with open_feed(client, watch_mode, [c.name for c in targets]) as feed:
+        ordered = await run_rows(
+            targets,
+            do_work,
+            label_of=lambda c: c.name,
+            initial_phase="registering",
+            finish_of=lambda o: _OUTCOME_ROW[o.status],
+            running_title=f"Deploying {len(targets)} job(s)",
+            final_title=_final_title,
+            output=output,
+        )
 
     report_outcomes(
         ordered,
@@ -385,7 +489,8 @@ async def _deploy_one(
     *,
     node_names: dict[str, str],
     update: PanelUpdate,
-    nomad: NomadBinary,
+    specs: SpecPipeline,
+    feed: JobFeed | None = None,
 ) -> DeployOutcome:
     """Compile, register, and watch one job to a terminal deploy state.
 
@@ -398,19 +503,21 @@ async def _deploy_one(
         candidate: The job file and name to deploy.
         node_names: Map of node ID to node name for the per-allocation detail rows.
         update: Callback to update the live panel phase text and detail rows.
-        nomad: Configured `nomad` binary handle for the compile step.
+        specs: Validate/compile pipeline the job payload is drawn from.
+        feed: Where the rollout is watched from; see `watch_deploy`.
 
     Returns:
         The terminal outcome for this candidate.
     """
     try:
         update("compiling")
-        # compile_to_json shells out to the nomad binary (blocking); run it off the
-        # event loop so sibling deploys keep making progress concurrently.
-        body = await asyncio.to_thread(nomad.compile_to_json, candidate.file.path)
+        # The compile runs on the pipeline's worker pool (usually already finished by
+        # now), so sibling deploys keep making progress concurrently.
+        body = await specs.compiled(candidate.file.path)
         lifecycle = task_lifecycle(body)
         update("registering")
-        resp = await client.jobs.register(body)
+        with span("register", **{"nd.job": candidate.name}):
+            resp = await client.jobs.register(body)
         outcome = await watch_deploy(
             client,
             candidate.name,
@@ -418,6 +525,7 @@ async def _deploy_one(
             lifecycle=lifecycle,
             update=update,
             since_index=resp.job_modify_index,
+            feed=feed,
         )
         # Attach any register warnings so the caller can surface them after the panel closes.
         return replace(outcome, warnings=resp.warnings)
@@ -433,13 +541,18 @@ async def watch_deploy(
     lifecycle: TaskLifecycle,
     update: PanelUpdate,
     since_index: int = 0,
+    feed: JobFeed | None = None,
 ) -> DeployOutcome:
     """Poll a registered job until its deployment (or allocations) settle or time out.
 
     Service jobs expose a deployment that tracks health; batch/system jobs have no
-    deployment so alloc statuses are used instead. Either way the job's allocations
-    are fetched each tick to show where each one is placed and its status. The poll
-    loop is bounded by a wall-clock deadline to avoid hanging on a stalled cluster.
+    deployment so alloc statuses are used instead. Either way the job's allocations are
+    fetched each tick to show where each one is placed and its status. State is read
+    through ``feed`` (blocking queries unless the caller passes an event-stream feed),
+    so a tick ends as soon as the job changes rather than after a fixed sleep; a server
+    that reports no index (or a deployment about to flip to successful) falls back to
+    polling. The loop is bounded by a wall-clock deadline to avoid hanging on a stalled
+    cluster.
 
     Args:
         client: Authenticated Nomad client.
@@ -450,44 +563,73 @@ async def watch_deploy(
         since_index: The ``JobModifyIndex`` from this registration. Deployments
             created before it belong to a previous run and are ignored so a re-run
             of a dead job is not reported as instantly deployed off a stale record.
+        feed: Where to read the job's state and wait for it to change. Defaults to
+            a `BlockingFeed` over ``client``.
 
     Returns:
         The terminal deploy outcome for this job.
     """
+    feed = feed or BlockingFeed(client)
     deadline = time.monotonic() + DEPLOY_TIMEOUT_SECONDS
     while True:
-        try:
-            allocs = await client.jobs.allocations(job_id)
-            deployments = await client.jobs.deployments(job_id)
-            # The plural endpoint's ordering is undocumented, so pick this run's
-            # deployment by index rather than trusting position. A job that has ever
-            # run keeps its prior deployments listed; ignoring those created before
-            # this registration is what stops a stale "successful" record from
-            # ending the watch the instant a dead job is re-run.
-            mine = [d for d in deployments if d.create_index >= since_index]
-            latest = max(mine, key=lambda d: d.create_index) if mine else None
-            dep = await client.deployments.read(latest.id) if latest else None
-        except NomadDecodeError as exc:
-            # A freshly-placed allocation can momentarily serialize in a shape we
-            # cannot decode (e.g. TaskStates: null before its tasks start). Skip
-            # this tick and retry rather than failing an otherwise-healthy deploy;
-            # the deadline below is the backstop if it never recovers.
-            pp.debug(f"{job_id}: skipping poll after transient decode error: {exc}")
-        else:
-            children = alloc_children(allocs, node_names, lifecycle)
-            if dep is not None:  # service job: follow this run's deployment
-                if dep.status == _DEPLOY_SUCCESS:
-                    return DeployOutcome(job_id, DeployStatus.DEPLOYED)
-                if dep.status in _DEPLOY_FAILURE:
-                    return DeployOutcome(job_id, DeployStatus.FAILED, dep.status_description)
-                update(deploy_phase(dep), children)
-            elif deployments:  # service job whose new deployment has not appeared yet
-                update("registering", children)
-            else:  # batch/system job: follow allocations
-                running = sum(1 for a in allocs if a.client_status in HEALTHY_ALLOC_STATUSES)
-                if allocs and running == len(allocs):
-                    return DeployOutcome(job_id, DeployStatus.DEPLOYED)
-                update(f"placing {running}/{len(allocs) or '?'} allocs", children)
+        poll = False
+        with span("watch tick", **{"nd.job": job_id}):
+            try:
+                allocs = await feed.allocations(job_id)
+                deployments = await feed.deployments(job_id)
+                # The plural endpoint's ordering is undocumented, so pick this run's
+                # deployment by index rather than trusting position. A job that has ever
+                # run keeps its prior deployments listed; ignoring those created before
+                # this registration is what stops a stale "successful" record from
+                # ending the watch the instant a dead job is re-run.
+                mine = [d for d in deployments if d.create_index >= since_index]
+                latest = max(mine, key=lambda d: d.create_index) if mine else None
+                dep = await feed.deployment(latest.id) if latest else None
+            except NomadDecodeError as exc:
+                # A freshly-placed allocation can momentarily serialize in a shape we
+                # cannot decode (e.g. TaskStates: null before its tasks start). Skip
+                # this tick and retry rather than failing an otherwise-healthy deploy;
+                # the deadline below is the backstop if it never recovers. Polling
+                # paces the retry rather than spinning in a tight loop.
+                pp.debug(f"{job_id}: skipping poll after transient decode error: {exc}")
+                poll = True
+            else:
+                children = alloc_children(allocs, node_names, lifecycle)
+                outcome = _judge_tick(job_id, allocs, deployments, dep, children, update)
+                if outcome is not None:
+                    return outcome
+                # A deployment about to flip to successful changes no allocation, so a
+                # feed waiting on allocation changes would sit out its whole wait; poll.
+                poll = deployment_settling(dep)
         if time.monotonic() >= deadline:
             return DeployOutcome(job_id, DeployStatus.TIMEOUT, "deploy still in progress")
-        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        await feed.changed(job_id, deadline=deadline, poll=poll)
+
+
+def _judge_tick(
+    job_id: str,
+    allocs: list[AllocListStub],
+    deployments: list[DeploymentListStub],
+    dep: Deployment | None,
+    children: list[LiveChild],
+    update: PanelUpdate,
+) -> DeployOutcome | None:
+    """Judge one watch tick, returning the terminal outcome or None to keep watching.
+
+    Service jobs follow this run's deployment; batch/system jobs (no deployment at
+    all) follow their allocations. A non-terminal tick refreshes the live row.
+    """
+    if dep is not None:  # service job: follow this run's deployment
+        if dep.status == _DEPLOY_SUCCESS:
+            return DeployOutcome(job_id, DeployStatus.DEPLOYED)
+        if dep.status in _DEPLOY_FAILURE:
+            return DeployOutcome(job_id, DeployStatus.FAILED, dep.status_description)
+        update(deploy_phase(dep), children)
+    elif deployments:  # service job whose new deployment has not appeared yet
+        update("registering", children)
+    else:  # batch/system job: follow allocations
+        running = sum(1 for a in allocs if a.client_status in HEALTHY_ALLOC_STATUSES)
+        if allocs and running == len(allocs):
+            return DeployOutcome(job_id, DeployStatus.DEPLOYED)
+        update(f"placing {running}/{len(allocs) or '?'} allocs", children)
+    return None
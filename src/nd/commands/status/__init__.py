@@ -1,34 +1,43 @@
 """The ``nd status`` command: an at-a-glance Nomad cluster overview.
 
-Split into pure aggregation (`report`), Rich rendering (`render`), and Typer
-wiring plus async collection (`command`); this module re-exports the public surface.
+Split into pure aggregation (`report`), Rich rendering (`render`), the live ``--watch``
+loop (`watch`), and Typer wiring plus async collection (`command`); this module
+re-exports the public surface.
 """
 
 from nd.commands.status.command import _collect, app, status
-from nd.commands.status.render import render_hosts, render_report
+from nd.commands.status.render import hosts_view, render_hosts, render_report, report_view
 from nd.commands.status.report import (
     Health,
     HostPanel,
     NodeRow,
+    ReportBuilder,
     ServerInfo,
     StatusReport,
     build_host_report,
     build_report,
+    build_status,
     correlate_nodes,
 )
+from nd.commands.status.watch import watch_status
 
 __all__ = [
     "Health",
     "HostPanel",
     "NodeRow",
+    "ReportBuilder",
     "ServerInfo",
     "StatusReport",
     "_collect",
     "app",
     "build_host_report",
     "build_report",
+    "build_status",
     "correlate_nodes",
+    "hosts_view",
     "render_hosts",
     "render_report",
+    "report_view",
     "status",
+    "watch_status",
 ]
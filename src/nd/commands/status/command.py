@@ -11,11 +11,17 @@ from nclutils import pp
 
 from nd.commands._common import VerboseOption, configure_verbosity, record_step
 from nd.commands.status.render import render_hosts, render_report
-from nd.commands.status.report import build_host_report, build_report
+from nd.commands.status.report import AllocTally, build_status
+from nd.commands.status.watch import watch_status
+from nd.daemon.client import fetch_snapshot
+from nd.daemon.protocol import Snapshot
 from nd.nomad import NomadClient, NomadConfig, NomadError
+from nd.nomad.filters import LIVE_EVALS_FILTER
+from nd.tracing import span
 
 if TYPE_CHECKING:
     from nd.commands.status.report import HostPanel, StatusReport
+    from nd.nomad.models.allocation import AllocListStub
 
 
 app = typer.Typer()
@@ -44,25 +50,44 @@ def status(
             "--hosts", help="Pivot the dashboard to one panel per host (jobs, status, uptime)."
         ),
     ] = False,
+    watch: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--watch", "-w", help="Keep the dashboard open, redrawing it as the cluster changes."
+        ),
+    ] = False,
 ) -> None:
     """Show an at-a-glance overview of the Nomad cluster."""
     verbose = configure_verbosity(ctx, verbose)
-    report, host_panels = asyncio.run(_collect(verbose=verbose))
+    if watch:
+        # Ctrl-C is how a watch ends, not an abort worth a non-zero exit.
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(watch_status(NomadConfig.resolve(), hosts=hosts))
+        return
+    report, host_panels = asyncio.run(_collect(verbose=verbose, hosts=hosts))
     if verbose:  # separate the progress tree from the dashboard
         pp.console().print()
-    if hosts:
-        render_hosts(report, host_panels)
-    else:
-        render_report(report)
+    with span("render"):
+        if hosts:
+            render_hosts(report, host_panels)
+        else:
+            render_report(report)
 
 
-async def _collect(*, verbose: int) -> tuple[StatusReport, list[HostPanel]]:
+async def _collect(*, verbose: int, hosts: bool = True) -> tuple[StatusReport, list[HostPanel]]:
     """Fetch all cluster endpoints concurrently and build the report and host panels.
 
-    Both views share one fetch: the default dashboard consumes the `StatusReport`, and
-    ``--hosts`` consumes the per-host panels. The default view is silent; ``-v`` shows a
-    `pp.step` tree of the requests we make, and ``-vv`` adds each response's item count
-    and elapsed time.
+    Both views share one fetch and one pass over the allocations: the default dashboard
+    consumes the `StatusReport`, and ``--hosts`` also consumes the per-host panels. The
+    default view is silent; ``-v`` shows a `pp.step` tree of the requests we make, and
+    ``-vv`` adds each response's item count and elapsed time.
+
+    Nomad drops terminal evaluations server-side, since no check reads them. Only the
+    host panels read task states (for their uptimes), so without ``hosts`` neither the
+    task states are fetched nor the panels built, and the panels come back empty.
+
+    When an ``nd daemon`` mirrors the same cluster, its snapshot is used instead and no
+    request reaches Nomad.
     """
     config = NomadConfig.resolve()
     pp.debug(
@@ -73,6 +98,45 @@ async def _collect(*, verbose: int) -> tuple[StatusReport, list[HostPanel]]:
             f"namespace={config.namespace}",
         ],
     )
+    allocs: list[AllocListStub] | AllocTally
+    if (snapshot := await fetch_snapshot(config)) is not None:
+        allocs = snapshot.allocations
+    else:
+        snapshot, allocs = await _fetch(config, verbose=verbose, task_states=hosts)
+    return build_status(
+        nodes=snapshot.nodes,
+        jobs=snapshot.jobs,
+        allocs=allocs,
+        config=config,
+        members=snapshot.members,
+        leader=snapshot.leader,
+        deployments=snapshot.deployments,
+        evals=snapshot.evaluations,
+        volumes=snapshot.volumes,
+        hosts=hosts,
+    )
+
+
+async def _tally_pages(client: NomadClient, *, task_states: bool) -> AllocTally:
+    """Tally the allocation listing page by page as it streams in.
+
+    Each page is folded into the tally while the next one is in flight, and only the
+    allocations a host panel lists outlive their page.
+    """
+    tally = AllocTally()
+    async for page in client.allocations.iter_pages(task_states=task_states):
+        tally.add(page)
+    return tally
+
+
+async def _fetch(
+    config: NomadConfig, *, verbose: int, task_states: bool
+) -> tuple[Snapshot, AllocTally]:
+    """Query every endpoint the dashboard reads concurrently, as a daemon would mirror them.
+
+    The allocation listing, by far the longest, is tallied as its pages arrive rather
+    than kept, so the returned snapshot carries no allocations; they are in the tally.
+    """
     async with NomadClient.from_config(config) as client:
         step_cm: contextlib.AbstractContextManager[Any] = (
             pp.step("Querying Nomad cluster") if verbose else contextlib.nullcontext(None)
@@ -96,23 +160,21 @@ async def _collect(*, verbose: int) -> tuple[StatusReport, list[HostPanel]]:
             ) = await asyncio.gather(
                 fetch("/nodes", client.nodes.list()),
                 fetch("/jobs", client.jobs.list()),
-                fetch("/allocations", client.allocations.list()),
+                fetch("/allocations", _tally_pages(client, task_states=task_states)),
                 fetch("/agent/members", client.agent.members()),
                 fetch("/status/leader", client.status.leader()),
                 fetch("/deployments", client.deployments.list()),
-                fetch("/evaluations", client.evaluations.list()),
+                fetch("/evaluations", client.evaluations.list(filter_expr=LIVE_EVALS_FILTER)),
                 fetch("/volumes", _safe_volumes(client)),
             )
-    report = build_report(
+    snapshot = Snapshot(
         nodes=nodes,
         jobs=jobs,
-        allocs=allocs,
-        config=config,
-        members=members,
-        leader=leader,
+        allocations=[],
         deployments=deployments,
-        evals=evals,
+        evaluations=evals,
         volumes=volumes,
+        members=members,
+        leader=leader,
     )
-    host_panels = build_host_report(nodes=nodes, jobs=jobs, allocs=allocs)
-    return report, host_panels
+    return snapshot, allocs
@@ -32,33 +32,46 @@ _HEALTH_STYLE: dict[Health, str] = {
 
 def render_report(report: StatusReport) -> None:
     """Print the status report as a banner followed by the cluster panels."""
+    pp.console().print(report_view(report))
+
+
+def render_hosts(report: StatusReport, host_panels: list[HostPanel]) -> None:
+    """Print the host-focused dashboard: banner, one panel per host, then activity."""
     console = pp.console()
-    console.print(_banner(report))
-    console.print(_nodes_panel(report))
-    console.print(_jobs_panel(report))
-    console.print(_volumes_panel(report))
+    console.print(hosts_view(report, host_panels, console.width))
+
+
+def report_view(report: StatusReport) -> Group:
+    """Build the default dashboard: the banner followed by the cluster panels."""
+    parts: list[RenderableType] = [
+        _banner(report),
+        _nodes_panel(report),
+        _jobs_panel(report),
+        _volumes_panel(report),
+    ]
     if report.deployments_active or report.evals_problem:
-        console.print(_activity_panel(report))
+        parts.append(_activity_panel(report))
+    return Group(*parts)
 
 
-def render_hosts(report: StatusReport, host_panels: list[HostPanel]) -> None:
-    """Print the host-focused dashboard: banner, one panel per host, then activity.
+def hosts_view(report: StatusReport, host_panels: list[HostPanel], width: int) -> Group:
+    """Build the host-focused dashboard for a terminal ``width`` columns wide.
 
     The banner is identical to the default view; the per-resource panels are replaced by
     a panel per client node (laid out in two columns on wide terminals), and the Activity
     panel still trails when there is in-progress work.
     """
-    console = pp.console()
-    console.print(_banner(report))
+    parts: list[RenderableType] = [_banner(report)]
     if host_panels:
         now_s = time.time()
         web = WebUi(report.ui_url)
         panels = [_host_panel(host, web, now_s) for host in host_panels]
-        console.print(_host_grid(panels, console.width))
+        parts.append(_host_grid(panels, width))
     else:
-        console.print(titled_panel("[dim]No client nodes[/]", "Hosts", expand=True))
+        parts.append(titled_panel("[dim]No client nodes[/]", "Hosts", expand=True))
     if report.deployments_active or report.evals_problem:
-        console.print(_activity_panel(report))
+        parts.append(_activity_panel(report))
+    return Group(*parts)
 
 
 def _host_styles(host: HostPanel) -> tuple[str, str]:
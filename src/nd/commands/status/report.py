@@ -8,13 +8,19 @@ from __future__ import annotations
 
 import enum
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
-from nd.constants import FAILED_ALLOC_STATUSES, HEALTHY_ALLOC_STATUSES
+from nd.constants import (
+    FAILED_ALLOC_STATUSES,
+    HEALTHY_ALLOC_STATUSES,
+    TERMINAL_EVAL_STATUSES,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from nd.nomad.config import NomadConfig
     from nd.nomad.models.agent import AgentMember
     from nd.nomad.models.allocation import AllocListStub
@@ -33,12 +39,19 @@ _RETIRED_DESIRED_STATUSES = frozenset({"stop", "evict"})
 _ACTIVE_DEPLOYMENT_STATUSES = frozenset({"running", "pending", "blocked", "paused", "unblocking"})
 # Evaluation statuses that indicate the scheduler is stuck.
 _PROBLEM_EVAL_STATUSES = frozenset({"blocked", "pending"})
-# Terminal evaluation statuses whose queued-allocation counts are historical, not live.
-_TERMINAL_EVAL_STATUSES = frozenset({"complete", "canceled", "cancelled", "failed"})
 
 _EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
 
+class _Identified(Protocol):
+    """A listing item keyed by its Nomad ID."""
+
+    @property
+    def id(self) -> str:
+        """The item's ID."""
+        ...
+
+
 def _rfc3339_to_ns(value: str) -> int:
     """Convert an RFC3339 timestamp to unix nanoseconds, or 0 when it is unusable.
 
@@ -188,46 +201,165 @@ def build_report(  # noqa: PLR0913
     Lists are sorted alphabetically by name. Kept free of I/O and Rich so the
     aggregation logic is unit-testable on its own.
     """
-    nodes = sorted(nodes, key=lambda n: n.name)
-    jobs = sorted(jobs, key=lambda j: j.name)
-    servers = sorted(_build_servers(members or [], leader or ""), key=lambda s: s.name)
-    leader_name = next((s.name for s in servers if s.is_leader), None)
-
-    deployments_active = sorted(
-        (d for d in (deployments or []) if d.status in _ACTIVE_DEPLOYMENT_STATUSES),
-        key=lambda d: d.job_id,
-    )
-    evals_problem = sorted(
-        (e for e in (evals or []) if _is_problem_eval(e)),
-        key=lambda e: e.job_id,
+    return _assemble_report(
+        nodes=nodes,
+        jobs=jobs,
+        tally=_tally_allocs(allocs),
+        config=config,
+        members=members or [],
+        leader=leader or "",
+        deployments=deployments or [],
+        evals=evals or [],
+        volumes=volumes or [],
     )
 
-    # Only allocs Nomad still wants running reflect current health, so drop the ones it has
-    # intentionally retired (desired_status stop/evict). A failed corpse that was rescheduled
-    # keeps desired_status "run" and survives this filter; it is instead excluded per-check via
-    # _is_replaced, whose next_allocation points at the now-live replacement.
-    live_allocs = [a for a in allocs if a.desired_status not in _RETIRED_DESIRED_STATUSES]
-    allocs_failed = sum(
-        1 for a in live_allocs if a.client_status == "failed" and not _is_replaced(a)
-    )
-    allocs_pending = sum(1 for a in live_allocs if a.client_status == "pending")
-    allocs_unhealthy = any(
-        a.client_status not in HEALTHY_ALLOC_STATUSES and not _is_replaced(a) for a in live_allocs
-    )
-    node_alloc_counts = Counter(
-        a.node_id for a in allocs if a.client_status in _ACTIVE_ALLOC_STATUSES
+
+def build_status(  # noqa: PLR0913
+    *,
+    nodes: list[NodeListStub],
+    jobs: list[JobListStub],
+    allocs: list[AllocListStub] | AllocTally,
+    config: NomadConfig,
+    members: list[AgentMember] | None = None,
+    leader: str | None = None,
+    deployments: list[DeploymentListStub] | None = None,
+    evals: list[EvalListStub] | None = None,
+    volumes: list[HostVolumeListStub] | None = None,
+    hosts: bool = True,
+) -> tuple[StatusReport, list[HostPanel]]:
+    """Compute the `StatusReport` and the ``--hosts`` panels from one pass over ``allocs``.
+
+    Equal to calling `build_report` and `build_host_report`, but the allocation listing,
+    by far the longest on a cluster that retains its history, is walked once for both.
+    ``allocs`` may also be an `AllocTally` already fed page by page as the listing
+    streamed in. ``hosts=False`` returns no panels, skipping the per-allocation uptime
+    they need.
+    """
+    tally = allocs if isinstance(allocs, AllocTally) else _tally_allocs(allocs)
+    report = _assemble_report(
+        nodes=nodes,
+        jobs=jobs,
+        tally=tally,
+        config=config,
+        members=members or [],
+        leader=leader or "",
+        deployments=deployments or [],
+        evals=evals or [],
+        volumes=volumes or [],
     )
-    job_nodes = _job_node_names(allocs, nodes)
-    job_statuses = _job_display_statuses(jobs, live_allocs)
-    volume_rows = _build_volume_rows(volumes or [], nodes)
+    if not hosts:
+        return report, []
+    return report, _host_panels(report.nodes, jobs, tally.host_allocs)
+
+
+@dataclass
+class AllocTally:
+    """Everything the report and host panels read from the allocation listing.
+
+    Filled in one pass by `add`, which takes the listing whole or a page at a time as it
+    streams in, so only the allocations a host panel lists are ever held.
+    """
+
+    total: int = 0
+    running: int = 0
+    failed: int = 0
+    pending: int = 0
+    unhealthy: bool = False
+    # active allocs per node id
+    node_counts: dict[str, int] = field(default_factory=dict)
+    # node ids an active alloc of the job runs on
+    job_node_ids: dict[str, set[str]] = field(default_factory=dict)
+    # jobs with an unreplaced failed/lost alloc Nomad wants running
+    degraded_jobs: set[str] = field(default_factory=set)
+    # the allocs each node's host panel lists
+    host_allocs: dict[str, list[AllocListStub]] = field(default_factory=dict)
+
+    def add(self, allocs: Iterable[AllocListStub]) -> None:
+        """Fold ``allocs`` into the tally.
+
+        Running/pending allocs count toward placement (per node and per job) whatever
+        Nomad intends for them. Everything else only counts allocs Nomad still wants
+        running: the ones it has retired (desired_status stop/evict) have a historical
+        client_status. A failed corpse that was rescheduled keeps desired_status "run", so
+        health, the failed count, degraded jobs and host panels also skip replaced allocs
+        (see `_is_replaced`).
+        """
+        total, running, failed, pending = self.total, self.running, self.failed, self.pending
+        unhealthy = self.unhealthy
+        node_counts = self.node_counts
+        job_node_ids = self.job_node_ids
+        degraded_jobs = self.degraded_jobs
+        host_allocs = self.host_allocs
+        # The hot path of `nd status` on a large cluster, so it works on locals and builds
+        # no throwaway defaults per allocation (as setdefault would).
+        for alloc in allocs:
+            total += 1
+            status = alloc.client_status
+            node_id = alloc.node_id
+            active = status in _ACTIVE_ALLOC_STATUSES
+            if active:
+                running += status == "running"
+                node_counts[node_id] = node_counts.get(node_id, 0) + 1
+                if (placed := job_node_ids.get(alloc.job_id)) is None:
+                    job_node_ids[alloc.job_id] = {node_id}
+                else:
+                    placed.add(node_id)
+            if alloc.desired_status in _RETIRED_DESIRED_STATUSES:
+                continue
+            pending += status == "pending"
+            if alloc.next_allocation:  # replaced; `_is_replaced` inlined for speed
+                continue
+            unhealthy |= status not in HEALTHY_ALLOC_STATUSES
+            broken = status in FAILED_ALLOC_STATUSES
+            if broken:
+                failed += status == "failed"
+                degraded_jobs.add(alloc.job_id)
+            elif not active:
+                continue
+            if (hosted := host_allocs.get(node_id)) is None:
+                host_allocs[node_id] = [alloc]
+            else:
+                hosted.append(alloc)
+        self.total, self.running, self.failed, self.pending = total, running, failed, pending
+        self.unhealthy = unhealthy
+
+
+def _tally_allocs(allocs: Iterable[AllocListStub]) -> AllocTally:
+    """Tally a whole allocation listing in a single pass."""
+    tally = AllocTally()
+    tally.add(allocs)
+    return tally
+
+
+def _assemble_report(  # noqa: PLR0913
+    *,
+    nodes: list[NodeListStub],
+    jobs: list[JobListStub],
+    tally: AllocTally,
+    config: NomadConfig,
+    members: list[AgentMember],
+    leader: str,
+    deployments: list[DeploymentListStub],
+    evals: list[EvalListStub],
+    volumes: list[HostVolumeListStub],
+) -> StatusReport:
+    """Build the `StatusReport` around an allocation tally."""
+    nodes = sorted(nodes, key=lambda n: n.name)
+    jobs = sorted(jobs, key=lambda j: j.name)
+    servers = _sorted_servers(members, leader)
+    leader_name = next((s.name for s in servers if s.is_leader), None)
+    evals_problem = _problem_evals(evals)
+    job_statuses = _job_display_statuses(jobs, tally.degraded_jobs)
+    volume_rows = _build_volume_rows(volumes, nodes)
 
     return StatusReport(
         health=_assess_health(
-            nodes=nodes,
-            jobs=jobs,
+            nodes_down=any(n.status == "down" for n in nodes),
+            nodes_degraded=any(_is_degraded_node(n) for n in nodes),
+            jobs_degraded=any(j.status != "running" for j in jobs),
             servers=servers,
             leader_name=leader_name,
-            allocs_unhealthy=allocs_unhealthy,
+            allocs_unhealthy=tally.unhealthy,
             evals_problem=evals_problem,
         ),
         address=config.address,
@@ -245,19 +377,398 @@ def build_report(  # noqa: PLR0913
         jobs_total=len(jobs),
         jobs_running=sum(1 for j in jobs if job_statuses[j.id] == "running"),
         job_statuses=job_statuses,
-        allocs_total=len(allocs),
-        allocs_running=sum(1 for a in allocs if a.client_status == "running"),
-        allocs_failed=allocs_failed,
-        allocs_pending=allocs_pending,
-        node_alloc_counts=node_alloc_counts,
-        job_nodes=job_nodes,
-        deployments_active=deployments_active,
+        allocs_total=tally.total,
+        allocs_running=tally.running,
+        allocs_failed=tally.failed,
+        allocs_pending=tally.pending,
+        node_alloc_counts=tally.node_counts,
+        job_nodes=_job_node_names(tally.job_node_ids, nodes),
+        deployments_active=_active_deployments(deployments),
         evals_problem=evals_problem,
         volume_rows=volume_rows,
         volumes_total=len(volume_rows),
     )
 
 
+class ReportBuilder:
+    """Keep a `StatusReport` and its host panels current under node, job and alloc deltas.
+
+    Every allocation, job and node adds its contribution to running counters (status
+    counts, per-node and per-job placement, unreplaced failures per job, host panel rows)
+    when it arrives and takes it back when it changes or goes, so applying a delta costs
+    time proportional to the delta rather than to the cluster. `report` and
+    `host_panels` then rebuild only the outputs a delta touched; an output that did not
+    change is the same object as last time. Results equal `build_report` and
+    `build_host_report` over the same listings.
+
+    Feed it deltas through `apply_nodes`, `apply_jobs` and `apply_allocs`, or whole
+    listings through `update`, which diffs them against what it holds.
+    """
+
+    def __init__(self, config: NomadConfig) -> None:
+        self._config = config
+        self._nodes: dict[str, NodeListStub] = {}
+        self._jobs: dict[str, JobListStub] = {}
+        self._allocs: dict[str, AllocListStub] = {}
+        self._listings: dict[str, object] = {}
+
+        # Node and job contributions.
+        self._nodes_ready = 0
+        self._nodes_down = 0
+        self._nodes_degraded = 0
+        self._jobs_not_running = 0
+        self._job_statuses: dict[str, str] = {}
+        self._status_counts: Counter[str] = Counter()
+
+        # Allocation contributions.
+        self._allocs_running = 0
+        self._allocs_failed = 0
+        self._allocs_pending = 0
+        self._allocs_unhealthy = 0
+        self._node_allocs: Counter[str] = Counter()
+        self._job_failures: Counter[str] = Counter()
+        self._job_placements: dict[str, Counter[str]] = {}
+        self._host_allocs: dict[str, dict[str, AllocListStub]] = {}
+        self._job_hosts: dict[str, Counter[str]] = {}
+
+        # The unordered listings (members, leader, deployments, evals, volumes) and
+        # the outputs built from them.
+        self._servers: list[ServerInfo] = []
+        self._deployments_active: list[DeploymentListStub] = []
+        self._evals_problem: list[EvalListStub] = []
+        self._volumes: list[HostVolumeListStub] = []
+        self._volume_rows: list[VolumeStatusRow] = []
+
+        # Outputs handed out by `report` and `host_panels`, rebuilt only when marked
+        # stale; a handed-out object is never mutated afterwards.
+        self._sorted_nodes: list[NodeListStub] | None = []
+        self._sorted_jobs: list[JobListStub] | None = []
+        self._statuses_out: dict[str, str] | None = {}
+        self._node_allocs_out: Counter[str] | None = Counter()
+        self._job_nodes: dict[str, list[str]] = {}
+        self._job_nodes_out: dict[str, list[str]] | None = {}
+        self._stale_job_nodes: set[str] = set()
+        self._panels: dict[str, HostPanel] = {}
+        self._panels_out: list[HostPanel] | None = []
+        self._stale_panels: set[str] = set()
+        self._volume_rows_stale = False
+
+    def update(  # noqa: PLR0913
+        self,
+        *,
+        nodes: list[NodeListStub],
+        jobs: list[JobListStub],
+        allocs: list[AllocListStub],
+        members: list[AgentMember],
+        leader: str,
+        deployments: list[DeploymentListStub],
+        evals: list[EvalListStub],
+        volumes: list[HostVolumeListStub],
+    ) -> None:
+        """Bring the builder to these complete listings.
+
+        A listing that is the same object as the previous call's is skipped outright, as
+        `nd.daemon.ClusterMirror` keeps unchanged listings; any other is diffed by ID
+        and applied as a delta.
+        """
+        if self._is_new("nodes", nodes):
+            self.apply_nodes(*_diff(self._nodes, nodes))
+        if self._is_new("jobs", jobs):
+            self.apply_jobs(*_diff(self._jobs, jobs))
+        if self._is_new("allocs", allocs):
+            self.apply_allocs(*_diff(self._allocs, allocs))
+        if self._is_new("members", members) | self._is_new("leader", leader):
+            self._servers = _sorted_servers(members, leader)
+        if self._is_new("deployments", deployments):
+            self._deployments_active = _active_deployments(deployments)
+        if self._is_new("evals", evals):
+            self._evals_problem = _problem_evals(evals)
+        if self._is_new("volumes", volumes):
+            self._volumes = volumes
+            self._volume_rows_stale = True
+
+    def apply_nodes(
+        self, upserted: Iterable[NodeListStub] = (), removed: Iterable[str] = ()
+    ) -> None:
+        """Add or replace the ``upserted`` nodes and drop the nodes with ``removed`` IDs."""
+        for node in upserted:
+            self._swap_node(node.id, node)
+        for node_id in removed:
+            self._swap_node(node_id, None)
+
+    def apply_jobs(self, upserted: Iterable[JobListStub] = (), removed: Iterable[str] = ()) -> None:
+        """Add or replace the ``upserted`` jobs and drop the jobs with ``removed`` IDs."""
+        for job in upserted:
+            self._swap_job(job.id, job)
+        for job_id in removed:
+            self._swap_job(job_id, None)
+
+    def apply_allocs(
+        self, upserted: Iterable[AllocListStub] = (), removed: Iterable[str] = ()
+    ) -> None:
+        """Add or replace the ``upserted`` allocations and drop those with ``removed`` IDs."""
+        for alloc in upserted:
+            if (old := self._allocs.get(alloc.id)) is not None:
+                self._count_alloc(old, -1)
+            self._allocs[alloc.id] = alloc
+            self._count_alloc(alloc, 1)
+        for alloc_id in removed:
+            if (old := self._allocs.pop(alloc_id, None)) is not None:
+                self._count_alloc(old, -1)
+
+    def report(self) -> StatusReport:
+        """Return the `StatusReport` for everything applied so far."""
+        nodes = self._nodes_sorted()
+        jobs = self._jobs_sorted()
+        servers = self._servers
+        leader_name = next((s.name for s in servers if s.is_leader), None)
+        if self._volume_rows_stale:
+            self._volume_rows = _build_volume_rows(self._volumes, nodes)
+            self._volume_rows_stale = False
+        return StatusReport(
+            health=_assess_health(
+                nodes_down=self._nodes_down > 0,
+                nodes_degraded=self._nodes_degraded > 0,
+                jobs_degraded=self._jobs_not_running > 0,
+                servers=servers,
+                leader_name=leader_name,
+                allocs_unhealthy=self._allocs_unhealthy > 0,
+                evals_problem=self._evals_problem,
+            ),
+            address=self._config.address,
+            ui_url=self._config.ui_base,
+            region=self._config.region,
+            namespace=self._config.namespace,
+            servers=servers,
+            servers_alive=sum(1 for s in servers if s.status == "alive"),
+            servers_total=len(servers),
+            leader_name=leader_name,
+            nodes=nodes,
+            nodes_ready=self._nodes_ready,
+            nodes_total=len(nodes),
+            jobs=jobs,
+            jobs_total=len(jobs),
+            jobs_running=self._status_counts["running"],
+            job_statuses=self._statuses_sorted(jobs),
+            allocs_total=len(self._allocs),
+            allocs_running=self._allocs_running,
+            allocs_failed=self._allocs_failed,
+            allocs_pending=self._allocs_pending,
+            node_alloc_counts=self._node_alloc_counts(),
+            job_nodes=self._job_node_names(),
+            deployments_active=self._deployments_active,
+            evals_problem=self._evals_problem,
+            volume_rows=self._volume_rows,
+            volumes_total=len(self._volume_rows),
+        )
+
+    def host_panels(self) -> list[HostPanel]:
+        """Return the ``--hosts`` panels for everything applied so far."""
+        for node_id in self._stale_panels:
+            if (node := self._nodes.get(node_id)) is None:
+                self._panels.pop(node_id, None)
+                continue
+            rows = (
+                _host_job_row(alloc, self._jobs.get(alloc.job_id))
+                for alloc in self._host_allocs.get(node_id, {}).values()
+            )
+            self._panels[node_id] = _host_panel(node, rows)
+        if self._stale_panels or self._panels_out is None:
+            self._stale_panels.clear()
+            self._panels_out = [self._panels[n.id] for n in self._nodes_sorted()]
+        return self._panels_out
+
+    def _is_new(self, name: str, listing: object) -> bool:
+        """Record ``listing`` under ``name``; return False when it is the one held."""
+        if self._listings.get(name, _MISSING) is listing:
+            return False
+        self._listings[name] = listing
+        return True
+
+    def _swap_node(self, node_id: str, new: NodeListStub | None) -> None:
+        """Replace a node's contribution with ``new``'s, or drop it when ``new`` is None."""
+        old = self._nodes.get(node_id)
+        if old is None and new is None:
+            return
+        for node, sign in ((old, -1), (new, 1)):
+            if node is not None:
+                self._nodes_ready += sign * (node.status == "ready")
+                self._nodes_down += sign * (node.status == "down")
+                self._nodes_degraded += sign * _is_degraded_node(node)
+        if new is None:
+            del self._nodes[node_id]
+        else:
+            self._nodes[node_id] = new
+        self._sorted_nodes = None
+        self._stale_panels.add(node_id)
+        if old is None or new is None or old.name != new.name:
+            # Node names are resolved into the placement column and the volume rows.
+            self._stale_job_nodes.update(self._job_placements)
+            self._volume_rows_stale = True
+
+    def _swap_job(self, job_id: str, new: JobListStub | None) -> None:
+        """Replace a job's contribution with ``new``'s, or drop it when ``new`` is None."""
+        old = self._jobs.get(job_id)
+        if old is None and new is None:
+            return
+        for job, sign in ((old, -1), (new, 1)):
+            if job is not None:
+                self._jobs_not_running += sign * (job.status != "running")
+        if new is None:
+            del self._jobs[job_id]
+        else:
+            self._jobs[job_id] = new
+        # The status map follows job order, which a rename or a new job can change.
+        self._sorted_jobs = None
+        self._statuses_out = None
+        self._restatus(job_id)
+        # Host panel rows show the job's name and type.
+        self._stale_panels.update(self._job_hosts.get(job_id, ()))
+
+    def _count_alloc(self, alloc: AllocListStub, sign: int) -> None:
+        """Add (``sign`` 1) or take back (``sign`` -1) one allocation's contribution."""
+        status = alloc.client_status
+        live = alloc.desired_status not in _RETIRED_DESIRED_STATUSES
+        if status == "running":
+            self._allocs_running += sign
+        if live and status == "pending":
+            self._allocs_pending += sign
+        if live and not _is_replaced(alloc):
+            self._allocs_failed += sign * (status == "failed")
+            self._allocs_unhealthy += sign * (status not in HEALTHY_ALLOC_STATUSES)
+            if status in FAILED_ALLOC_STATUSES and _bump(self._job_failures, alloc.job_id, sign):
+                self._restatus(alloc.job_id)
+        if status in _ACTIVE_ALLOC_STATUSES:
+            self._node_allocs_out = None
+            _bump(self._node_allocs, alloc.node_id, sign)
+            placements = self._job_placements.setdefault(alloc.job_id, Counter())
+            if _bump(placements, alloc.node_id, sign):
+                self._stale_job_nodes.add(alloc.job_id)
+            if not placements:
+                del self._job_placements[alloc.job_id]
+        if _is_host_job_alloc(alloc):
+            self._count_host_alloc(alloc, sign)
+
+    def _count_host_alloc(self, alloc: AllocListStub, sign: int) -> None:
+        """Add or take back one allocation's row in its node's host panel."""
+        hosted = self._host_allocs.setdefault(alloc.node_id, {})
+        if sign > 0:
+            hosted[alloc.id] = alloc
+        else:
+            del hosted[alloc.id]
+        hosts = self._job_hosts.setdefault(alloc.job_id, Counter())
+        _bump(hosts, alloc.node_id, sign)
+        if not hosts:
+            del self._job_hosts[alloc.job_id]
+        self._stale_panels.add(alloc.node_id)
+
+    def _restatus(self, job_id: str) -> None:
+        """Recompute one job's display status after its record or its failures changed."""
+        previous = self._job_statuses.pop(job_id, None)
+        if previous is not None:
+            _bump(self._status_counts, previous, -1)
+        if (job := self._jobs.get(job_id)) is None:
+            self._statuses_out = None
+            return
+        degraded = job.status == "running" and self._job_failures[job_id] > 0
+        status = "degraded" if degraded else job.status
+        self._job_statuses[job_id] = status
+        _bump(self._status_counts, status, 1)
+        if status != previous:
+            self._statuses_out = None
+
+    def _nodes_sorted(self) -> list[NodeListStub]:
+        """Return the nodes sorted by name, re-sorting only after a node changed."""
+        if self._sorted_nodes is None:
+            self._sorted_nodes = sorted(self._nodes.values(), key=lambda n: n.name)
+        return self._sorted_nodes
+
+    def _jobs_sorted(self) -> list[JobListStub]:
+        """Return the jobs sorted by name, re-sorting only after a job changed."""
+        if self._sorted_jobs is None:
+            self._sorted_jobs = sorted(self._jobs.values(), key=lambda j: j.name)
+        return self._sorted_jobs
+
+    def _statuses_sorted(self, jobs: list[JobListStub]) -> dict[str, str]:
+        """Return the display status map, in job order like `build_report`'s."""
+        if self._statuses_out is None:
+            self._statuses_out = {job.id: self._job_statuses[job.id] for job in jobs}
+        return self._statuses_out
+
+    def _node_alloc_counts(self) -> Counter[str]:
+        """Return a copy of the active allocation count per node."""
+        if self._node_allocs_out is None:
+            self._node_allocs_out = Counter(self._node_allocs)
+        return self._node_allocs_out
+
+    def _job_node_names(self) -> dict[str, list[str]]:
+        """Return each job's placement names, re-resolving only jobs whose placement moved."""
+        if not self._stale_job_nodes and self._job_nodes_out is not None:
+            return self._job_nodes_out
+        names = {node.id: node.name for node in self._nodes.values()}
+        for job_id in self._stale_job_nodes:
+            if (placements := self._job_placements.get(job_id)) is None:
+                self._job_nodes.pop(job_id, None)
+            else:
+                self._job_nodes[job_id] = sorted(
+                    {names.get(node_id, node_id[:8]) for node_id in placements}
+                )
+        self._stale_job_nodes.clear()
+        self._job_nodes_out = dict(self._job_nodes)
+        return self._job_nodes_out
+
+
+_MISSING = object()
+
+
+def _diff[T: _Identified](held: dict[str, T], listing: list[T]) -> tuple[list[T], list[str]]:
+    """Split a complete ``listing`` into the items that differ from ``held`` and removed IDs."""
+    upserted = [item for item in listing if held.get(item.id) != item]
+    if len(listing) - len(upserted) == len(held):
+        # Every held item is still listed unchanged, so nothing was removed.
+        return upserted, []
+    listed = {item.id for item in listing}
+    return upserted, [item_id for item_id in held if item_id not in listed]
+
+
+def _bump(counter: Counter[str], key: str, sign: int) -> bool:
+    """Adjust ``counter[key]`` by ``sign``, dropping it at zero.
+
+    Returns:
+        bool: True when ``key`` appeared in or vanished from the counter.
+    """
+    before = counter[key]
+    after = before + sign
+    if after:
+        counter[key] = after
+    else:
+        del counter[key]
+    return not before or not after
+
+
+def _sorted_servers(members: list[AgentMember], leader: str) -> list[ServerInfo]:
+    """Return the servers sorted by name, with the leader resolved."""
+    return sorted(_build_servers(members, leader), key=lambda s: s.name)
+
+
+def _active_deployments(deployments: list[DeploymentListStub]) -> list[DeploymentListStub]:
+    """Return the in-progress deployments, sorted by job."""
+    return sorted(
+        (d for d in deployments if d.status in _ACTIVE_DEPLOYMENT_STATUSES),
+        key=lambda d: d.job_id,
+    )
+
+
+def _problem_evals(evals: list[EvalListStub]) -> list[EvalListStub]:
+    """Return the stuck evaluations, sorted by job."""
+    return sorted((e for e in evals if _is_problem_eval(e)), key=lambda e: e.job_id)
+
+
+def _is_degraded_node(node: NodeListStub) -> bool:
+    """Return True when a node is draining or closed to new placements."""
+    return node.drain or node.scheduling_eligibility != "eligible"
+
+
 def build_host_report(
     *,
     nodes: list[NodeListStub],
@@ -271,33 +782,47 @@ def build_host_report(
     same allocs the default view treats as live). Kept pure and Rich-free so the grouping
     logic is unit-testable on its own.
     """
-    jobs_by_id = {job.id: job for job in jobs}
-    allocs_by_node: dict[str, list[AllocListStub]] = {}
-    for alloc in allocs:
-        if _is_host_job_alloc(alloc):
-            allocs_by_node.setdefault(alloc.node_id, []).append(alloc)
+    return _host_panels(
+        sorted(nodes, key=lambda n: n.name), jobs, _tally_allocs(allocs).host_allocs
+    )
+
 
-    panels: list[HostPanel] = []
-    for node in sorted(nodes, key=lambda n: n.name):
-        job_rows = sorted(
+def _host_panels(
+    nodes: list[NodeListStub],
+    jobs: list[JobListStub],
+    host_allocs: dict[str, list[AllocListStub]],
+) -> list[HostPanel]:
+    """Build the panels for ``nodes``, in their order, from each node's listed allocs."""
+    jobs_by_id = {job.id: job for job in jobs}
+    return [
+        _host_panel(
+            node,
             (
                 _host_job_row(alloc, jobs_by_id.get(alloc.job_id))
-                for alloc in allocs_by_node.get(node.id, [])
+                for alloc in host_allocs.get(node.id, [])
             ),
-            key=lambda r: (r.name, r.group),
-        )
-        panels.append(
-            HostPanel(
-                name=node.name,
-                link_id=node.id,
-                address=node.address,
-                status=node.status,
-                eligible=node.scheduling_eligibility == "eligible" and not node.drain,
-                version=node.version,
-                jobs=job_rows,
-            )
         )
-    return panels
+        for node in nodes
+    ]
+
+
+def _host_panel(node: NodeListStub, rows: Iterable[HostJobRow]) -> HostPanel:
+    """Build a node's host panel around its Jobs rows.
+
+    Rows sort by job and group, then oldest first. The key covers every field, so rows
+    that tie are identical and the order never depends on the listing's.
+    """
+    return HostPanel(
+        name=node.name,
+        link_id=node.id,
+        address=node.address,
+        status=node.status,
+        eligible=node.scheduling_eligibility == "eligible" and not node.drain,
+        version=node.version,
+        jobs=sorted(
+            rows, key=lambda r: (r.name, r.group, r.run_start_ns, r.status, r.job_id, r.job_type)
+        ),
+    )
 
 
 def _is_host_job_alloc(alloc: AllocListStub) -> bool:
@@ -369,9 +894,7 @@ def _is_replaced(alloc: AllocListStub) -> bool:
     return bool(alloc.next_allocation)
 
 
-def _job_display_statuses(
-    jobs: list[JobListStub], live_allocs: list[AllocListStub]
-) -> dict[str, str]:
+def _job_display_statuses(jobs: list[JobListStub], degraded_jobs: set[str]) -> dict[str, str]:
     """Map each job id to the status to display, downgrading a real partial outage to "degraded".
 
     Nomad's job-level ``Status`` stays "running" for a service/system job even when its latest
@@ -379,20 +902,17 @@ def _job_display_statuses(
     status hides the outage. A job is "degraded" only when it has a genuinely-stuck placement: a
     ``failed``/``lost`` alloc that Nomad still wants running (not intentionally stopped) and has
     NOT replaced (see ``_is_replaced``), so a failure that already recovered does not read as
-    degraded.
+    degraded. `AllocTally` collects those jobs as ``degraded_jobs``.
     """
-    degraded_jobs = {
-        a.job_id
-        for a in live_allocs
-        if a.client_status in FAILED_ALLOC_STATUSES and not _is_replaced(a)
-    }
     return {
         job.id: "degraded" if job.status == "running" and job.id in degraded_jobs else job.status
         for job in jobs
     }
 
 
-def _job_node_names(allocs: list[AllocListStub], nodes: list[NodeListStub]) -> dict[str, list[str]]:
+def _job_node_names(
+    job_node_ids: dict[str, set[str]], nodes: list[NodeListStub]
+) -> dict[str, list[str]]:
     """Map each job id to the sorted, de-duplicated names of nodes its active allocs run on.
 
     Only running/pending allocations count, so the column reflects live placement rather than
@@ -400,13 +920,10 @@ def _job_node_names(allocs: list[AllocListStub], nodes: list[NodeListStub]) -> d
     back to a short id when a node is unknown.
     """
     node_names = {node.id: node.name for node in nodes}
-    job_node_sets: dict[str, set[str]] = {}
-    for alloc in allocs:
-        if alloc.client_status not in _ACTIVE_ALLOC_STATUSES:
-            continue
-        name = node_names.get(alloc.node_id, alloc.node_id[:8])
-        job_node_sets.setdefault(alloc.job_id, set()).add(name)
-    return {job_id: sorted(names) for job_id, names in job_node_sets.items()}
+    return {
+        job_id: sorted({node_names.get(node_id, node_id[:8]) for node_id in node_ids})
+        for job_id, node_ids in job_node_ids.items()
+    }
 
 
 def _build_servers(members: list[AgentMember], leader: str) -> list[ServerInfo]:
@@ -446,29 +963,28 @@ def _is_problem_eval(evaluation: EvalListStub) -> bool:
     """
     if evaluation.status in _PROBLEM_EVAL_STATUSES:
         return True
-    if evaluation.status in _TERMINAL_EVAL_STATUSES:
+    if evaluation.status in TERMINAL_EVAL_STATUSES:
         return False
     return any(count > 0 for count in evaluation.queued_allocations.values())
 
 
 def _assess_health(
     *,
-    nodes: list[NodeListStub],
-    jobs: list[JobListStub],
+    nodes_down: bool,
+    nodes_degraded: bool,
+    jobs_degraded: bool,
     servers: list[ServerInfo],
     leader_name: str | None,
     allocs_unhealthy: bool,
     evals_problem: list[EvalListStub],
 ) -> Health:
     """Derive the overall health verdict from cluster state."""
-    if any(n.status == "down" for n in nodes):
+    if nodes_down:
         return Health.CRITICAL
     if servers and leader_name is None:  # have servers but no elected leader
         return Health.CRITICAL
-    node_degraded = any(n.drain or n.scheduling_eligibility != "eligible" for n in nodes)
-    jobs_degraded = any(j.status != "running" for j in jobs)
     servers_degraded = any(s.status != "alive" for s in servers)
-    if node_degraded or jobs_degraded or servers_degraded or allocs_unhealthy or evals_problem:
+    if nodes_degraded or jobs_degraded or servers_degraded or allocs_unhealthy or evals_problem:
         return Health.DEGRADED
     return Health.HEALTHY
 
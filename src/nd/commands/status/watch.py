@@ -0,0 +1,84 @@
+"""``nd status --watch``: one dashboard, redrawn in place as the cluster changes."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from nclutils import pp
+from rich.console import Group
+from rich.live import Live
+from rich.text import Text
+
+from nd.commands.status.render import hosts_view, report_view
+from nd.commands.status.report import ReportBuilder
+from nd.constants import STATUS_WATCH_REDRAW_SECONDS
+from nd.daemon.mirror import ClusterMirror
+from nd.nomad import NomadClient, NomadError
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+    from nd.daemon.protocol import Snapshot
+    from nd.nomad import NomadConfig
+
+
+async def watch_status(config: NomadConfig, *, hosts: bool, console: Console | None = None) -> None:
+    """Keep the dashboard on screen, redrawing it whenever a listing changes.
+
+    One client stays open for the whole session and a `ClusterMirror` long-polls the
+    same listings a one-shot ``nd status`` reads, so an idle cluster costs a handful of
+    held requests rather than a full refetch per refresh. A `ReportBuilder` applies only
+    the items that changed, so a redraw on a large cluster does not re-aggregate it. Runs
+    until cancelled.
+
+    Raises:
+        NomadError: If Nomad cannot be read before the first dashboard is drawn. Later
+            failures keep the last dashboard on screen under a warning instead.
+    """
+    console = console or pp.console()
+    builder = ReportBuilder(config)
+    view: RenderableType = Text("Loading cluster state…", style="dim")
+    updated: str | None = None
+    async with (
+        NomadClient.from_config(config) as client,
+        ClusterMirror(client, task_states=hosts) as mirror,
+    ):
+        with Live(view, console=console, auto_refresh=False, transient=False) as live:
+            changed = True
+            while True:
+                caption = f"[dim]Watching {config.address} · Ctrl-C to stop[/]"
+                try:
+                    snapshot = mirror.current()
+                except NomadError as exc:
+                    if updated is None:
+                        raise
+                    caption = f"[yellow]Lost contact with Nomad, showing {updated}: {exc}[/]"
+                else:
+                    if snapshot is not None:
+                        view = _view(builder, snapshot, hosts=hosts, width=console.width)
+                        if changed or updated is None:
+                            updated = time.strftime("%H:%M:%S")
+                        caption = (
+                            f"[dim]Watching {config.address} · updated {updated} · "
+                            "Ctrl-C to stop[/]"
+                        )
+                live.update(Group(view, caption), refresh=True)
+                changed = await mirror.changed(wait=STATUS_WATCH_REDRAW_SECONDS)
+
+
+def _view(builder: ReportBuilder, snapshot: Snapshot, *, hosts: bool, width: int) -> Group:
+    """Bring ``builder`` up to ``snapshot`` and build the dashboard from it."""
+    builder.update(
+        nodes=snapshot.nodes,
+        jobs=snapshot.jobs,
+        allocs=snapshot.allocations,
+        members=snapshot.members,
+        leader=snapshot.leader,
+        deployments=snapshot.deployments,
+        evals=snapshot.evaluations,
+        volumes=snapshot.volumes,
+    )
+    if not hosts:
+        return report_view(builder.report())
+    return hosts_view(builder.report(), builder.host_panels(), width)
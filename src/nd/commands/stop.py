@@ -12,7 +12,12 @@ import typer
 from nclutils import pp
 from rich.table import Table
 
-from nd.commands._common import VerboseOption, configure_verbosity
+from nd.commands._common import (
+    OutputOption,
+    VerboseOption,
+    WatchModeOption,
+    configure_verbosity,
+)
 from nd.commands._orchestration import (
     confirm_jobs,
     fail_row,
@@ -22,21 +27,21 @@ from nd.commands._orchestration import (
     report_outcomes,
     warn_row,
 )
-from nd.constants import (
-    POLL_INTERVAL_SECONDS,
-    STOP_TIMEOUT_SECONDS,
-    TERMINAL_ALLOC_STATUSES,
-)
+from nd.commands._watch import BlockingFeed, open_feed
+from nd.commands._watch_mode import WatchMode
+from nd.constants import STOP_TIMEOUT_SECONDS, TERMINAL_ALLOC_STATUSES
 from nd.nomad import NomadClient, NomadConfig
 from nd.nomad.errors import NomadDecodeError, NomadError
 from nd.targets import resolve_targets, select_candidates
 from nd.ui.alloc_rows import alloc_children
 from nd.ui.live_panel import PanelUpdate, run_rows
+from nd.ui.output import ProgressOutput
 from nd.ui.panels import titled_panel
 
 if TYPE_CHECKING:
     from rich.panel import Panel
 
+    from nd.commands._watch import JobFeed
     from nd.nomad.models.allocation import AllocListStub
     from nd.nomad.models.job import JobListStub
 
@@ -142,6 +147,7 @@ async def stop_and_wait(
     no_shutdown_delay: bool = False,
     node_names: dict[str, str],
     update: PanelUpdate,
+    feed: JobFeed | None = None,
 ) -> StopOutcome:
     """Stop one job and poll its allocations until they are terminal or time out.
 
@@ -151,10 +157,15 @@ async def stop_and_wait(
     terminal state, so the post-stop tasks are watched first; a timed-out or failed
     drain leaves the job queryable for inspection rather than purging it.
     Never raises: a Nomad failure becomes a ``FAILED`` outcome so a sibling job's
-    progress is unaffected. The poll loop is bounded by a wall-clock deadline so a
-    slow cluster cannot stretch the wait past ``STOP_TIMEOUT_SECONDS`` (the bound is
-    on elapsed time, not on poll count, which would also charge for request latency).
+    progress is unaffected. The allocations are read through ``feed`` (blocking queries
+    unless the caller passes an event-stream feed), so each read follows a change rather
+    than a fixed sleep; a server that reports no index falls back to polling, fast while
+    allocations are moving and backing off while they are not. The loop is bounded by a
+    wall-clock deadline so a slow cluster cannot stretch the wait past
+    ``STOP_TIMEOUT_SECONDS`` (the bound is on elapsed time, not on poll count, which
+    would also charge for request latency).
     """
+    feed = feed or BlockingFeed(client)
     try:
         update("stopping")
         # Stop without purging so the job stays queryable while its allocations (and any
@@ -170,15 +181,18 @@ async def stop_and_wait(
 
         deadline = time.monotonic() + STOP_TIMEOUT_SECONDS
         while True:
+            poll = False
             try:
                 start = time.perf_counter()
-                allocs = await client.jobs.allocations(job.id)
+                allocs = await feed.allocations(job.id)
             except NomadDecodeError as exc:
                 # A post-stop/cleanup task that just (re)started can momentarily
                 # serialize in a shape we cannot decode; skip this tick and retry
                 # rather than reporting the stop as failed. The deadline below is
-                # the backstop if it never recovers.
+                # the backstop if it never recovers. Polling paces the retry instead
+                # of waiting on a change that may already have happened.
                 pp.debug(f"{job.id}: skipping drain poll after transient decode error: {exc}")
+                poll = True
             else:
                 pending = sum(1 for a in allocs if a.client_status not in TERMINAL_ALLOC_STATUSES)
                 elapsed_ms = (time.perf_counter() - start) * 1000
@@ -198,7 +212,7 @@ async def stop_and_wait(
                 )
             if time.monotonic() >= deadline:
                 return StopOutcome(job, StopStatus.TIMEOUT, "stop requested, still draining")
-            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            await feed.changed(job.id, deadline=deadline, poll=poll)
     except NomadError as exc:
         return StopOutcome(job, StopStatus.FAILED, str(exc))
 
@@ -285,16 +299,20 @@ def stop(  # noqa: PLR0913
         bool,
         typer.Option("--dry-run", "-n", help="Resolve and report targets without stopping them."),
     ] = False,
+    watch_mode: WatchModeOption = WatchMode.BLOCKING,
+    output: OutputOption = ProgressOutput.PANEL,
     verbose: VerboseOption = 0,
 ) -> None:
     """Stop (and optionally purge) one or more running Nomad jobs.
 
     Confirms the targets (unless --force), stops each job, then watches its
     allocations drain to a terminal state. Use --purge to garbage-collect the job
-    after it stops, --detach to return without watching the drain, and
-    --no-shutdown-delay to skip the configured group and task shutdown delays.
+    after it stops, --detach to return without watching the drain,
+    --no-shutdown-delay to skip the configured group and task shutdown delays, and
+    --watch-mode events to follow the drain on Nomad's event stream. Use --output jsonl
+    in CI to report progress as JSON lines instead of a live panel.
     """
-    configure_verbosity(ctx, verbose)
+    configure_verbosity(ctx, verbose, quiet=output is ProgressOutput.JSONL)
     exit_code = asyncio.run(
         _run(
             job_arg=job,
@@ -303,13 +321,15 @@ def stop(  # noqa: PLR0913
             detach=detach,
             no_shutdown_delay=no_shutdown_delay,
             dry_run=dry_run,
+            watch_mode=watch_mode,
+            output=output,
         )
     )
     if exit_code != 0:
         raise typer.Exit(exit_code)
 
 
-async def _run(  # noqa: PLR0911
+async def _run(  # noqa: PLR0911, PLR0913
     *,
     job_arg: str | None,
     purge: bool,
@@ -317,6 +337,8 @@ async def _run(  # noqa: PLR0911
     detach: bool,
     no_shutdown_delay: bool,
     dry_run: bool,
+    watch_mode: WatchMode = WatchMode.BLOCKING,
+    output: ProgressOutput = ProgressOutput.PANEL,
 ) -> int:
     """Resolve targets, confirm, then stop them concurrently. Return the exit code.
 
@@ -364,7 +386,12 @@ async def _run(  # noqa: PLR0911
             )
 
         outcomes = await _stop_all(
-            client, targets, purge=purge, no_shutdown_delay=no_shutdown_delay
+            client,
+            targets,
+            purge=purge,
+            no_shutdown_delay=no_shutdown_delay,
+            watch_mode=watch_mode,
+            output=output,
         )
 
     return exit_code_for(outcomes)
@@ -406,9 +433,19 @@ async def _confirm(targets: list[JobListStub], *, purge: bool) -> bool:
 
 
 async def _stop_all(
-    client: NomadClient, targets: list[JobListStub], *, purge: bool, no_shutdown_delay: bool
+    client: NomadClient,
+    targets: list[JobListStub],
+    *,
+    purge: bool,
+    no_shutdown_delay: bool,
+    watch_mode: WatchMode = WatchMode.BLOCKING,
+    output: ProgressOutput = ProgressOutput.PANEL,
 ) -> list[StopOutcome]:
-    """Stop every target concurrently, rendering one live panel that ends final."""
+    """Stop every target concurrently, rendering one live panel that ends final.
+
+    Every drain is watched through one feed opened for ``watch_mode``, so an
+    event-stream subscription is shared by all targets rather than opened per job.
+    """
     # Resolve node IDs to names once so each job's detail rows can show placement.
     node_names = await node_names_by_id(client)
 
@@ -420,17 +457,20 @@ async def _stop_all(
             no_shutdown_delay=no_shutdown_delay,
             node_names=node_names,
             update=update,
+            feed=feed,
         )
 
-    ordered = await run_rows(
-        targets,
-        do_work,
-        label_of=lambda job: job.name,
-        initial_phase="stopping",
-        finish_of=lambda o: _OUTCOME_ROW[o.status],
-        running_title=stopping_title(len(targets), purge=purge),
-        final_title=lambda outcomes, secs: final_title(outcomes, elapsed_seconds=secs),
-    )
+    async with open_feed(client, watch_mode, [job.id for job in targets]) as feed:
+        ordered = await run_rows(
+            targets,
+            do_work,
+            label_of=lambda job: job.name,
+            initial_phase="stopping",
+            finish_of=lambda o: _OUTCOME_ROW[o.status],
+            running_title=stopping_title(len(targets), purge=purge),
+            final_title=lambda outcomes, secs: final_title(outcomes, elapsed_seconds=secs),
+            output=output,
+        )
 
     # The live panel is transient on a pipe/CI; emit a durable line for any job
     # that did not stop cleanly so timeouts and failures are never silent.
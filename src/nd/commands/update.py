@@ -11,7 +11,14 @@ import typer
 from nclutils import pp
 
 from nd.binary import NomadBinary, NomadBinaryError
-from nd.commands._common import VerboseOption, configure_verbosity
+from nd.commands._common import (
+    OutputOption,
+    RescanOption,
+    VerboseOption,
+    WatchModeOption,
+    WorkersOption,
+    configure_verbosity,
+)
 from nd.commands._orchestration import (
     confirm_jobs,
     fail_row,
@@ -21,18 +28,30 @@ from nd.commands._orchestration import (
     report_outcomes,
     warn_row,
 )
+from nd.commands._specs import SpecPipeline
+from nd.commands._watch import open_feed
+from nd.commands._watch_mode import WatchMode
 from nd.commands.run import DeployStatus, task_lifecycle, watch_deploy
 from nd.commands.stop import StopStatus, stop_and_wait
-from nd.jobfiles import candidates_for, discover_job_files, load_job_directories
+from nd.constants import DEFAULT_SPEC_WORKERS
+from nd.jobfiles import (
+    JobFileIndex,
+    candidates_for,
+    discover_job_files,
+    load_job_directories,
+)
 from nd.nomad import NomadClient, NomadConfig
 from nd.nomad.errors import NomadError
 from nd.targets import resolve_targets, select_candidates
+from nd.tracing import span
 from nd.ui.live_panel import LiveChild, PanelUpdate, run_rows
+from nd.ui.output import ProgressOutput
 from nd.ui.styles import muted
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from nd.commands._watch import JobFeed
     from nd.jobfiles import JobFile
     from nd.nomad.models.job import JobListStub
 
@@ -137,8 +156,9 @@ async def _update_one(
     *,
     node_names: dict[str, str],
     update: PanelUpdate,
-    nomad: NomadBinary,
+    specs: SpecPipeline,
     purge: bool,
+    feed: JobFeed | None = None,
 ) -> UpdateOutcome:
     """Recreate one running job: compile, stop, re-register, and watch the rollout.
 
@@ -153,24 +173,25 @@ async def _update_one(
         target: The running job paired with its local file.
         node_names: Map of node ID to node name for the per-allocation detail rows.
         update: Callback to update the live panel phase text and detail rows.
-        nomad: Configured ``nomad`` binary handle for the compile step.
+        specs: Validate/compile pipeline the new job payload is drawn from.
         purge: Whether to garbage-collect the job after it drains.
+        feed: Where both the drain and the rollout are watched from.
 
     Returns:
         The terminal outcome for this target.
     """
     try:
         update("compiling")
-        # compile_to_json shells out to the nomad binary (blocking); run it off the
-        # event loop so sibling recreates keep making progress concurrently.
-        body = await asyncio.to_thread(nomad.compile_to_json, target.file.path)
+        # The compile runs on the pipeline's worker pool (usually already finished by
+        # now), so sibling recreates keep making progress concurrently.
+        body = await specs.compiled(target.file.path)
         lifecycle = task_lifecycle(body)
     except NomadBinaryError as exc:
         return UpdateOutcome(target.name, UpdateStatus.FAILED, f"compile failed: {exc}")
 
     # Stop and watch the drain (and optional purge) before touching the new version.
     stop_outcome = await stop_and_wait(
-        client, target.job, purge=purge, node_names=node_names, update=update
+        client, target.job, purge=purge, node_names=node_names, update=update, feed=feed
     )
     if stop_outcome.status not in _STOP_PROCEED:
         # The job is still draining or the stop errored; leaving it untouched is safer
@@ -192,7 +213,8 @@ async def _update_one(
 
     try:
         deploy_update("registering")
-        resp = await client.jobs.register(body)
+        with span("register", **{"nd.job": target.name}):
+            resp = await client.jobs.register(body)
     except NomadError as exc:
         # The old version is already gone here, so call out that the job is down.
         return UpdateOutcome(
@@ -207,6 +229,7 @@ async def _update_one(
             lifecycle=lifecycle,
             update=deploy_update,
             since_index=resp.job_modify_index,
+            feed=feed,
         )
     except NomadError as exc:
         # watch_deploy polls the cluster, so a transient error here would otherwise
@@ -226,7 +249,7 @@ app = typer.Typer(context_settings={"allow_interspersed_args": True})
 
 
 @app.callback(invoke_without_command=True)
-def update(
+def update(  # noqa: PLR0913
     ctx: typer.Context,
     job: Annotated[
         str | None,
@@ -250,6 +273,10 @@ def update(
         bool,
         typer.Option("--dry-run", "-n", help="Resolve and validate without recreating."),
     ] = False,
+    watch_mode: WatchModeOption = WatchMode.BLOCKING,
+    output: OutputOption = ProgressOutput.PANEL,
+    workers: WorkersOption = DEFAULT_SPEC_WORKERS,
+    rescan: RescanOption = False,  # noqa: FBT002
     verbose: VerboseOption = 0,
 ) -> None:
     """Recreate one or more running jobs from their local job files.
@@ -258,21 +285,45 @@ def update(
     --no-purge), re-registered, and watched to a terminal deploy state. Use this to
     roll out a changed job file or to force a fresh version (e.g. re-pull a docker
     image); whether an image is actually re-pulled depends on the job's docker driver
-    config (force_pull), not on nd.
+    config (force_pull), not on nd. Use --watch-mode events to follow the drains and
+    rollouts on Nomad's event stream, and --workers to set how many files are
+    validated and compiled at once. Use --output jsonl in CI to report progress as JSON
+    lines instead of a live panel.
     """
-    configure_verbosity(ctx, verbose)
-    exit_code = asyncio.run(_run(job_arg=job, no_purge=no_purge, force=force, dry_run=dry_run))
+    configure_verbosity(ctx, verbose, quiet=output is ProgressOutput.JSONL)
+    exit_code = asyncio.run(
+        _run(
+            job_arg=job,
+            no_purge=no_purge,
+            force=force,
+            dry_run=dry_run,
+            watch_mode=watch_mode,
+            output=output,
+            workers=workers,
+            rescan=rescan,
+        )
+    )
     if exit_code != 0:
         raise typer.Exit(exit_code)
 
 
-async def _run(*, job_arg: str | None, no_purge: bool, force: bool, dry_run: bool) -> int:  # noqa: PLR0911
+async def _run(  # noqa: PLR0911, PLR0913
+    *,
+    job_arg: str | None,
+    no_purge: bool,
+    force: bool,
+    dry_run: bool,
+    watch_mode: WatchMode = WatchMode.BLOCKING,
+    output: ProgressOutput = ProgressOutput.PANEL,
+    workers: int = DEFAULT_SPEC_WORKERS,
+    rescan: bool = False,
+) -> int:
     """Resolve running targets with local files, confirm, then recreate them.
 
     Returns the exit code: 0 on clean success, 1 on any failure. The new spec for
     every target is validated up front, before any job is stopped.
     """
-    files = discover_job_files(load_job_directories())
+    files = discover_job_files(load_job_directories(), JobFileIndex(rescan=rescan))
     config = NomadConfig.resolve()
     async with NomadClient.from_config(config) as client:
         jobs = await client.jobs.list()
@@ -302,19 +353,28 @@ async def _run(*, job_arg: str | None, no_purge: bool, force: bool, dry_run: boo
 
         try:
             nomad = NomadBinary.create(config)
-            # dict.fromkeys dedups so a multi-job file is validated once.
-            for path in dict.fromkeys(t.file.path for t in targets):
-                nomad.validate(path)
         except NomadBinaryError as exc:
             pp.error(str(exc))
             return 1
 
-        if dry_run:
-            for t in targets:
-                pp.dryrun(f"would recreate {t.name} ({t.file.path})")
-            return 0
-
-        outcomes = await _update_all(client, targets, nomad, purge=purge)
+        async with SpecPipeline(nomad, workers=workers) as specs:
+            paths = [t.file.path for t in targets]
+            # Compile alongside validation so each payload is ready before its stop.
+            specs.prefetch(paths, compile_specs=not dry_run)
+            try:
+                await specs.validate_all(paths)
+            except NomadBinaryError as exc:
+                pp.error(str(exc))
+                return 1
+
+            if dry_run:
+                for t in targets:
+                    pp.dryrun(f"would recreate {t.name} ({t.file.path})")
+                return 0
+
+            outcomes = await _update_all(
+                client, targets, specs, purge=purge, watch_mode=watch_mode, output=output
+            )
 
     return 0 if all(o.status is UpdateStatus.UPDATED for o in outcomes) else 1
 
@@ -326,15 +386,23 @@ async def _confirm(targets: list[UpdateTarget], *, purge: bool) -> bool:
 
 
 async def _update_all(
-    client: NomadClient, targets: list[UpdateTarget], nomad: NomadBinary, *, purge: bool
+    client: NomadClient,
+    targets: list[UpdateTarget],
+    specs: SpecPipeline,
+    *,
+    purge: bool,
+    watch_mode: WatchMode = WatchMode.BLOCKING,
+    output: ProgressOutput = ProgressOutput.PANEL,
 ) -> list[UpdateOutcome]:
     """Recreate every target concurrently under one live panel.
 
     Args:
         client: Authenticated Nomad client.
         targets: The running jobs to recreate.
-        nomad: Configured ``nomad`` binary handle for the compile step.
+        specs: Validate/compile pipeline the new job payloads are drawn from.
         purge: Whether to garbage-collect each job after it drains.
+        watch_mode: How the drains and rollouts are followed; one feed serves them all.
+        output: Render a live panel, or write JSON-lines progress events instead.
 
     Returns:
         Ordered list of outcomes, one per target.
@@ -344,18 +412,27 @@ async def _update_all(
 
     async def do_work(target: UpdateTarget, update: PanelUpdate) -> UpdateOutcome:
         return await _update_one(
-            client, target, node_names=node_names, update=update, nomad=nomad, purge=purge
+            client,
+            target,
+            node_names=node_names,
+            update=update,
+            specs=specs,
+            purge=purge,
+            feed=feed,
         )
 
-    ordered = await run_rows(
-        targets,
-        do_work,
-        label_of=lambda t: t.name,
-        initial_phase="compiling",
-        finish_of=lambda o: _OUTCOME_ROW[o.status],
-        running_title=f"Updating {len(targets)} job(s)",
-        final_title=_final_title,
-    )
+    job_ids = dict.fromkeys(i for t in targets for i in (t.job.id, t.name))
+    async with open_feed(client, watch_mode, job_ids) as feed:
+        ordered = await run_rows(
+            targets,
+            do_work,
+            label_of=lambda t: t.name,
+            initial_phase="compiling",
+            finish_of=lambda o: _OUTCOME_ROW[o.status],
+            running_title=f"Updating {len(targets)} job(s)",
+            final_title=_final_title,
+            output=output,
+        )
 
     # The live panel is transient on a pipe/CI; emit a durable line for anything that
     # did not update cleanly so timeouts and a left-down job are never silent.
@@ -23,7 +23,7 @@ from nd.commands.volume.report import (
 from nd.nomad import NomadClient, NomadConfig
 from nd.targets import resolve_targets, select_candidates
 from nd.ui.prompts import require_prompt, select_one
-from nd.volumefiles import discover_volume_files, load_volume_directories
+from nd.volumefiles import VolumeSpecCache, discover_volume_files, load_volume_directories
 
 if TYPE_CHECKING:
     from nd.commands.volume.report import Registration
@@ -128,7 +128,7 @@ async def _select_specs(name_arg: str | None, action: str) -> list[VolumeSpec]:
     caller re-decoding a tristate): no specs configured or a cancelled prompt exit 0,
     a name that matched nothing reports the miss and exits 1.
     """
-    specs = discover_volume_files(load_volume_directories())
+    specs = discover_volume_files(load_volume_directories(), VolumeSpecCache(), parallel=True)
     if not specs:
         pp.info("No host volume specs found; set [volumes] directories in your nd config.")
         raise typer.Exit(0)
@@ -239,7 +239,7 @@ async def _run_list(*, name_arg: str | None) -> None:
     shown. Unlike ``register``/``delete`` this read-only view never prompts, so a bare
     ``nd volume list`` stays a one-shot table.
     """
-    specs = discover_volume_files(load_volume_directories())
+    specs = discover_volume_files(load_volume_directories(), VolumeSpecCache(), parallel=True)
     targets = resolve_targets(specs, name_arg, name_of=lambda s: s.name).candidates
     config = NomadConfig.resolve()
     async with NomadClient.from_config(config) as client:
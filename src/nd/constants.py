@@ -10,6 +10,40 @@ from __future__ import annotations
 # Used when the corresponding env var / config value is not set.
 DEFAULT_NOMAD_ADDRESS = "http://127.0.0.1:4646"
 DEFAULT_REQUEST_TIMEOUT_SECONDS = 60.0
+# Extra client-side allowance on top of a blocking query's wait (and Nomad's jitter) so
+# the response has time to arrive before the HTTP timeout fires.
+BLOCKING_QUERY_TIMEOUT_MARGIN_SECONDS = 5.0
+# How many times a failed request is retried, and the first backoff delay, which doubles
+# on each retry (with jitter) up to the cap. The defaults ride out a Nomad leader
+# election, a few seconds of 500 "No cluster leader", without making an unreachable
+# agent slow to report.
+DEFAULT_RETRIES = 4
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.25
+RETRY_MAX_BACKOFF_SECONDS = 4.0
+# A 429/503 whose Retry-After asks for a longer pause than this is not retried at all.
+RETRY_AFTER_MAX_SECONDS = 30.0
+# After this many consecutive failures a client stops sending requests for the cooldown,
+# then lets a single probe through, so dozens of concurrent watchers do not pile onto a
+# struggling server.
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 2.0
+# Requests one client keeps in flight at once; more wait for a free slot, so fanning
+# out over hundreds of nodes or jobs neither exhausts the connection pool nor floods the
+# agent. Blocking queries and event streams are not counted: they idle server-side.
+DEFAULT_MAX_CONCURRENCY = 16
+# Token bucket burst when `rate_limit` is set; no rate limit applies by default.
+DEFAULT_RATE_BURST = 20
+# Connection pool limits. Nomad refuses more than 100 connections from one client
+# (`limits.http_max_conns_per_client`), so the pool stays well below that even with a
+# daemon's long polls open. Idle connections are kept long enough to span the polls of a
+# watch loop, so each poll reuses a connection instead of paying a new TLS handshake.
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+# Page size when a listing is streamed page by page rather than read whole. Large enough
+# that a typical cluster still needs only a few round trips, small enough that a page of
+# allocations with task states decodes in a few milliseconds.
+STREAM_PAGE_SIZE = 500
 
 # --- Job stop / drain watching ---------------------------------------------------------
 # Allocation client statuses that mean the alloc has fully stopped, including any
@@ -23,19 +57,57 @@ HEALTHY_ALLOC_STATUSES = frozenset({"running", "complete"})
 # finishing cleanly). Used both to color a failure red mid-drain and to flag a job as
 # degraded when such an alloc is left unreplaced.
 FAILED_ALLOC_STATUSES = frozenset({"failed", "lost"})
-# How often to poll a stopped job's allocations, and how long to wait for them to
-# drain before warning that the job is still stopping.
-POLL_INTERVAL_SECONDS = 1.0
+# Terminal evaluation statuses whose queued-allocation counts are historical, not live.
+TERMINAL_EVAL_STATUSES = frozenset({"complete", "canceled", "cancelled", "failed"})
+# How long to wait for a stopped job's allocations to drain before warning that the job
+# is still stopping.
 STOP_TIMEOUT_SECONDS = 120.0
+# Pacing of a watcher that has to poll (no index to block on, or a change it cannot
+# observe): the first re-read after any change comes this soon, then the interval doubles
+# while nothing changes, up to the `poll_max_interval` setting. A long rollout on a
+# server without blocking queries then costs tens of reads per job instead of hundreds.
+POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_POLL_MAX_INTERVAL_SECONDS = 10.0
+# Longest a watcher holds a blocking query open waiting for its job's allocations to
+# change. Short enough that the live panel's elapsed column and the timeout deadline
+# stay responsive, long enough to collapse the per-second poll into one request.
+BLOCKING_QUERY_WAIT_SECONDS = 5.0
 
 # --- Job file discovery ----------------------------------------------------------------
 # Globs used to find Nomad job specs inside each configured directory.
 JOB_FILE_GLOBS = ["*.hcl", "*.nomad"]
 
+# How many `nomad` validate/compile processes run at once for a multi-file run, update or
+# plan. Each is a short CPU-bound HCL2 parse, so a handful saturates a laptop without
+# starving the event loop that drives the live panel.
+DEFAULT_SPEC_WORKERS = 4
+
+# Host-volume specs are parsed in-process with a pure-Python HCL parser, so a cold parallel
+# discovery fans the parses out to worker processes. Below the minimum, starting the pool
+# costs more than the parses it would spread; the cap keeps a large machine from spawning
+# far more interpreters than a specs directory can use.
+VOLUME_PARSE_POOL_MIN_FILES = 32
+VOLUME_PARSE_MAX_WORKERS = 8
+
+# --- nd daemon -------------------------------------------------------------------------
+# How long the daemon's mirror holds each blocking query open. Nomad answers as soon as
+# the listing changes, so this only bounds how often an idle cluster is re-read.
+DAEMON_BLOCKING_WAIT_SECONDS = 60.0
+# How often the daemon re-reads listings Nomad cannot long-poll (members, leader, volumes)
+# and how long it backs off after a failed read before trying again.
+DAEMON_POLL_INTERVAL_SECONDS = 10.0
+# How long a command waits on the daemon's socket before querying Nomad itself. A warm
+# daemon answers in milliseconds; one still loading its first listings is not worth
+# waiting for.
+DAEMON_REPLY_TIMEOUT_SECONDS = 2.0
+
 # --- Status dashboard ------------------------------------------------------------------
 # Minimum terminal width at which `nd status --hosts` lays its per-host panels into two
 # columns; below this the panels stack in a single column so each stays readable.
 HOSTS_TWO_COLUMN_MIN_WIDTH = 120
+# `nd status --watch` redraws as soon as the cluster changes, and at least this often so
+# uptimes keep ticking on a quiet cluster.
+STATUS_WATCH_REDRAW_SECONDS = 5.0
 
 # --- Job run / deploy watching ---------------------------------------------------------
 # How long to wait for a registered job's deployment (or allocations, for batch/system
@@ -0,0 +1,20 @@
+"""A long-running mirror of cluster state that CLI invocations read over a Unix socket.
+
+`mirror` keeps the cluster listings current with blocking queries over one client,
+`server` answers snapshot requests on the socket (``nd daemon`` runs it), and `client`
+fetches a snapshot, returning None whenever no daemon can answer so callers fall back
+to querying Nomad. `protocol` holds the wire format both sides share.
+
+Only the client side is re-exported, so a command that merely asks the daemon does not
+load the mirror and server.
+"""
+
+from nd.daemon.client import fetch_snapshot
+from nd.daemon.protocol import Snapshot, config_fingerprint, default_socket_path
+
+__all__ = [
+    "Snapshot",
+    "config_fingerprint",
+    "default_socket_path",
+    "fetch_snapshot",
+]
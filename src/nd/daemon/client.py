@@ -0,0 +1,57 @@
+"""Fetch a snapshot from a running nd daemon, if there is one."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import msgspec
+from nclutils import pp
+
+from nd.constants import DAEMON_REPLY_TIMEOUT_SECONDS
+from nd.daemon.protocol import Reply, Request, config_fingerprint, default_socket_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from nd.daemon.protocol import Snapshot
+    from nd.nomad import NomadConfig
+
+_REPLY_DECODER = msgspec.msgpack.Decoder(Reply)
+
+
+async def fetch_snapshot(
+    config: NomadConfig,
+    *,
+    path: Path | None = None,
+) -> Snapshot | None:
+    """Ask the daemon on ``path`` for the cluster ``config`` points at.
+
+    Returns None, after a debug message saying why, whenever the daemon cannot answer:
+    none is running, it mirrors another configuration, it is still loading, its mirror
+    is failing, or it does not reply within `DAEMON_REPLY_TIMEOUT_SECONDS`. Callers
+    then query Nomad.
+    """
+    path = path or default_socket_path()
+    if not path.exists():
+        return None
+    try:
+        async with asyncio.timeout(DAEMON_REPLY_TIMEOUT_SECONDS):
+            reader, writer = await asyncio.open_unix_connection(str(path))
+            writer.write(msgspec.msgpack.encode(Request(fingerprint=config_fingerprint(config))))
+            writer.write_eof()
+            body = await reader.read()
+            writer.close()
+    except (OSError, TimeoutError) as exc:
+        pp.debug(f"nd daemon unavailable, querying Nomad directly: {exc!r}")
+        return None
+    try:
+        reply = _REPLY_DECODER.decode(body)
+    except msgspec.DecodeError as exc:
+        pp.debug(f"nd daemon sent an unreadable reply, querying Nomad directly: {exc}")
+        return None
+    if reply.snapshot is None:
+        pp.debug(f"nd daemon declined, querying Nomad directly: {reply.error}")
+        return None
+    pp.debug(f"Answered from the nd daemon on {path}")
+    return reply.snapshot
@@ -0,0 +1,184 @@
+"""An in-memory mirror of the cluster listings, kept current with blocking queries."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Self
+
+from nclutils import pp
+
+from nd.constants import DAEMON_BLOCKING_WAIT_SECONDS, DAEMON_POLL_INTERVAL_SECONDS
+from nd.daemon.protocol import Snapshot
+from nd.nomad.errors import NomadError
+from nd.nomad.filters import LIVE_EVALS_FILTER
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from nd.nomad import NomadClient
+    from nd.nomad.resources.base import QueryResult
+
+
+class ClusterMirror:
+    """Hold the latest copy of every `Snapshot` listing for one client.
+
+    Each indexed listing (nodes, jobs, allocations, deployments, evaluations) has its
+    own loop long-polling it with blocking queries, so a change lands in the mirror as
+    soon as Nomad reports it. Members, the leader and host volumes have no index to
+    block on and are re-read every ``poll_interval`` seconds. A failed read is kept as
+    ``error`` and retried after ``poll_interval``, so the mirror outlives an agent
+    restart. Use as an async context manager so the loops are stopped on exit.
+
+    A listing that comes back equal to the one held is not replaced, so an unchanged
+    listing stays the same object across snapshots and `changed` wakes only on a real
+    change (or a failure). ``task_states=False`` mirrors allocations without their task
+    states, for a consumer that never reads them.
+    """
+
+    def __init__(
+        self,
+        client: NomadClient,
+        *,
+        wait: float = DAEMON_BLOCKING_WAIT_SECONDS,
+        poll_interval: float = DAEMON_POLL_INTERVAL_SECONDS,
+        task_states: bool = True,
+    ) -> None:
+        self._client = client
+        self._wait = wait
+        self._poll_interval = poll_interval
+        self._task_states = task_states
+        self._state: dict[str, Any] = {}
+        self._errors: dict[str, NomadError] = {}
+        self._loaded = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def error(self) -> NomadError | None:
+        """The most recent failure of any listing that has not since recovered."""
+        return next(iter(self._errors.values()), None)
+
+    async def __aenter__(self) -> Self:
+        """Start one loop per listing in the background."""
+        client = self._client
+        indexed: dict[str, Callable[[int, float], Awaitable[QueryResult[Any]]]] = {
+            "nodes": lambda index, wait: client.nodes.list_indexed(index=index, wait=wait),
+            "jobs": lambda index, wait: client.jobs.list_indexed(index=index, wait=wait),
+            "allocations": lambda index, wait: client.allocations.list_indexed(
+                index=index, wait=wait, task_states=self._task_states
+            ),
+            "deployments": lambda index, wait: client.deployments.list_indexed(
+                index=index, wait=wait
+            ),
+            "evaluations": lambda index, wait: client.evaluations.list_indexed(
+                index=index, wait=wait, filter_expr=LIVE_EVALS_FILTER
+            ),
+        }
+        polled: dict[str, Callable[[], Awaitable[Any]]] = {
+            "members": client.agent.members,
+            "leader": client.status.leader,
+            "volumes": self._volumes,
+        }
+        self._tasks = [
+            *(asyncio.create_task(self._follow(name, read)) for name, read in indexed.items()),
+            *(asyncio.create_task(self._poll(name, read)) for name, read in polled.items()),
+        ]
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Cancel every loop and wait for them to stop."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def snapshot(self, *, wait: float) -> Snapshot:
+        """Return the current listings, waiting up to ``wait`` seconds for the first load.
+
+        Raises:
+            TimeoutError: If some listing has not loaded yet.
+            NomadError: If a listing's latest read failed, so the mirror may be stale.
+        """
+        await asyncio.wait_for(self._loaded.wait(), timeout=wait)
+        if (error := self.error) is not None:
+            raise error
+        return Snapshot(**self._state)
+
+    def current(self) -> Snapshot | None:
+        """Return the listings as they stand, or None until each has loaded once.
+
+        Raises:
+            NomadError: If a listing's latest read failed, so the mirror may be stale.
+        """
+        if (error := self.error) is not None:
+            raise error
+        if not self._loaded.is_set():
+            return None
+        return Snapshot(**self._state)
+
+    async def changed(self, *, wait: float) -> bool:
+        """Wait up to ``wait`` seconds for a listing to change or fail.
+
+        Returns:
+            bool: True when something changed since the last call, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=wait)
+        except TimeoutError:
+            return False
+        # Cleared after waking: a change landing while the caller rebuilds leaves the
+        # signal set, so the next wait returns at once.
+        self._changed.clear()
+        return True
+
+    async def _volumes(self) -> list:
+        """Return host volumes, or none when the endpoint is unavailable (as ``nd status``)."""
+        try:
+            return await self._client.volumes.list()
+        except NomadError as exc:
+            pp.debug(f"Mirroring no volumes: {exc}")
+            return []
+
+    async def _follow(
+        self, name: str, read: Callable[[int, float], Awaitable[QueryResult[Any]]]
+    ) -> None:
+        """Long-poll one indexed listing into the mirror for as long as the daemon runs."""
+        index = 0
+        while True:
+            try:
+                result = await read(index, self._wait)
+            except NomadError as exc:
+                self._fail(name, exc)
+                index = 0
+                await asyncio.sleep(self._poll_interval)
+                continue
+            self._store(name, result.value)
+            index = result.index
+            if not index:
+                # No index to block on, so the next read would return at once; pace it.
+                await asyncio.sleep(self._poll_interval)
+
+    async def _poll(self, name: str, read: Callable[[], Awaitable[Any]]) -> None:
+        """Re-read one unindexed listing into the mirror every poll interval."""
+        while True:
+            try:
+                self._store(name, await read())
+            except NomadError as exc:
+                self._fail(name, exc)
+            await asyncio.sleep(self._poll_interval)
+
+    def _store(self, name: str, value: object) -> None:
+        """Publish a listing that differs from the one held, clearing its error."""
+        recovered = self._errors.pop(name, None) is not None
+        if name not in self._state or self._state[name] != value:
+            self._state[name] = value
+            self._changed.set()
+        elif recovered:
+            self._changed.set()
+        if len(self._state) == len(self._tasks):
+            self._loaded.set()
+
+    def _fail(self, name: str, exc: NomadError) -> None:
+        """Record a listing's failure so snapshots are refused until it recovers."""
+        pp.debug(f"Mirror read of {name} failed, retrying: {exc}")
+        self._errors[name] = exc
+        self._changed.set()
@@ -0,0 +1,72 @@
+"""Wire format shared by the nd daemon and the commands that read from it.
+
+A command connects to the daemon's Unix socket, sends one msgpack `Request` and closes
+its write side; the daemon answers with one `Reply` and closes. The request carries a
+fingerprint of the caller's resolved `NomadConfig`, so a daemon mirroring a different
+cluster, namespace or token declines rather than answering for the wrong one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import msgspec
+
+from nd.nomad.config import NomadConfig, default_cache_dir
+from nd.nomad.models.agent import AgentMember
+from nd.nomad.models.allocation import AllocListStub
+from nd.nomad.models.deployment import DeploymentListStub
+from nd.nomad.models.evaluation import EvalListStub
+from nd.nomad.models.job import JobListStub
+from nd.nomad.models.node import NodeListStub
+from nd.nomad.models.volume import HostVolumeListStub
+
+
+class Snapshot(msgspec.Struct, frozen=True, kw_only=True):
+    """Every listing ``nd status``, ``nd list`` and target resolution read.
+
+    Evaluations are the non-terminal ones only, as ``nd status`` requests them.
+    """
+
+    nodes: list[NodeListStub]
+    jobs: list[JobListStub]
+    allocations: list[AllocListStub]
+    deployments: list[DeploymentListStub]
+    evaluations: list[EvalListStub]
+    volumes: list[HostVolumeListStub]
+    members: list[AgentMember]
+    leader: str
+
+
+class Request(msgspec.Struct, frozen=True, kw_only=True):
+    """A command's request for the current snapshot."""
+
+    fingerprint: str
+
+
+class Reply(msgspec.Struct, frozen=True, kw_only=True):
+    """The daemon's answer: a snapshot, or why it will not give one."""
+
+    snapshot: Snapshot | None = None
+    error: str | None = None
+
+
+def config_fingerprint(config: NomadConfig) -> str:
+    """Return a digest identifying the cluster and credentials ``config`` resolves to.
+
+    Only the address, namespace, region and token count: tuning such as retries or
+    connection limits does not change what the daemon would answer. The token is part
+    of the digest, so a caller with different ACLs never reads state the daemon fetched
+    under another token, but the token itself never crosses the socket.
+    """
+    identity = (config.address, config.namespace, config.region, config.token)
+    return hashlib.sha256(msgspec.json.encode(identity)).hexdigest()
+
+
+def default_socket_path() -> Path:
+    """Return where the daemon listens: under ``$XDG_RUNTIME_DIR``, else nd's cache dir."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    root = Path(runtime) / "nd" if runtime else default_cache_dir()
+    return root / "daemon.sock"
@@ -0,0 +1,132 @@
+"""Serve `ClusterMirror` snapshots on a Unix socket."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import os
+import socket
+from typing import TYPE_CHECKING
+
+import msgspec
+from nclutils import pp
+
+from nd.constants import DAEMON_REPLY_TIMEOUT_SECONDS
+from nd.daemon.mirror import ClusterMirror
+from nd.daemon.protocol import Reply, Request, config_fingerprint
+from nd.nomad import NomadClient, NomadError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from nd.nomad import NomadConfig
+
+_ENCODER = msgspec.msgpack.Encoder()
+_REQUEST_DECODER = msgspec.msgpack.Decoder(Request)
+
+
+class DaemonRunningError(Exception):
+    """Raised when another daemon already answers on the socket path."""
+
+
+async def serve(config: NomadConfig, path: Path, *, ready: asyncio.Event | None = None) -> None:
+    """Mirror the cluster ``config`` points at and answer snapshot requests on ``path``.
+
+    Runs until cancelled, then removes the socket. The socket's directory is created
+    private to the user and the socket itself is bound as mode 0600, since snapshots
+    hold whatever the configured token can read. ``ready`` is set once the socket
+    accepts.
+
+    Raises:
+        DaemonRunningError: If a live daemon already listens on ``path``.
+    """
+    _claim(path)
+    fingerprint = config_fingerprint(config)
+    async with NomadClient.from_config(config) as client, ClusterMirror(client) as mirror:
+        handler = functools.partial(_answer, mirror, fingerprint)
+        server = await asyncio.start_unix_server(handler, sock=_bind(path))
+        try:
+            if ready is not None:
+                ready.set()
+            async with server:
+                await server.serve_forever()
+        finally:
+            _release(path)
+
+
+def _claim(path: Path) -> None:
+    """Prepare ``path`` for listening, clearing a socket left behind by a dead daemon.
+
+    Raises:
+        DaemonRunningError: If something still accepts connections on ``path``.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            pp.debug(f"Removing stale daemon socket {path}")
+            path.unlink(missing_ok=True)
+            return
+    msg = f"An nd daemon is already listening on {path}"
+    raise DaemonRunningError(msg)
+
+
+def _bind(path: Path) -> socket.socket:
+    """Bind a Unix socket at ``path`` that only its owner can connect to.
+
+    The mode is set by the umask at bind time rather than by a later chmod, which would
+    leave the socket open to other users in between when its directory is not private
+    (the cache dir fallback usually already exists with the default umask).
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+    except OSError:
+        sock.close()
+        raise
+    finally:
+        os.umask(previous)
+    return sock
+
+
+def _release(path: Path) -> None:
+    """Remove the socket so the next command does not try a daemon that has gone."""
+    path.unlink(missing_ok=True)
+
+
+async def _answer(
+    mirror: ClusterMirror,
+    fingerprint: str,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Read one request and write back the snapshot, or the reason there is none."""
+    try:
+        request = _REQUEST_DECODER.decode(await reader.read())
+    except msgspec.DecodeError:
+        reply = Reply(error="malformed request")
+    else:
+        reply = await _reply(mirror, fingerprint, request)
+    with contextlib.suppress(OSError):
+        writer.write(_ENCODER.encode(reply))
+        await writer.drain()
+    writer.close()
+
+
+async def _reply(mirror: ClusterMirror, fingerprint: str, request: Request) -> Reply:
+    """Build the reply to a well-formed request."""
+    if request.fingerprint != fingerprint:
+        return Reply(error="daemon mirrors a different Nomad configuration")
+    try:
+        # Leave the caller time to fall back before its own timeout fires.
+        snapshot = await mirror.snapshot(wait=DAEMON_REPLY_TIMEOUT_SECONDS / 2)
+    except TimeoutError:
+        return Reply(error="daemon is still loading the cluster")
+    except NomadError as exc:
+        return Reply(error=f"daemon mirror is stale: {exc}")
+    return Reply(snapshot=snapshot)
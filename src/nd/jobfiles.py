@@ -6,10 +6,13 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import msgspec
 from nclutils.fs import find_files
 
+from nd.cachefiles import atomic_write_bytes, read_versioned
 from nd.constants import JOB_FILE_GLOBS
-from nd.nomad.config import load_config_directories
+from nd.nomad.config import default_cache_dir, load_config_directories
+from nd.tracing import span
 
 if TYPE_CHECKING:
     from collections.abc import Set as AbstractSet
@@ -82,7 +85,80 @@ def is_job_file(text: str) -> bool:
     return _JOB_BLOCK_DETECT_RE.search(text) is not None
 
 
-def discover_job_files(directories: list[Path]) -> list[JobFile]:
+class _IndexEntry(msgspec.Struct, frozen=True, array_like=True):
+    """What one file held the last time it was read, and the stat that dates it."""
+
+    mtime_ns: int
+    size: int
+    inode: int
+    is_job: bool
+    job_names: list[str]
+
+
+class _IndexFile(msgspec.Struct, frozen=True, kw_only=True):
+    """The on-disk layout of the discovery index."""
+
+    version: int
+    files: dict[str, _IndexEntry]
+
+
+class JobFileIndex:
+    """Persistent record of each scanned file's stat signature and job names.
+
+    `discover_job_files` consults it so a file is only read and scanned when its
+    modification time, size or inode differ from the last scan; every other file costs
+    a ``stat``. Stored as one JSON file under the XDG cache dir. A missing, corrupt or
+    older-format index is treated as empty, and a failed write is logged at debug level,
+    so the index can only make discovery faster, never fail it. ``rescan`` ignores the
+    stored entries so every file is read again (and the index rebuilt).
+    """
+
+    # Bump when the entry layout changes so an older index is rebuilt, not misread.
+    _VERSION = 1
+
+    def __init__(self, path: Path | None = None, *, rescan: bool = False) -> None:
+        self._path = path or default_cache_dir() / "jobfiles.json"
+        self._known = {} if rescan else self._read()
+        self._seen: dict[str, _IndexEntry] = {}
+        self._changed = False
+
+    def scan(self, path: Path) -> tuple[bool, list[str]]:
+        """Return whether ``path`` is a job file and its job names, reading it only if changed."""
+        stat = path.stat()
+        key = str(path)
+        entry = self._known.get(key)
+        if entry is None or (entry.mtime_ns, entry.size, entry.inode) != (
+            stat.st_mtime_ns,
+            stat.st_size,
+            stat.st_ino,
+        ):
+            text = path.read_text(encoding="utf-8")
+            is_job = is_job_file(text)
+            entry = _IndexEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                inode=stat.st_ino,
+                is_job=is_job,
+                job_names=extract_job_names(text) if is_job else [],
+            )
+            self._changed = True
+        self._seen[key] = entry
+        return entry.is_job, entry.job_names
+
+    def save(self) -> None:
+        """Write the files seen by this scan, dropping any that have since disappeared."""
+        if not self._changed and self._seen.keys() == self._known.keys():
+            return
+        payload = msgspec.json.encode(_IndexFile(version=self._VERSION, files=self._seen))
+        atomic_write_bytes(self._path, payload, what="job file index")
+
+    def _read(self) -> dict[str, _IndexEntry]:
+        """Read the stored entries, treating anything unreadable as an empty index."""
+        stored = read_versioned(self._path, _IndexFile, self._VERSION, what="job file index")
+        return stored.files if stored is not None else {}
+
+
+def discover_job_files(directories: list[Path], index: JobFileIndex | None = None) -> list[JobFile]:
     """Find job files in each existing directory and parse their job names.
 
     Non-existent directories are skipped silently. Files are returned sorted
@@ -90,19 +166,31 @@ def discover_job_files(directories: list[Path]) -> list[JobFile]:
 
     Args:
         directories: Directories to search for Nomad job files.
+        index: Discovery index to consult and update, so unchanged files are not
+            re-read. Without one every file is read and scanned.
 
     Returns:
         JobFile instances for every matching file, sorted by path.
     """
     files: list[JobFile] = []
-    for directory in directories:
-        if not directory.is_dir():
-            continue
-        for path in find_files(directory, globs=JOB_FILE_GLOBS):
-            text = path.read_text(encoding="utf-8")
-            if not is_job_file(text):
+    with span("discover job files") as traced:
+        for directory in directories:
+            if not directory.is_dir():
                 continue
-            files.append(JobFile(path=path, job_names=extract_job_names(text)))
+            for path in find_files(directory, globs=JOB_FILE_GLOBS):
+                if index is not None:
+                    is_job, names = index.scan(path)
+                else:
+                    text = path.read_text(encoding="utf-8")
+                    is_job = is_job_file(text)
+                    names = extract_job_names(text) if is_job else []
+                if not is_job:
+                    continue
+                files.append(JobFile(path=path, job_names=names))
+        if index is not None:
+            index.save()
+        if traced is not None:
+            traced.set("nd.job_files", len(files))
     return sorted(files, key=lambda jf: str(jf.path))
 
 
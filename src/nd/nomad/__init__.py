@@ -5,6 +5,7 @@ from nd.nomad.config import NomadConfig
 from nd.nomad.errors import (
     NomadAuthError,
     NomadBadRequestError,
+    NomadCircuitOpenError,
     NomadConfigError,
     NomadConnectionError,
     NomadDecodeError,
@@ -17,6 +18,7 @@ from nd.nomad.errors import (
 __all__ = [
     "NomadAuthError",
     "NomadBadRequestError",
+    "NomadCircuitOpenError",
     "NomadClient",
     "NomadConfig",
     "NomadConfigError",
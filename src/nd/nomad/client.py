@@ -9,6 +9,7 @@ from nd.nomad.resources.agent import AgentResource
 from nd.nomad.resources.allocations import AllocationsResource
 from nd.nomad.resources.deployments import DeploymentsResource
 from nd.nomad.resources.evaluations import EvaluationsResource
+from nd.nomad.resources.events import EventsResource
 from nd.nomad.resources.jobs import JobsResource
 from nd.nomad.resources.nodes import NodesResource
 from nd.nomad.resources.status import StatusResource
@@ -30,9 +31,15 @@ class NomadClient:
         self.status = StatusResource(self._transport)
         self.deployments = DeploymentsResource(self._transport)
         self.evaluations = EvaluationsResource(self._transport)
+        self.events = EventsResource(self._transport)
         self.system = SystemResource(self._transport)
         self.volumes = VolumesResource(self._transport)
 
+    @property
+    def config(self) -> NomadConfig:
+        """The resolved connection settings this client talks to Nomad with."""
+        return self._config
+
     @classmethod
     def from_config(cls, config: NomadConfig) -> NomadClient:
         """Build a client from an explicit config."""
@@ -5,11 +5,22 @@ from __future__ import annotations
 import os
 import tomllib
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any
 
 import msgspec
 
-from nd.constants import DEFAULT_NOMAD_ADDRESS, DEFAULT_REQUEST_TIMEOUT_SECONDS
+from nd.constants import (
+    DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_NOMAD_ADDRESS,
+    DEFAULT_POLL_MAX_INTERVAL_SECONDS,
+    DEFAULT_RATE_BURST,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF_SECONDS,
+)
 from nd.nomad.errors import NomadConfigError
 
 # Standard Nomad env var -> NomadConfig field name.
@@ -43,6 +54,18 @@ class NomadConfig(msgspec.Struct, frozen=True, kw_only=True):
     tls_server_name: str | None = None
     ui_url: str | None = None
     timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS
+    retries: Annotated[int, msgspec.Meta(ge=0)] = DEFAULT_RETRIES
+    retry_backoff: Annotated[float, msgspec.Meta(ge=0)] = DEFAULT_RETRY_BACKOFF_SECONDS
+    max_concurrency: Annotated[int, msgspec.Meta(ge=1)] = DEFAULT_MAX_CONCURRENCY
+    # Requests per second; 0 leaves requests unpaced.
+    rate_limit: Annotated[float, msgspec.Meta(ge=0)] = 0.0
+    rate_burst: Annotated[int, msgspec.Meta(ge=1)] = DEFAULT_RATE_BURST
+    # Negotiate HTTP/2 over TLS so concurrent requests share one connection; needs h2.
+    http2: bool = False
+    max_connections: Annotated[int, msgspec.Meta(ge=1)] = DEFAULT_MAX_CONNECTIONS
+    max_keepalive: Annotated[int, msgspec.Meta(ge=0)] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: Annotated[float, msgspec.Meta(ge=0)] = DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    poll_max_interval: Annotated[float, msgspec.Meta(gt=0)] = DEFAULT_POLL_MAX_INTERVAL_SECONDS
 
     @property
     def ui_base(self) -> str:
@@ -105,6 +128,13 @@ def default_config_path() -> Path:
     return root / "nd" / "config.toml"
 
 
+def default_cache_dir() -> Path:
+    """Return the XDG cache directory for nd's on-disk caches."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "nd"
+
+
 def load_config_directories(section: str, config_path: Path | None = None) -> list[Path]:
     """Read a ``[<section>] directories`` path list from the nd TOML config, expanding ``~``.
 
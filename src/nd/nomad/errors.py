@@ -15,6 +15,14 @@ class NomadConnectionError(NomadError):
     """Raised when the client cannot reach the Nomad agent."""
 
 
+class NomadCircuitOpenError(NomadConnectionError):
+    """Raised, without contacting Nomad, while recent failures hold the client's circuit open."""
+
+    def __init__(self, message: str, *, retry_in: float) -> None:
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
 class NomadDecodeError(NomadError):
     """Raised when a response body cannot be decoded into the expected type."""
 
@@ -0,0 +1,44 @@
+"""Builders for Nomad's server-side ``filter`` expressions.
+
+Nomad's list endpoints accept a ``filter`` query parameter in go-bexpr syntax and apply
+it before paginating, so records a caller would discard never cross the wire. These
+helpers build the two shapes nd needs, quoting values so a job ID can hold any text.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from nd.constants import TERMINAL_EVAL_STATUSES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def quote(value: str) -> str:
+    """Render ``value`` as a double-quoted bexpr string literal."""
+    # bexpr string literals use JSON's escaping rules for quotes and backslashes.
+    return msgspec.json.encode(value).decode()
+
+
+def any_equal(selector: str, values: Iterable[str]) -> str | None:
+    """Match records whose ``selector`` equals one of ``values``.
+
+    Returns None for no values, since an empty disjunction is not valid bexpr and the
+    caller should then skip the filter (or the request) altogether.
+    """
+    terms = [f"{selector} == {quote(value)}" for value in sorted(set(values))]
+    return " or ".join(terms) or None
+
+
+def none_equal(selector: str, values: Iterable[str]) -> str | None:
+    """Match records whose ``selector`` equals none of ``values``, or None for no values."""
+    terms = [f"{selector} != {quote(value)}" for value in sorted(set(values))]
+    return " and ".join(terms) or None
+
+
+# Drops the terminal evaluations that make up nearly all of a long-lived cluster's
+# evaluation history; `nd status` and the daemon only care about live ones.
+LIVE_EVALS_FILTER = none_equal("Status", TERMINAL_EVAL_STATUSES)
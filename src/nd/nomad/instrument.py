@@ -0,0 +1,94 @@
+"""Per-request instrumentation hooks for `AsyncTransport`."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx2
+
+# Key under which a response carries its `RequestRecord`, so decode time lands on it.
+_RECORD_EXTENSION = "nd.request_record"
+
+# Path segments that are object IDs, so every read of one kind groups as one endpoint.
+_ENDPOINT_PATTERNS = (
+    (re.compile(r"^/(allocation|deployment|evaluation|job|node)/[^/]+"), r"/\1/{id}"),
+    (re.compile(r"^/client/allocation/[^/]+"), "/client/allocation/{id}"),
+    (re.compile(r"^/volume/host/(?!register$)[^/]+"), "/volume/host/{id}"),
+)
+
+
+@dataclass(slots=True)
+class RequestRecord:
+    """What one HTTP attempt cost, as handed to every request hook.
+
+    ``status`` is None when the attempt failed before Nomad answered. ``queued`` is the
+    time spent waiting on the transport's rate limit and concurrency cap, ``latency`` the
+    exchange itself. ``decode`` starts at 0 and grows as a resource decodes the body, so
+    it is complete by the time the command finishes, not when the hook first sees it.
+    """
+
+    method: str
+    path: str
+    status: int | None
+    bytes: int
+    queued: float
+    latency: float
+    attempt: int = 0
+    decode: float = 0.0
+
+    @property
+    def failed(self) -> bool:
+        """True when Nomad never answered or answered with an error status."""
+        return self.status is None or self.status >= HTTPStatus.BAD_REQUEST
+
+    @property
+    def endpoint(self) -> str:
+        """The request's method and path with object IDs replaced by ``{id}``."""
+        return f"{self.method} {endpoint(self.path)}"
+
+
+type RequestHook = Callable[[RequestRecord], None]
+
+_GLOBAL_HOOKS: list[RequestHook] = []
+
+
+def add_request_hook(hook: RequestHook) -> None:
+    """Call ``hook`` with the record of every request any transport in the process sends."""
+    _GLOBAL_HOOKS.append(hook)
+
+
+def remove_request_hook(hook: RequestHook) -> None:
+    """Stop calling a hook added with `add_request_hook`."""
+    _GLOBAL_HOOKS.remove(hook)
+
+
+def global_hooks() -> list[RequestHook]:
+    """Return the process-wide hooks, which transports call alongside their own."""
+    return _GLOBAL_HOOKS
+
+
+def endpoint(path: str) -> str:
+    """Return ``path`` with object IDs replaced by ``{id}``, e.g. ``/job/{id}/allocations``."""
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path, count = pattern.subn(replacement, path, count=1)
+        if count:
+            break
+    return path
+
+
+def attach_record(response: httpx2.Response, record: RequestRecord) -> None:
+    """Carry ``record`` on ``response`` so `record_decode` can find it."""
+    response.extensions[_RECORD_EXTENSION] = record
+
+
+def record_decode(response: httpx2.Response, seconds: float) -> None:
+    """Add time spent decoding ``response`` to its request record, if it has one."""
+    record = response.extensions.get(_RECORD_EXTENSION)
+    if record is not None:
+        record.decode += seconds
@@ -0,0 +1,45 @@
+"""Client-side rate limiting for `AsyncTransport` requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class RateLimiter:
+    """Pace requests with a token bucket refilled at ``rate`` per second.
+
+    Up to ``burst`` requests go out at once; after that each waits for its token.
+    Tokens are reserved in call order, so concurrent callers are served first come,
+    first served rather than racing for each refill.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before it is usable."""
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available for one request."""
+        if (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
@@ -33,8 +33,14 @@ class TaskGroupDeploymentState(msgspec.Struct, rename="pascal", frozen=True, kw_
 
 
 class Deployment(_DeploymentCommon, frozen=True, kw_only=True):
-    """A deployment as returned by ``GET /v1/deployment/:id``."""
+    """A deployment as returned by ``GET /v1/deployment/:id``.
 
+    ``GET /v1/deployments`` returns the same full record, so a listing can be decoded
+    into this type when the per-task-group counts are wanted without a read per id.
+    """
+
+    create_index: int = 0
+    modify_index: int = 0
     task_groups: dict[str, TaskGroupDeploymentState] = msgspec.field(
         name="TaskGroups", default_factory=dict
     )
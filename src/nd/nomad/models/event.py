@@ -0,0 +1,38 @@
+"""Models for the Nomad event stream endpoint."""
+
+from __future__ import annotations
+
+import msgspec
+
+
+class Event(msgspec.Struct, rename="pascal", frozen=True, kw_only=True):
+    """A single state-change event from ``GET /v1/event/stream``.
+
+    The object itself (``Payload``) is not decoded: watchers only need to know which
+    job changed, which the ``Key`` and ``FilterKeys`` carry, and then re-read the
+    state through the regular endpoints.
+    """
+
+    topic: str
+    type: str = msgspec.field(name="Type")
+    key: str = ""
+    namespace: str = "default"
+    # Secondary keys the event can be filtered on; an allocation event lists its job id
+    # and deployment id here. Nomad sends null when there are none.
+    filter_keys_raw: list[str] | None = msgspec.field(name="FilterKeys", default=None)
+    index: int = 0
+
+    @property
+    def filter_keys(self) -> list[str]:
+        """Secondary filter keys, with Nomad's null read as empty."""
+        return self.filter_keys_raw or []
+
+
+class EventBatch(msgspec.Struct, rename="pascal", frozen=True, kw_only=True):
+    """One line of the event stream: the events applied at a single Raft index.
+
+    Heartbeat lines are an empty object, which decodes to a batch with no events.
+    """
+
+    index: int = 0
+    events: list[Event] = msgspec.field(default_factory=list)
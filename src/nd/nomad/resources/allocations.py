@@ -2,21 +2,72 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import AsyncIterator
 
+    from nd.nomad.resources.base import QueryResult
+
+from nd.constants import STREAM_PAGE_SIZE
 from nd.nomad.models.allocation import Allocation, AllocListStub
-from nd.nomad.resources.base import BaseResource
+from nd.nomad.resources.base import BaseResource, list_params
 
 
 class AllocationsResource(BaseResource):
     """Read and lifecycle access to Nomad allocations."""
 
-    async def list(self) -> builtins.list[AllocListStub]:
-        """List all allocations (``GET /v1/allocations``), following pagination."""
-        return await self._paginate_list("/allocations", AllocListStub)
+    async def list(
+        self,
+        *,
+        filter_expr: str | None = None,
+        per_page: int | None = None,
+        task_states: bool = True,
+    ) -> builtins.list[AllocListStub]:
+        """List allocations (``GET /v1/allocations``), following pagination.
+
+        Args:
+            filter_expr: Server-side bexpr filter, e.g. ``JobID == "web"``.
+            per_page: Items per page; everything comes back in one page when unset.
+            task_states: Pass False to have Nomad omit each allocation's ``TaskStates``,
+                most of the payload, when the caller never reads them.
+        """
+        params = _alloc_params(filter_expr=filter_expr, per_page=per_page, task_states=task_states)
+        return await self._paginate_list("/allocations", AllocListStub, params=params)
+
+    def iter_pages(
+        self,
+        *,
+        filter_expr: str | None = None,
+        per_page: int = STREAM_PAGE_SIZE,
+        task_states: bool = True,
+    ) -> AsyncIterator[builtins.list[AllocListStub]]:
+        """Yield allocations a page at a time, prefetching the next page during each decode.
+
+        Takes the same options as `list`; ``per_page`` bounds how many allocations are
+        held at once.
+        """
+        params = _alloc_params(filter_expr=filter_expr, per_page=per_page, task_states=task_states)
+        return self._iter_pages("/allocations", AllocListStub, params=params)
+
+    async def list_indexed(
+        self,
+        *,
+        index: int | None = None,
+        wait: float | None = None,
+        filter_expr: str | None = None,
+        task_states: bool = True,
+    ) -> QueryResult[builtins.list[AllocListStub]]:
+        """List allocations as a blocking query, returning the listing with its index.
+
+        ``filter_expr`` and ``task_states`` narrow the listing as in `list`; the index
+        still tracks the whole allocations table.
+        """
+        params = _alloc_params(filter_expr=filter_expr, per_page=None, task_states=task_states)
+        return await self._query_list(
+            "/allocations", AllocListStub, index=index, wait=wait, params=params
+        )
 
     async def read(self, alloc_id: str) -> Allocation:
         """Read a single allocation (``GET /v1/allocation/:id``)."""
@@ -40,3 +91,13 @@ class AllocationsResource(BaseResource):
             f"/client/allocation/{alloc_id}/signal",
             json={"Signal": signal, "Task": task},
         )
+
+
+def _alloc_params(
+    *, filter_expr: str | None, per_page: int | None, task_states: bool
+) -> dict[str, Any]:
+    """Build the allocation listing params, adding ``task_states=false`` only when pruning."""
+    params = list_params(filter_expr=filter_expr, per_page=per_page)
+    if not task_states:
+        params["task_states"] = False
+    return params
@@ -3,18 +3,52 @@
 from __future__ import annotations
 
 import builtins
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import msgspec
 
 from nd.nomad.errors import NomadDecodeError
+from nd.nomad.instrument import record_decode
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     import httpx2
 
     from nd.nomad.transport import AsyncTransport
 
 
+@dataclass(frozen=True)
+class QueryResult[T]:
+    """A decoded response paired with the ``X-Nomad-Index`` it was read at.
+
+    Feed ``index`` back into the next blocking query to wait for the value to change.
+    An index of 0 means Nomad reported none (or it went backwards), so the next query
+    returns immediately rather than blocking.
+    """
+
+    value: T
+    index: int
+
+
+def list_params(*, filter_expr: str | None = None, per_page: int | None = None) -> dict[str, Any]:
+    """Build the query params shared by Nomad's list endpoints, omitting unset ones.
+
+    Args:
+        filter_expr: A bexpr ``filter`` Nomad applies server-side before paginating
+            (see `nd.nomad.filters`).
+        per_page: Items per page; Nomad returns everything in one page when unset.
+    """
+    params: dict[str, Any] = {}
+    if filter_expr:
+        params["filter"] = filter_expr
+    if per_page is not None:
+        params["per_page"] = per_page
+    return params
+
+
 class BaseResource:
     """Base class holding a transport reference and msgspec decode helpers."""
 
@@ -23,23 +57,98 @@ class BaseResource:
 
     def _decode[T](self, response: httpx2.Response, type_: type[T]) -> T:
         """Decode a response body into ``type_``, mapping failures to NomadDecodeError."""
+        start = time.perf_counter()
+        try:
+            return self._decode_bytes(response.content, type_)
+        finally:
+            record_decode(response, time.perf_counter() - start)
+
+    def _decode_bytes[T](self, content: bytes | str, type_: type[T]) -> T:
+        """Decode raw JSON (a body or one streamed line) into ``type_``."""
         try:
-            return msgspec.json.decode(response.content, type=type_)
+            return msgspec.json.decode(content, type=type_)
         except msgspec.DecodeError as exc:
             msg = f"Failed to decode {type_.__name__}: {exc}"
-            raise NomadDecodeError(msg, payload=response.text[:500]) from exc
+            payload = content if isinstance(content, str) else content.decode("utf-8", "replace")
+            raise NomadDecodeError(msg, payload=payload[:500]) from exc
 
     def _decode_list[T](self, response: httpx2.Response, item_type: type[T]) -> list[T]:
         """Decode a JSON array into ``list[item_type]``."""
+        start = time.perf_counter()
         try:
             return msgspec.json.decode(response.content, type=builtins.list[item_type])  # ty: ignore[invalid-type-form]
         except msgspec.DecodeError as exc:
             msg = f"Failed to decode list[{item_type.__name__}]: {exc}"
             raise NomadDecodeError(msg, payload=response.text[:500]) from exc
+        finally:
+            record_decode(response, time.perf_counter() - start)
 
-    async def _paginate_list[T](self, path: str, item_type: type[T]) -> list[T]:
+    async def _paginate_list[T](
+        self, path: str, item_type: type[T], *, params: dict[str, Any] | None = None
+    ) -> list[T]:
         """Fetch every page of a list endpoint, decoding each into ``item_type``."""
         items: list[T] = []
-        async for response in self._transport.paginate(path):
-            items.extend(self._decode_list(response, item_type))
+        async for page in self._iter_pages(path, item_type, params=params):
+            items.extend(page)
         return items
+
+    async def _iter_pages[T](
+        self,
+        path: str,
+        item_type: type[T],
+        *,
+        params: dict[str, Any] | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[list[T]]:
+        """Yield each page of a list endpoint decoded into ``item_type`` as it arrives.
+
+        Only the page being decoded and (with ``prefetch``) the one in flight are held,
+        so a caller that folds pages into a summary never holds the whole listing.
+        """
+        async for response in self._transport.paginate(path, params=params, prefetch=prefetch):
+            yield self._decode_list(response, item_type)
+
+    async def _query[T](
+        self, path: str, type_: type[T], *, index: int | None, wait: float | None
+    ) -> QueryResult[T]:
+        """Run a blocking query for a single object, returning it with its index.
+
+        ``index=None`` resumes from the last index the transport saw for ``path``.
+        """
+        since = self._resolve_index(path, index)
+        response = await self._transport.request("GET", path, index=since, wait=wait)
+        return QueryResult(self._decode(response, type_), self._next_index(path, since))
+
+    async def _query_list[T](
+        self,
+        path: str,
+        item_type: type[T],
+        *,
+        index: int | None,
+        wait: float | None,
+        params: dict[str, Any] | None = None,
+    ) -> QueryResult[list[T]]:
+        """Run a blocking query over a list endpoint, returning every item with the index.
+
+        Only the first page can block; once it returns the path's index has moved past
+        ``index``, so any further pages come back immediately.
+        """
+        since = self._resolve_index(path, index)
+        items: list[T] = []
+        async for response in self._transport.paginate(path, params=params, index=since, wait=wait):
+            items.extend(self._decode_list(response, item_type))
+        return QueryResult(items, self._next_index(path, since))
+
+    def _resolve_index(self, path: str, index: int | None) -> int:
+        """Return the explicit ``index``, or the transport's last-seen index for ``path``."""
+        return self._transport.last_index(path) if index is None else index
+
+    def _next_index(self, path: str, since: int) -> int:
+        """Return the index to resume from after a query issued at ``since``.
+
+        Nomad's index can go backwards (a restored snapshot, a new leader); resuming from
+        a stale higher value would block until the wait expires on every call, so a
+        regression resets to 0 and the next query reads the current state immediately.
+        """
+        index = self._transport.last_index(path)
+        return index if index >= since else 0
@@ -7,16 +7,53 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import builtins
 
+    from nd.nomad.resources.base import QueryResult
+
 from nd.nomad.models.deployment import Deployment, DeploymentListStub
-from nd.nomad.resources.base import BaseResource
+from nd.nomad.resources.base import BaseResource, list_params
 
 
 class DeploymentsResource(BaseResource):
     """Read access to Nomad deployments."""
 
-    async def list(self) -> builtins.list[DeploymentListStub]:
-        """List all deployments (``GET /v1/deployments``), following pagination."""
-        return await self._paginate_list("/deployments", DeploymentListStub)
+    async def list(
+        self, *, filter_expr: str | None = None, per_page: int | None = None
+    ) -> builtins.list[DeploymentListStub]:
+        """List deployments (``GET /v1/deployments``), following pagination.
+
+        ``filter_expr`` is a server-side bexpr filter such as ``JobID == "web"``;
+        ``per_page`` sets the page size (one page when unset).
+        """
+        params = list_params(filter_expr=filter_expr, per_page=per_page)
+        return await self._paginate_list("/deployments", DeploymentListStub, params=params)
+
+    async def list_indexed(
+        self, *, index: int | None = None, wait: float | None = None
+    ) -> QueryResult[builtins.list[DeploymentListStub]]:
+        """List all deployments as a blocking query, returning the listing with its index."""
+        return await self._query_list("/deployments", DeploymentListStub, index=index, wait=wait)
+
+    async def list_detailed_indexed(
+        self,
+        *,
+        index: int | None = None,
+        wait: float | None = None,
+        filter_expr: str | None = None,
+    ) -> QueryResult[builtins.list[Deployment]]:
+        """List deployments with their health counts as a blocking query.
+
+        Decodes the same ``GET /v1/deployments`` listing as `list_indexed` into full
+        `Deployment` records, so a watcher of many jobs reads every deployment's
+        per-task-group counts in one request instead of one read per deployment.
+        ``filter_expr`` narrows the listing server-side, e.g. to the watched jobs.
+        """
+        return await self._query_list(
+            "/deployments",
+            Deployment,
+            index=index,
+            wait=wait,
+            params=list_params(filter_expr=filter_expr),
+        )
 
     async def read(self, deployment_id: str) -> Deployment:
         """Read a single deployment (``GET /v1/deployment/:id``).
@@ -26,3 +63,9 @@ class DeploymentsResource(BaseResource):
         """
         response = await self._transport.request("GET", f"/deployment/{deployment_id}")
         return self._decode(response, Deployment)
+
+    async def read_indexed(
+        self, deployment_id: str, *, index: int | None = None, wait: float | None = None
+    ) -> QueryResult[Deployment]:
+        """Read a single deployment as a blocking query, returning it with its index."""
+        return await self._query(f"/deployment/{deployment_id}", Deployment, index=index, wait=wait)
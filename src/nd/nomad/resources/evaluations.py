@@ -7,13 +7,38 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import builtins
 
+    from nd.nomad.resources.base import QueryResult
+
 from nd.nomad.models.evaluation import EvalListStub
-from nd.nomad.resources.base import BaseResource
+from nd.nomad.resources.base import BaseResource, list_params
 
 
 class EvaluationsResource(BaseResource):
     """Read access to Nomad evaluations."""
 
-    async def list(self) -> builtins.list[EvalListStub]:
-        """List all evaluations (``GET /v1/evaluations``), following pagination."""
-        return await self._paginate_list("/evaluations", EvalListStub)
+    async def list(
+        self, *, filter_expr: str | None = None, per_page: int | None = None
+    ) -> builtins.list[EvalListStub]:
+        """List evaluations (``GET /v1/evaluations``), following pagination.
+
+        ``filter_expr`` is a server-side bexpr filter such as ``Status == "blocked"``;
+        ``per_page`` sets the page size (one page when unset).
+        """
+        params = list_params(filter_expr=filter_expr, per_page=per_page)
+        return await self._paginate_list("/evaluations", EvalListStub, params=params)
+
+    async def list_indexed(
+        self,
+        *,
+        index: int | None = None,
+        wait: float | None = None,
+        filter_expr: str | None = None,
+    ) -> QueryResult[builtins.list[EvalListStub]]:
+        """List evaluations as a blocking query, returning the listing with its index."""
+        return await self._query_list(
+            "/evaluations",
+            EvalListStub,
+            index=index,
+            wait=wait,
+            params=list_params(filter_expr=filter_expr),
+        )
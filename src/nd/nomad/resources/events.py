@@ -0,0 +1,33 @@
+"""Events resource for the Nomad API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from nd.nomad.models.event import EventBatch
+from nd.nomad.resources.base import BaseResource
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Mapping
+
+
+class EventsResource(BaseResource):
+    """Subscription access to the Nomad event stream."""
+
+    async def stream(self, topics: Mapping[str, Iterable[str]]) -> AsyncIterator[EventBatch]:
+        """Subscribe to ``GET /v1/event/stream`` and yield each batch of events.
+
+        ``topics`` maps a topic (``Job``, ``Allocation``, ``Deployment``, ...) to the
+        keys to filter it on; ``"*"`` subscribes to every key. Heartbeat lines are
+        dropped, so every yielded batch carries at least one event. Requires the
+        ``read-job`` ACL capability for the namespaces involved.
+
+        Raises:
+            NomadConnectionError: If the stream cannot be opened or drops.
+            NomadHTTPError: If Nomad refuses the subscription (e.g. 403 without ACL).
+        """
+        params = {"topic": [f"{topic}:{key}" for topic, keys in topics.items() for key in keys]}
+        async for line in self._transport.stream_lines("/event/stream", params=params):
+            batch = self._decode_bytes(line, EventBatch)
+            if batch.events:
+                yield batch
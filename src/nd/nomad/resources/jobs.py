@@ -6,13 +6,17 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import AsyncIterator
+
+    from nd.nomad.resources.base import QueryResult
 
 import msgspec
 
+from nd.constants import STREAM_PAGE_SIZE
 from nd.nomad.models.allocation import AllocListStub
 from nd.nomad.models.deployment import DeploymentListStub
 from nd.nomad.models.job import Job, JobDeregisterResponse, JobListStub, JobRegisterResponse
-from nd.nomad.resources.base import BaseResource
+from nd.nomad.resources.base import BaseResource, list_params
 
 
 class JobsResource(BaseResource):
@@ -22,6 +26,18 @@ class JobsResource(BaseResource):
         """List all jobs (``GET /v1/jobs``), following pagination."""
         return await self._paginate_list("/jobs", JobListStub)
 
+    def iter_pages(
+        self, *, per_page: int = STREAM_PAGE_SIZE
+    ) -> AsyncIterator[builtins.list[JobListStub]]:
+        """Yield jobs a page at a time, prefetching the next page during each decode."""
+        return self._iter_pages("/jobs", JobListStub, params=list_params(per_page=per_page))
+
+    async def list_indexed(
+        self, *, index: int | None = None, wait: float | None = None
+    ) -> QueryResult[builtins.list[JobListStub]]:
+        """List all jobs as a blocking query, returning the listing with its index."""
+        return await self._query_list("/jobs", JobListStub, index=index, wait=wait)
+
     async def read(self, job_id: str) -> Job:
         """Read a single job (``GET /v1/job/:id``)."""
         response = await self._transport.request("GET", f"/job/{job_id}")
@@ -50,6 +66,18 @@ class JobsResource(BaseResource):
         """
         return await self._paginate_list(f"/job/{job_id}/allocations", AllocListStub)
 
+    async def allocations_indexed(
+        self, job_id: str, *, index: int | None = None, wait: float | None = None
+    ) -> QueryResult[builtins.list[AllocListStub]]:
+        """List a job's allocations as a blocking query, returning them with their index.
+
+        Holds the request until the allocations change past ``index`` (or ``wait``
+        seconds pass), so a drain or rollout watcher wakes on change instead of polling.
+        """
+        return await self._query_list(
+            f"/job/{job_id}/allocations", AllocListStub, index=index, wait=wait
+        )
+
     async def register(self, body: bytes) -> JobRegisterResponse:
         """Register a job (``POST /v1/jobs``).
 
@@ -68,3 +96,11 @@ class JobsResource(BaseResource):
         recent deployment must select it by ``CreateIndex`` rather than position.
         """
         return await self._paginate_list(f"/job/{job_id}/deployments", DeploymentListStub)
+
+    async def deployments_indexed(
+        self, job_id: str, *, index: int | None = None, wait: float | None = None
+    ) -> QueryResult[builtins.list[DeploymentListStub]]:
+        """List a job's deployments as a blocking query, returning them with their index."""
+        return await self._query_list(
+            f"/job/{job_id}/deployments", DeploymentListStub, index=index, wait=wait
+        )
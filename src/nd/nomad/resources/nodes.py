@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import builtins
 
+    from nd.nomad.resources.base import QueryResult
+
 from nd.nomad.models.node import Node, NodeListStub
 from nd.nomad.resources.base import BaseResource
 
@@ -18,6 +20,12 @@ class NodesResource(BaseResource):
         """List all nodes (``GET /v1/nodes``), following pagination."""
         return await self._paginate_list("/nodes", NodeListStub)
 
+    async def list_indexed(
+        self, *, index: int | None = None, wait: float | None = None
+    ) -> QueryResult[builtins.list[NodeListStub]]:
+        """List all nodes as a blocking query, returning the listing with its index."""
+        return await self._query_list("/nodes", NodeListStub, index=index, wait=wait)
+
     async def read(self, node_id: str) -> Node:
         """Read a single node (``GET /v1/node/:id``)."""
         response = await self._transport.request("GET", f"/node/{node_id}")
@@ -0,0 +1,107 @@
+"""Backoff, Retry-After and circuit breaking for `AsyncTransport` retries."""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from nd.constants import RETRY_MAX_BACKOFF_SECONDS
+from nd.nomad.errors import NomadCircuitOpenError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx2
+
+
+def backoff(attempt: int, base: float) -> float:
+    """Return the delay before retry number ``attempt`` (0 for the first retry).
+
+    The step doubles from ``base`` up to `RETRY_MAX_BACKOFF_SECONDS`. Half of it is
+    always waited and the other half is random, so clients that failed together spread
+    out without any of them retrying immediately.
+    """
+    step = min(RETRY_MAX_BACKOFF_SECONDS, base * 2**attempt)
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def retry_after(response: httpx2.Response) -> float:
+    """Return the seconds a response's ``Retry-After`` header asks for, or 0 without one.
+
+    Accepts both forms the header takes: delay seconds and an HTTP date.
+    """
+    raw = response.headers.get("Retry-After")
+    if not raw:
+        return 0.0
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return 0.0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class CircuitBreaker:
+    """Stop sending requests to an agent that keeps failing, then probe before resuming.
+
+    After ``threshold`` consecutive failures the circuit opens and `admit` refuses
+    requests for ``cooldown`` seconds. Then one request is admitted as a probe while the
+    rest are still refused: its success closes the circuit, its failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int,
+        cooldown: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+
+    def admit(self) -> None:
+        """Allow one request through, claiming the probe when the cooldown has passed.
+
+        Raises:
+            NomadCircuitOpenError: While the circuit is open or another request is probing.
+        """
+        if self._failures < self._threshold:
+            return
+        remaining = self._open_until - self._clock()
+        if remaining <= 0 and not self._probing:
+            self._probing = True
+            return
+        retry_in = remaining if remaining > 0 else self._cooldown
+        msg = (
+            f"Nomad failed {self._failures} requests in a row; "
+            f"holding further requests for {retry_in:.1f}s"
+        )
+        raise NomadCircuitOpenError(msg, retry_in=retry_in)
+
+    def record_success(self) -> None:
+        """Close the circuit after an admitted request got an answer."""
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count an admitted request's failure, opening the circuit at the threshold."""
+        self._failures += 1
+        self._probing = False
+        if self._failures >= self._threshold:
+            self._open_until = self._clock() + self._cooldown
+
+    def release(self) -> None:
+        """Forget an admitted request that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
@@ -2,42 +2,115 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import ssl
+import time
 from typing import TYPE_CHECKING, Any, Self
 
 import httpx2
 
+from nd.constants import (
+    BLOCKING_QUERY_TIMEOUT_MARGIN_SECONDS,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    CIRCUIT_BREAKER_THRESHOLD,
+    RETRY_AFTER_MAX_SECONDS,
+)
 from nd.nomad.errors import (
     NomadAuthError,
     NomadBadRequestError,
+    NomadCircuitOpenError,
+    NomadConfigError,
     NomadConnectionError,
     NomadHTTPError,
     NomadNotFoundError,
     NomadServerError,
 )
+from nd.nomad.instrument import RequestRecord, attach_record, global_hooks
+from nd.nomad.limits import RateLimiter
+from nd.nomad.retry import CircuitBreaker, backoff, retry_after
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     from nd.nomad.config import NomadConfig
+    from nd.nomad.instrument import RequestHook
+
+
+# Methods safe to repeat after Nomad may already have acted on them. Nomad's writes
+# (register, stop, dispatch...) each create an evaluation, so they are not among them.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+# Failures that happen before the request reaches Nomad, so any method may be retried.
+_UNSENT_ERRORS = (httpx2.ConnectError, httpx2.ConnectTimeout, httpx2.PoolTimeout)
+# Statuses a server or proxy sends to refuse a request without acting on it, so any
+# method may be retried (after any Retry-After delay).
+_REFUSED_STATUSES = frozenset({429, 503})
+# Statuses worth retrying for an idempotent request: Nomad answers 500 "No cluster
+# leader" during an election, and a proxy in front of it may answer 502/504.
+_TRANSIENT_STATUSES = frozenset({500, 502, 504})
 
 
 class AsyncTransport:
-    """Thin async wrapper around ``httpx2.AsyncClient`` for the Nomad API."""
+    """Thin async wrapper around ``httpx2.AsyncClient`` for the Nomad API.
+
+    Failed requests are retried up to ``config.retries`` times with jittered exponential
+    backoff: idempotent ones after any transport failure or transient 5xx, any method
+    when Nomad never received or refused the request. One `CircuitBreaker` per transport
+    holds every request back while Nomad keeps failing. Blocking queries go past it: a
+    long poll held for its whole wait must not be the probe that decides the circuit.
+
+    At most ``config.max_concurrency`` requests are in flight at once, and with
+    ``config.rate_limit`` set each attempt first takes a token from a `RateLimiter`.
+    Blocking queries skip the concurrency cap, since they idle server-side for their wait.
+
+    Every attempt is reported as a `RequestRecord` to the process-wide request hooks
+    and to this transport's ``hooks``.
+    """
 
     def __init__(self, config: NomadConfig) -> None:
+        """Build the HTTP client for ``config``.
+
+        Raises:
+            NomadConfigError: If ``config.http2`` is set but the h2 package is missing.
+        """
         self._config = config
         headers = {"X-Nomad-Token": config.token} if config.token else {}
-        self._client = httpx2.AsyncClient(
-            base_url=f"{config.address.rstrip('/')}/v1",
-            headers=headers,
-            timeout=config.timeout,
-            verify=_build_verify(config),
-            cert=_build_client_cert(config),
-        )
+        try:
+            self._client = httpx2.AsyncClient(
+                base_url=f"{config.address.rstrip('/')}/v1",
+                headers=headers,
+                timeout=config.timeout,
+                verify=_build_verify(config),
+                cert=_build_client_cert(config),
+                http2=config.http2,
+                limits=httpx2.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive,
+                    keepalive_expiry=config.keepalive_expiry,
+                ),
+            )
+        except ImportError as exc:
+            msg = "http2 = true needs the h2 package: install h2 alongside nomadctl"
+            raise NomadConfigError(msg) from exc
         # Config is frozen, so namespace/region never change: build the base query
         # params once rather than rebuilding them on every request.
         self.default_params = _default_params(config)
+        # Latest X-Nomad-Index seen per request path, so a caller can long-poll a path
+        # from where its last read left off without threading the index through itself.
+        self._indexes: dict[str, int] = {}
+        self._extensions = (
+            {"sni_hostname": config.tls_server_name} if config.tls_server_name else None
+        )
+        self._breaker = CircuitBreaker(
+            threshold=CIRCUIT_BREAKER_THRESHOLD, cooldown=CIRCUIT_BREAKER_COOLDOWN_SECONDS
+        )
+        self._slots = asyncio.Semaphore(config.max_concurrency)
+        self._pacer = (
+            RateLimiter(rate=config.rate_limit, burst=config.rate_burst)
+            if config.rate_limit
+            else None
+        )
+        self.hooks: list[RequestHook] = []
 
     async def request(
         self,
@@ -46,44 +119,241 @@ class AsyncTransport:
         *,
         params: dict[str, Any] | None = None,
         json: Any = None,  # noqa: ANN401
+        index: int | None = None,
+        wait: float | None = None,
     ) -> httpx2.Response:
         """Perform a request, raising typed errors on failure.
 
+        Pass ``index`` (and optionally ``wait`` seconds) to make a Nomad blocking query:
+        the server holds the request until the path's ``X-Nomad-Index`` moves past
+        ``index`` or ``wait`` elapses. The client timeout is stretched to cover the wait
+        plus Nomad's jitter so a long poll is not cut off as a connection failure.
+
+        Retryable failures are retried as the class describes, and only the last one is
+        raised.
+
         Raises:
-            NomadConnectionError: If the agent is unreachable.
+            NomadConnectionError: If the agent is unreachable, or the circuit stays open.
             NomadHTTPError: If Nomad returns a non-2xx response.
         """
+        merged, timeout = self._query(params, index=index, wait=wait)
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(method, path, merged, json, timeout, attempt=attempt)
+            except httpx2.TransportError as exc:
+                retryable = method in _IDEMPOTENT_METHODS or isinstance(exc, _UNSENT_ERRORS)
+                if (delay := self._retry_delay(attempt, retryable=retryable)) is None:
+                    msg = f"Could not reach Nomad at {self._config.address}: {exc}"
+                    raise NomadConnectionError(msg) from exc
+            except NomadCircuitOpenError as exc:
+                if (delay := self._retry_delay(attempt, at_least=exc.retry_in)) is None:
+                    raise
+            else:
+                if response.is_success:
+                    self._record_index(path, response)
+                    return response
+                delay = self._retry_delay(
+                    attempt,
+                    retryable=_retryable_status(method, response.status_code),
+                    at_least=retry_after(response),
+                )
+                if delay is None:
+                    raise _http_error(method, path, response)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _query(
+        self, params: dict[str, Any] | None, *, index: int | None, wait: float | None
+    ) -> tuple[dict[str, Any], float]:
+        """Return a request's full query params and the client timeout it needs."""
         merged = {**self.default_params, **(params or {})}
-        extensions = (
-            {"sni_hostname": self._config.tls_server_name} if self._config.tls_server_name else None
+        timeout = self._config.timeout
+        if index is not None:
+            merged["index"] = index
+            if wait is not None:
+                merged["wait"] = _go_duration(wait)
+                timeout = max(timeout, _blocking_timeout(wait))
+        return merged, timeout
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any],
+        json: Any,  # noqa: ANN401
+        timeout: float,  # noqa: ASYNC109
+        *,
+        attempt: int,
+    ) -> httpx2.Response:
+        """Send one attempt through the limits and circuit breaker, reporting its outcome."""
+        queued_at = time.perf_counter()
+        if self._pacer is not None:
+            await self._pacer.acquire()
+        blocking = "index" in params
+        slot = contextlib.nullcontext() if blocking else self._slots
+        async with slot:
+            if not blocking:
+                self._breaker.admit()
+            sent_at = time.perf_counter()
+            try:
+                response = await self._client.request(
+                    method,
+                    path,
+                    params=params,
+                    json=json,
+                    extensions=self._extensions,
+                    timeout=timeout,
+                )
+            except httpx2.TransportError:
+                if not blocking:
+                    self._breaker.record_failure()
+                self._observe(method, path, None, attempt, queued_at, sent_at)
+                raise
+            except BaseException:
+                if not blocking:
+                    self._breaker.release()
+                raise
+        self._observe(method, path, response, attempt, queued_at, sent_at)
+        if blocking:
+            return response
+        if response.status_code in _REFUSED_STATUSES or response.is_server_error:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
+
+    def _observe(
+        self,
+        method: str,
+        path: str,
+        response: httpx2.Response | None,
+        attempt: int,
+        queued_at: float,
+        sent_at: float,
+    ) -> None:
+        """Hand the record of one attempt to every hook, when any are listening."""
+        hooks = [*global_hooks(), *self.hooks]
+        if not hooks:
+            return
+        record = RequestRecord(
+            method=method,
+            path=path,
+            status=None if response is None else response.status_code,
+            bytes=0 if response is None else len(response.content),
+            queued=sent_at - queued_at,
+            latency=time.perf_counter() - sent_at,
+            attempt=attempt,
         )
+        if response is not None:
+            attach_record(response, record)
+        for hook in hooks:
+            hook(record)
+
+    def _retry_delay(
+        self, attempt: int, *, retryable: bool = True, at_least: float = 0.0
+    ) -> float | None:
+        """Return how long to wait before retrying a failed attempt, or None to give up.
+
+        ``at_least`` is a delay the failure itself asked for (Retry-After, or the time
+        until the circuit admits a probe); one beyond `RETRY_AFTER_MAX_SECONDS` is not
+        worth waiting for.
+        """
+        if not retryable or attempt >= self._config.retries or at_least > RETRY_AFTER_MAX_SECONDS:
+            return None
+        return max(at_least, backoff(attempt, self._config.retry_backoff))
+
+    async def stream_lines(
+        self, path: str, *, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[str]:
+        """Open a long-lived streaming GET and yield each non-empty line of the body.
+
+        Used for Nomad's newline-delimited event stream. The connection stays open until
+        the caller stops iterating or the server closes it.
+
+        Raises:
+            NomadConnectionError: If the agent is unreachable or the stream drops.
+            NomadHTTPError: If Nomad refuses the stream with a non-2xx response.
+        """
+        merged = {**self.default_params, **(params or {})}
+        # Opening a stream is paced like any request, but it idles between events, so it
+        # does not hold one of the concurrency slots.
+        if self._pacer is not None:
+            await self._pacer.acquire()
         try:
-            response = await self._client.request(
-                method, path, params=merged, json=json, extensions=extensions
-            )
+            async with self._client.stream(
+                "GET", path, params=merged, extensions=self._extensions
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    error = _http_error("GET", path, response)
+                    raise error
+                async for line in response.aiter_lines():
+                    if line:
+                        yield line
         except httpx2.TransportError as exc:
-            msg = f"Could not reach Nomad at {self._config.address}: {exc}"
+            msg = f"Lost stream from Nomad at {self._config.address}: {exc}"
             raise NomadConnectionError(msg) from exc
 
-        if response.is_success:
-            return response
-        raise _http_error(method, path, response)
+    def last_index(self, path: str) -> int:
+        """Return the latest ``X-Nomad-Index`` seen for ``path``, or 0 when none was reported."""
+        return self._indexes.get(path, 0)
+
+    def _record_index(self, path: str, response: httpx2.Response) -> None:
+        """Remember the response's ``X-Nomad-Index`` for ``path`` when Nomad reports one."""
+        raw = response.headers.get("X-Nomad-Index")
+        if raw is None:
+            return
+        try:
+            self._indexes[path] = int(raw)
+        except ValueError:
+            return
 
     async def paginate(
         self,
         path: str,
         *,
         params: dict[str, Any] | None = None,
+        index: int | None = None,
+        wait: float | None = None,
+        prefetch: bool = False,
     ) -> AsyncIterator[httpx2.Response]:
-        """Yield successive pages, following Nomad's next-token pagination."""
+        """Yield successive pages, following Nomad's next-token pagination.
+
+        ``index``/``wait`` make the listing a blocking query (see ``request``). With
+        ``prefetch``, the next page is requested before the current one is yielded, so
+        the caller decodes one page while the next is in flight; at most two pages are
+        held at once either way.
+        """
         page_params = dict(params or {})
-        while True:
-            response = await self.request("GET", path, params=page_params)
-            yield response
-            next_token = response.headers.get("X-Nomad-Nexttoken")
-            if not next_token:
-                return
-            page_params["next_token"] = next_token
+        upcoming: asyncio.Task[httpx2.Response] | None = None
+        response = await self.request("GET", path, params=page_params, index=index, wait=wait)
+        try:
+            while True:
+                next_token = response.headers.get("X-Nomad-Nexttoken")
+                if next_token:
+                    page_params = {**page_params, "next_token": next_token}
+                if next_token and prefetch:
+                    upcoming = asyncio.create_task(
+                        self.request("GET", path, params=page_params, index=index, wait=wait)
+                    )
+                    # Let the task put its request on the wire before the caller starts
+                    # decoding, which would otherwise hold the loop until it finished.
+                    await asyncio.sleep(0)
+                yield response
+                if not next_token:
+                    return
+                if upcoming is not None:
+                    response, upcoming = await upcoming, None
+                else:
+                    response = await self.request(
+                        "GET", path, params=page_params, index=index, wait=wait
+                    )
+        finally:
+            # A caller that stops early must not leave the prefetched request running, and
+            # a prefetch that already failed is retrieved so asyncio does not log it.
+            if upcoming is not None and not upcoming.cancel() and not upcoming.cancelled():
+                upcoming.exception()
 
     async def aclose(self) -> None:
         """Close the underlying HTTP client."""
@@ -108,6 +378,27 @@ def _default_params(config: NomadConfig) -> dict[str, str]:
     return params
 
 
+def _go_duration(seconds: float) -> str:
+    """Render seconds as a Go duration string (``"5s"``, ``"2.5s"``) for the ``wait`` param."""
+    return f"{seconds:g}s"
+
+
+def _blocking_timeout(wait: float) -> float:
+    """Return the client timeout that outlasts a blocking query's server-side hold.
+
+    Nomad adds up to ``wait / 16`` of random jitter to each blocking query, so the
+    client waits for that plus a margin for the response itself.
+    """
+    return wait + wait / 16 + BLOCKING_QUERY_TIMEOUT_MARGIN_SECONDS
+
+
+def _retryable_status(method: str, status: int) -> bool:
+    """Return True when a request that got ``status`` may be sent again."""
+    if status in _REFUSED_STATUSES:
+        return True
+    return status in _TRANSIENT_STATUSES and method in _IDEMPOTENT_METHODS
+
+
 def _build_verify(config: NomadConfig) -> ssl.SSLContext | bool:
     """Build the TLS verification context from the configured CA cert."""
     if config.ca_cert:
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 from nclutils import pp
 
+from nd.daemon.client import fetch_snapshot
 from nd.nomad import NomadClient
 from nd.targets.selection import pick_single, resolve_targets, select_one_candidate
 from nd.ui.prompts import PromptUnavailableError, require_prompt
@@ -86,9 +87,12 @@ async def resolve_alloc_task(
 
     With ``running_only`` (the default) only running jobs, allocations, and tasks are
     offered. ``nd logs`` passes ``running_only=False`` so a dead or completed task's logs
-    are still reachable. Returns the resolved target, or None when nothing is selectable
-    and no job was named, or the user cancels a prompt (the caller exits 0). Each of
-    those cases reports itself.
+    are still reachable. Jobs and allocations come from a running ``nd daemon`` when one
+    mirrors the client's cluster.
+
+    Returns the resolved target, or None when nothing is selectable and no job was
+    named, or the user cancels a prompt (the caller exits 0). Each of those cases
+    reports itself.
 
     Raises:
         SelectionError: If an argument matches nothing selectable (the caller exits 1).
@@ -97,9 +101,10 @@ async def resolve_alloc_task(
     """
     target_filter = _TargetFilter(running_only=running_only)
     qualifier = target_filter.qualifier
-    jobs = await client.jobs.list()
+    snapshot = await fetch_snapshot(client.config)
+    jobs = snapshot.jobs if snapshot is not None else await client.jobs.list()
     candidates = target_filter.jobs(jobs)
-    pp.debug(f"GET /v1/jobs -> {len(candidates)} selectable of {len(jobs)} jobs")
+    pp.debug(f"Jobs -> {len(candidates)} selectable of {len(jobs)} jobs")
     # A named job that is not selectable must fail loudly even when nothing is running,
     # so only the unnamed case exits soft; the named one falls through to the miss below.
     if not candidates and job_arg is None:
@@ -118,11 +123,13 @@ async def resolve_alloc_task(
         pp.info("Nothing selected")
         return None
 
-    allocs = await client.jobs.allocations(job.id)
-    alloc_candidates = target_filter.allocs(allocs)
-    pp.debug(
-        f"GET /v1/job/{job.id}/allocations -> {len(alloc_candidates)} selectable of {len(allocs)}"
+    allocs = (
+        [a for a in snapshot.allocations if a.job_id == job.id]
+        if snapshot is not None
+        else await client.jobs.allocations(job.id)
     )
+    alloc_candidates = target_filter.allocs(allocs)
+    pp.debug(f"{job.id} allocations -> {len(alloc_candidates)} selectable of {len(allocs)}")
     if not alloc_candidates:
         msg = f"No {qualifier}allocations for '{job.name}'"
         raise SelectionError(msg)
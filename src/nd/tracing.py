@@ -0,0 +1,228 @@
+"""Optional tracing of command phases and Nomad requests, exported as OTLP JSON.
+
+Tracing is off unless ``nd --trace FILE`` (or ``ND_TRACE``) turns it on, and `span` is
+then a near no-op. When on, every `span` and every Nomad request becomes an
+OpenTelemetry span, and the whole trace is written when the command exits as one
+OTLP/JSON ``ExportTraceServiceRequest``, the format an OpenTelemetry Collector's
+``otlpjsonfile`` receiver and most trace viewers read. Nothing is sent over the
+network, so no OpenTelemetry package is needed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import secrets
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from nd import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from nd.nomad.instrument import RequestRecord
+
+# OTLP span kinds and status codes used here.
+_KIND_INTERNAL = 1
+_KIND_CLIENT = 3
+_STATUS_ERROR = 2
+
+type AttributeValue = str | int | float | bool
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed operation; ``parent_id`` is empty for the command's root span."""
+
+    name: str
+    span_id: str
+    parent_id: str
+    start_ns: int
+    kind: int = _KIND_INTERNAL
+    end_ns: int = 0
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    error: str | None = None
+
+    def set(self, key: str, value: AttributeValue) -> None:
+        """Attach an attribute, e.g. whether a compile was served from cache."""
+        self.attributes[key] = value
+
+
+class Tracer:
+    """Collect the spans of one command run under a single trace ID."""
+
+    def __init__(self) -> None:
+        self.trace_id = secrets.token_hex(16)
+        self.spans: list[Span] = []
+
+    def start(self, name: str, parent: Span | None, **attributes: AttributeValue) -> Span:
+        """Open a span now, as a child of ``parent``."""
+        return Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else "",
+            start_ns=time.time_ns(),
+            attributes=dict(attributes),
+        )
+
+    def end(self, span: Span) -> None:
+        """Close ``span`` now and keep it for export."""
+        span.end_ns = time.time_ns()
+        self.spans.append(span)
+
+    def record_request(self, record: RequestRecord) -> None:
+        """Turn a finished Nomad request into a client span under the current span.
+
+        A request hook runs as the attempt completes, so the span is back-dated by the
+        attempt's latency.
+        """
+        end_ns = time.time_ns()
+        parent = _CURRENT.get()
+        span = Span(
+            name=f"{record.method} {record.endpoint.partition(' ')[2]}",
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else "",
+            start_ns=end_ns - int(record.latency * 1e9),
+            end_ns=end_ns,
+            kind=_KIND_CLIENT,
+            attributes={
+                "http.request.method": record.method,
+                "url.path": f"/v1{record.path}",
+                "http.response.body.size": record.bytes,
+                "nd.queued_ms": round(record.queued * 1000, 3),
+                "nd.retry_attempt": record.attempt,
+            },
+        )
+        if record.status is not None:
+            span.set("http.response.status_code", record.status)
+        if record.failed:
+            span.error = f"HTTP {record.status}" if record.status else "no response"
+        self.spans.append(span)
+
+    def export(self) -> dict[str, Any]:
+        """Return every span as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _attributes(
+                            {"service.name": "nd", "service.version": __version__}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "nd", "version": __version__},
+                            "spans": [self._otlp(span) for span in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _otlp(self, span: Span) -> dict[str, Any]:
+        """Render one span in OTLP/JSON form (64-bit integers as strings)."""
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": _attributes(span.attributes),
+        }
+        if span.parent_id:
+            otlp["parentSpanId"] = span.parent_id
+        if span.error is not None:
+            otlp["status"] = {"code": _STATUS_ERROR, "message": span.error}
+        return otlp
+
+
+# Context variables rather than module state, so the trace follows the command into
+# asyncio tasks and worker threads that copy the context, and tests stay isolated.
+_TRACER: ContextVar[Tracer | None] = ContextVar("nd_tracer", default=None)
+_CURRENT: ContextVar[Span | None] = ContextVar("nd_span", default=None)
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: AttributeValue) -> Generator[Span | None]:
+    """Time the enclosed block as a span, nested under the span that is current.
+
+    Yields the span so the block can add attributes, or None while tracing is off. An
+    exception escaping the block marks the span failed and propagates.
+    """
+    tracer = _TRACER.get()
+    if tracer is None:
+        yield None
+        return
+    current = tracer.start(name, _CURRENT.get(), **attributes)
+    token = _CURRENT.set(current)
+    try:
+        yield current
+    except Exception as exc:
+        current.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _CURRENT.reset(token)
+        tracer.end(current)
+
+
+def start_tracing(destination: str, command: str) -> Callable[[], None]:
+    """Trace the rest of the process under a root span named after ``command``.
+
+    Args:
+        destination: File to write the trace to, or ``-`` for stdout.
+        command: The invoked command line, e.g. ``nd run``.
+
+    Returns:
+        A callback that ends the root span and writes the trace; call it on exit.
+    """
+    from nd.nomad.instrument import add_request_hook, remove_request_hook
+
+    tracer = Tracer()
+    root = tracer.start(command, None)
+    # Left set for the rest of the run: asyncio.run and the worker pools copy the
+    # context, so everything the command does nests under the root span.
+    tracer_token = _TRACER.set(tracer)
+    root_token = _CURRENT.set(root)
+    add_request_hook(tracer.record_request)
+
+    def finish() -> None:
+        remove_request_hook(tracer.record_request)
+        tracer.end(root)
+        _CURRENT.reset(root_token)
+        _TRACER.reset(tracer_token)
+        _write(tracer.export(), destination)
+
+    return finish
+
+
+def _write(trace: dict[str, Any], destination: str) -> None:
+    """Write one trace document as a JSON line to ``destination`` (``-`` is stdout)."""
+    import msgspec
+
+    body = msgspec.json.encode(trace) + b"\n"
+    if destination == "-":
+        sys.stdout.buffer.write(body)
+        sys.stdout.flush()
+    else:
+        Path(destination).expanduser().write_bytes(body)
+
+
+def _attributes(values: dict[str, AttributeValue]) -> list[dict[str, Any]]:
+    """Render attributes as OTLP key/value pairs, typed by their Python type."""
+    rendered = []
+    for key, value in values.items():
+        if isinstance(value, bool):
+            typed: dict[str, Any] = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": value}
+        rendered.append({"key": key, "value": typed})
+    return rendered
@@ -3,31 +3,46 @@
 Runs N async workers at once and renders a single Rich ``Live`` panel: a spinner
 for in-flight rows, an outcome glyph for finished ones, with per-row phase text
 and elapsed time. Used by ``nd stop`` (drain) and ``nd run`` (deploy).
+
+Workers never render: an update only marks the row dirty, and the panel is rebuilt on
+``Live``'s own refresh tick, at most once per frame, from per-row cells cached until
+the row changes. `run_event_lines` is the headless alternative for CI, reporting the
+same progress as JSON lines without any rendering.
 """
 
 from __future__ import annotations
 
 import asyncio
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Protocol
 
+import msgspec
 from nclutils import pp
 from rich import box
 from rich.live import Live
 from rich.spinner import Spinner
 from rich.table import Table
+from rich.text import Text
 
 from nd.ui.duration import fmt_elapsed
+from nd.ui.output import ProgressOutput
 from nd.ui.panels import titled_panel
 from nd.ui.styles import OUTCOME_GLYPH
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Sequence
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
 
-    from rich.console import Console
+    from rich.console import Console, ConsoleRenderable, RenderableType, RichCast
     from rich.panel import Panel
 
+    # One table line of a row, bar its elapsed cell for the parent line.
+    type _Line = tuple[RenderableType, ...]
+    # A line with its markup strings already rendered to Text, as the panel caches it.
+    type _RenderedLine = tuple[ConsoleRenderable | RichCast, ...]
+
 
 @dataclass(frozen=True)
 class LiveChild:
@@ -89,14 +104,40 @@ def _last_siblings(children: list[LiveChild]) -> list[bool]:
     return result
 
 
-def _build_panel(rows: list[LiveRow], *, title: str, now: float) -> Panel:
-    """Render the panel: a spinner for in-flight rows, a glyph for finished ones.
+def _row_lines(row: LiveRow) -> list[_Line]:
+    """Build a row's table lines: its parent line, then one line per detail row.
 
-    Parent rows are bold and carry the spinner/glyph; child rows nest under them
-    with a tree marker indented inside the label column so the text follows the
-    tree rather than staying flush left. A dim hairline separates each parent
-    group, and a parent's detail rows dim once it finishes healthy so the eye
-    stays on the rows still in flight.
+    The parent line is bold and carries the spinner/glyph but not the elapsed cell,
+    which changes every second and is added when the panel is assembled. Child rows
+    nest under it with a tree marker indented inside the label column so the text
+    follows the tree rather than staying flush left, and dim once the parent finishes
+    healthy so the eye stays on the rows still in flight.
+    """
+    glyph = Spinner("dots") if row.glyph is None else row.glyph
+    lines: list[_Line] = [(glyph, f"[bold]{row.label}[/]", row.phase)]
+    # A healthy finish lets the detail rows recede; failures stay bright so
+    # the tasks remain readable while debugging.
+    recede = row.glyph == OUTCOME_GLYPH["ok"]
+    for child, is_last in zip(row.children, _last_siblings(row.children), strict=True):
+        cells = [*child.cells, "", "", ""][:3]  # pad/truncate to the 3 detail columns
+        connector = "└" if is_last else "├"
+        detail = (f"[dim]{'  ' * child.depth}{connector}[/] {cells[0]}", cells[1], cells[2])
+        if recede:
+            detail = tuple(f"[dim]{cell}[/]" for cell in detail)
+        lines.append(("", *detail))
+    return lines
+
+
+def _elapsed(row: LiveRow, now: float) -> str:
+    """Format a row's elapsed time, frozen at its end once finished."""
+    ended = row.ended_at if row.ended_at is not None else now
+    return fmt_elapsed(ended - row.started_at)
+
+
+def _assemble(groups: Iterable[tuple[Sequence[_Line], str]], title: str) -> Panel:
+    """Lay out each row's lines and elapsed label as one group of the panel's table.
+
+    A dim hairline separates each parent group.
     """
     # A real table (not Table.grid) so add_section() can draw a dim hairline
     # between groups; show_edge=False keeps the rule internal, collapse_padding
@@ -116,27 +157,87 @@ def _build_panel(rows: list[LiveRow], *, title: str, now: float) -> Panel:
     table.add_column(no_wrap=True)  # label, tree-indented for children
     table.add_column()  # phase / role
     table.add_column(justify="right")  # elapsed / status
-    for index, row in enumerate(rows):
+    for index, (lines, elapsed) in enumerate(groups):
         if index:
             table.add_section()  # dim hairline giving each group room to breathe
-        glyph = Spinner("dots") if row.glyph is None else row.glyph
-        ended = row.ended_at if row.ended_at is not None else now
-        table.add_row(
-            glyph, f"[bold]{row.label}[/]", row.phase, fmt_elapsed(ended - row.started_at)
-        )
-        # A healthy finish lets the detail rows recede; failures stay bright so
-        # the tasks remain readable while debugging.
-        recede = row.glyph == OUTCOME_GLYPH["ok"]
-        for child, is_last in zip(row.children, _last_siblings(row.children), strict=True):
-            cells = [*child.cells, "", "", ""][:3]  # pad/truncate to the 3 detail columns
-            connector = "└" if is_last else "├"
-            detail = (f"[dim]{'  ' * child.depth}{connector}[/] {cells[0]}", cells[1], cells[2])
-            if recede:
-                detail = tuple(f"[dim]{cell}[/]" for cell in detail)
-            table.add_row("", *detail)
+        parent, *details = lines
+        table.add_row(*parent, elapsed)
+        for detail in details:
+            table.add_row(*detail)
     return titled_panel(table, title)
 
 
+def _build_panel(rows: list[LiveRow], *, title: str, now: float) -> Panel:
+    """Render the panel from scratch: a spinner for in-flight rows, a glyph for finished ones."""
+    return _assemble(((_row_lines(row), _elapsed(row, now)) for row in rows), title)
+
+
+class _PanelRenderer:
+    """Build the live panel when ``Live`` refreshes, re-using what has not changed.
+
+    `mark` bumps a row's version and returns at once, so workers never render. On each
+    refresh only rows whose version moved are rebuilt, their markup parsed once into
+    ``Text`` by the console; the others keep their cached lines, spinner included, so
+    it keeps animating instead of restarting. With no row changed, no elapsed label
+    moved and the same title, the previous panel is returned as is.
+
+    ``Live`` calls this from its refresh thread while workers mark rows from the event
+    loop, which is why a row records the version it was built at rather than clearing a
+    dirty flag: a mark that lands mid-build is picked up on the next frame.
+    """
+
+    def __init__(
+        self, rows: list[LiveRow], *, title: str, console: Console, clock: Callable[[], float]
+    ) -> None:
+        self._rows = rows
+        self._title = title
+        self._console = console
+        self._clock = clock
+        self._versions: dict[int, int] = {}
+        self._built: dict[int, tuple[int, list[_RenderedLine]]] = {}
+        self._frame: tuple[str, list[str], list[int]] | None = None
+        self._panel: Panel | None = None
+
+    def mark(self, row: LiveRow) -> None:
+        """Note that ``row`` changed, for the next frame to rebuild."""
+        self._versions[id(row)] = self._versions.get(id(row), 0) + 1
+
+    def retitle(self, title: str) -> None:
+        """Swap the panel title from the next frame on."""
+        self._title = title
+
+    def __call__(self) -> Panel:
+        """Return the panel for this frame."""
+        now = self._clock()
+        versions = [self._versions.get(id(row), 0) for row in self._rows]
+        elapsed = [_elapsed(row, now) for row in self._rows]
+        frame = (self._title, elapsed, versions)
+        if self._panel is not None and frame == self._frame:
+            return self._panel
+        groups = [
+            (self._lines(row, version), label)
+            for row, version, label in zip(self._rows, versions, elapsed, strict=True)
+        ]
+        self._panel = _assemble(groups, self._title)
+        self._frame = frame
+        return self._panel
+
+    def _lines(self, row: LiveRow, version: int) -> list[_RenderedLine]:
+        """Return the row's lines, rebuilding them only when it changed since last built."""
+        cached = self._built.get(id(row))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        lines = [
+            tuple(
+                self._console.render_str(cell, highlight=False) if isinstance(cell, str) else cell
+                for cell in line
+            )
+            for line in _row_lines(row)
+        ]
+        self._built[id(row)] = (version, lines)
+        return lines
+
+
 async def run_live_panel(
     rows: list[LiveRow],
     worker: Callable[[LiveRow, PanelUpdate], Awaitable[None]],
@@ -149,8 +250,8 @@ async def run_live_panel(
     """Run ``worker`` for every row concurrently under one live panel.
 
     Each worker receives its row and an ``update(phase, children=())`` callback
-    that refreshes the row's phase text and optional indented detail rows, then
-    re-renders the panel. Workers set their own terminal glyph via ``finish_row``.
+    that sets the row's phase text and optional indented detail rows and marks the
+    row for the next frame to redraw. Workers set their own terminal glyph via ``finish_row``.
     When all workers finish the title swaps to ``final_title(elapsed_seconds)``.
 
     Args:
@@ -166,23 +267,102 @@ async def run_live_panel(
     """
     console = console or pp.console()
     start = clock()
+    renderer = _PanelRenderer(rows, title=running_title, console=console, clock=clock)
 
-    def panel(title: str) -> Panel:
-        return _build_panel(rows, title=title, now=clock())
-
-    with Live(panel(running_title), console=console, refresh_per_second=12) as live:
+    with Live(get_renderable=renderer, console=console, refresh_per_second=12) as live:
 
         async def run_one(row: LiveRow) -> None:
             def update(phase: str, children: Sequence[LiveChild] = ()) -> None:
                 row.phase = phase
                 row.children = list(children)
-                live.update(panel(running_title))
+                renderer.mark(row)
 
             await worker(row, update)
-            live.update(panel(running_title))
+            renderer.mark(row)
 
         await asyncio.gather(*(run_one(row) for row in rows))
-        live.update(panel(final_title(clock() - start)))
+        renderer.retitle(final_title(clock() - start))
+        live.refresh()
+
+
+async def run_event_lines(
+    rows: list[LiveRow],
+    worker: Callable[[LiveRow, PanelUpdate], Awaitable[None]],
+    *,
+    final_title: Callable[[float], str],
+    clock: Callable[[], float] = time.monotonic,
+) -> None:
+    """Run ``worker`` for every row concurrently, reporting progress as JSON lines.
+
+    The headless counterpart of `run_live_panel`: nothing is rendered. Each event is
+    one compact JSON object on stdout, with markup stripped, a UTC timestamp (``ts``)
+    and the seconds since the row started (``elapsed``):
+
+    - ``progress`` when an update changes a row's phase or detail rows, with the
+      detail rows (allocations and their tasks) as ``details``;
+    - ``finished`` when a row ends, with its outcome label as ``status``;
+    - ``done`` once every worker is finished, with the final title as ``summary``.
+
+    Args:
+        rows: Per-worker state rows; one per concurrent unit of work.
+        worker: Async callable receiving ``(row, update)``; responsible for
+            calling ``finish_row`` before returning.
+        final_title: Callable that receives elapsed seconds and returns the
+            summary of the ``done`` event.
+        clock: Monotonic clock callable used for elapsed-time accounting.
+    """
+    start = clock()
+
+    async def run_one(row: LiveRow) -> None:
+        last: tuple[str, list[dict[str, Any]]] | None = None
+
+        def update(phase: str, children: Sequence[LiveChild] = ()) -> None:
+            nonlocal last
+            row.phase = phase
+            row.children = list(children)
+            current = (_plain(phase), [_child_event(child) for child in row.children])
+            if current == last:
+                return  # a watch tick that moved nothing
+            last = current
+            _emit(
+                "progress",
+                job=_plain(row.label),
+                phase=current[0],
+                elapsed=round(clock() - row.started_at, 3),
+                details=current[1],
+            )
+
+        await worker(row, update)
+        ended = row.ended_at if row.ended_at is not None else clock()
+        _emit(
+            "finished",
+            job=_plain(row.label),
+            status=_plain(row.phase),
+            elapsed=round(ended - row.started_at, 3),
+        )
+
+    await asyncio.gather(*(run_one(row) for row in rows))
+    elapsed = clock() - start
+    _emit("done", summary=_plain(final_title(elapsed)), elapsed=round(elapsed, 3))
+
+
+def _plain(markup: str) -> str:
+    """Strip Rich markup, e.g. ``[green]deployed[/]`` becomes ``deployed``."""
+    return Text.from_markup(markup).plain
+
+
+def _child_event(child: LiveChild) -> dict[str, Any]:
+    """Describe one detail row by the panel's three detail columns."""
+    name, role, status = (_plain(cell) for cell in [*child.cells, "", "", ""][:3])
+    return {"name": name, "role": role, "status": status, "depth": child.depth}
+
+
+def _emit(event: str, **fields: Any) -> None:
+    """Write one JSON-lines progress event to stdout."""
+    record = {"ts": datetime.now(UTC).isoformat(timespec="milliseconds"), "event": event}
+    record.update(fields)
+    sys.stdout.write(msgspec.json.encode(record).decode() + "\n")
+    sys.stdout.flush()
 
 
 async def run_rows[I, O](  # noqa: PLR0913
@@ -194,6 +374,7 @@ async def run_rows[I, O](  # noqa: PLR0913
     finish_of: Callable[[O], tuple[str, str]],
     running_title: str,
     final_title: Callable[[list[O], float], str],
+    output: ProgressOutput = ProgressOutput.PANEL,
     clock: Callable[[], float] = time.monotonic,
 ) -> list[O]:
     """Run ``do_work`` for every item concurrently under one live panel.
@@ -202,7 +383,8 @@ async def run_rows[I, O](  # noqa: PLR0913
     ``LiveRow`` per item, runs ``do_work(item, update)`` for each, then stamps the row
     with ``finish_of(outcome)`` (its terminal glyph and label). Rows are keyed by
     identity, not label, so two items with the same display name never collapse into
-    one entry. Returns the outcomes in the original item order.
+    one entry. Returns the outcomes in the original item order. ``output`` picks the
+    live panel or, for CI, `run_event_lines`.
 
     Args:
         items: The units of work to run concurrently.
@@ -212,6 +394,7 @@ async def run_rows[I, O](  # noqa: PLR0913
         finish_of: Map an outcome to its ``(glyph, label)`` for the finished row.
         running_title: Panel title shown while work is in progress.
         final_title: Build the final title from the ordered outcomes and elapsed seconds.
+        output: Render a live panel, or write JSON-lines progress events instead.
         clock: Monotonic clock callable, injectable so tests avoid real wall-clock calls.
     """
     start = clock()
@@ -231,8 +414,14 @@ async def run_rows[I, O](  # noqa: PLR0913
     def ordered() -> list[O]:
         return [outcomes[id(row)] for _, row in pairs]
 
+    rows = [row for _, row in pairs]
+    if output is ProgressOutput.JSONL:
+        await run_event_lines(
+            rows, worker, final_title=lambda secs: final_title(ordered(), secs), clock=clock
+        )
+        return ordered()
     await run_live_panel(
-        [row for _, row in pairs],
+        rows,
         worker,
         running_title=running_title,
         final_title=lambda secs: final_title(ordered(), secs),
@@ -0,0 +1,12 @@
+"""The ``--output`` choices, kept apart from the live panel so option wiring stays light."""
+
+from __future__ import annotations
+
+import enum
+
+
+class ProgressOutput(enum.StrEnum):
+    """How ``run``/``stop``/``update`` report their rows' progress."""
+
+    PANEL = "panel"
+    JSONL = "jsonl"
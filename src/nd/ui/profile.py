@@ -0,0 +1,89 @@
+"""The ``--profile`` report: a per-endpoint summary of every Nomad request a command sent."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from nclutils import pp
+
+from nd.nomad.instrument import add_request_hook, remove_request_hook
+from nd.ui.panels import status_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.table import Table
+
+    from nd.nomad.instrument import RequestRecord
+
+_KIB = 1024
+
+
+def start_profile() -> Callable[[], None]:
+    """Record every request from now on, returning a callback that prints the report.
+
+    The report goes to stderr so it never mixes with a command's own output.
+    """
+    records: list[RequestRecord] = []
+    add_request_hook(records.append)
+
+    def finish() -> None:
+        remove_request_hook(records.append)
+        if records:
+            pp.err_console().print(profile_table(records))
+        else:
+            pp.err_console().print("No Nomad requests were sent")
+
+    return finish
+
+
+def profile_table(records: list[RequestRecord]) -> Table:
+    """Summarize ``records`` per endpoint, slowest endpoint (by total latency) first."""
+    groups: defaultdict[str, list[RequestRecord]] = defaultdict(list)
+    for record in records:
+        groups[record.endpoint].append(record)
+    table = status_table("ENDPOINT", "COUNT", "FAILED", "P50", "P95", "TOTAL", "BYTES", "DECODE")
+    for column in table.columns[1:]:
+        column.justify = "right"
+
+    def total(group: list[RequestRecord]) -> float:
+        return sum(record.latency for record in group)
+
+    for name, group in sorted(groups.items(), key=lambda item: total(item[1]), reverse=True):
+        latencies = sorted(record.latency for record in group)
+        failed = sum(1 for record in group if record.failed)
+        table.add_row(
+            name,
+            str(len(group)),
+            str(failed) if failed else "",
+            _ms(_percentile(latencies, 0.50)),
+            _ms(_percentile(latencies, 0.95)),
+            _ms(total(group)),
+            _size(sum(record.bytes for record in group)),
+            _ms(sum(record.decode for record in group)),
+        )
+    return table
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ascending, non-empty list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _ms(seconds: float) -> str:
+    """Format a duration in milliseconds."""
+    return f"{seconds * 1000:.1f}ms"
+
+
+def _size(count: int) -> str:
+    """Format a byte count with a binary unit."""
+    if count < _KIB:
+        return f"{count}B"
+    size = count / _KIB
+    for unit in ("KiB", "MiB"):
+        if size < _KIB:
+            return f"{size:.1f}{unit}"
+        size /= _KIB
+    return f"{size:.1f}GiB"
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import hcl2
+import msgspec
 from lark.exceptions import LarkError
 from nclutils import pp
 from nclutils.fs import find_files
 
-from nd.constants import JOB_FILE_GLOBS
-from nd.nomad.config import load_config_directories
+from nd.cachefiles import atomic_write_bytes, read_versioned
+from nd.constants import JOB_FILE_GLOBS, VOLUME_PARSE_MAX_WORKERS, VOLUME_PARSE_POOL_MIN_FILES
+from nd.nomad.config import default_cache_dir, load_config_directories
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+
 # Default capability applied when a host volume spec omits its own `capability` block,
 # matching the permissive default the homelab relies on for shared NFS-backed mounts.
 DEFAULT_CAPABILITIES: list[dict[str, str]] = [
@@ -25,6 +33,11 @@ DEFAULT_CAPABILITIES: list[dict[str, str]] = [
 # Minimum length for a quoted string (opening quote + content + closing quote)
 _MIN_QUOTED_LENGTH = 2
 
+# A host-volume spec must say `type = "host"` somewhere, so a file without that text
+# cannot be one and is skipped without running the (slow) HCL parser. Deliberately
+# loose: a job file with a host `volume` block also matches and is rejected by the parse.
+_HOST_TYPE_RE = re.compile(r'\btype\s*=\s*"host"')
+
 
 @dataclass(frozen=True)
 class VolumeSpec:
@@ -63,25 +76,137 @@ def _unquote(value: Any) -> Any:  # noqa: ANN401
     return value
 
 
-def parse_volume_spec(path: Path) -> VolumeSpec | None:
+class _ParsedVolume(msgspec.Struct, frozen=True, array_like=True):
+    """The registrable fields of a host-volume spec, independent of where it lives."""
+
+    name: str
+    capabilities: list[dict[str, str]]
+    relative_path: str | None
+
+
+class _ParseResult(msgspec.Struct, frozen=True, array_like=True):
+    """The outcome of parsing one file's text: a volume, not a volume, or a parse error."""
+
+    volume: _ParsedVolume | None = None
+    error: str | None = None
+
+
+class VolumeSpecCache:
+    """Parsed host-volume specs keyed by a hash of the file's contents.
+
+    A file whose contents were parsed before (as a volume, as some other HCL file, or
+    as unparseable) is answered from the cache without running the HCL parser again.
+    Stored as one JSON file under the XDG cache dir, keeping only the contents seen by
+    the last discovery. A missing or corrupt cache is treated as empty and a failed
+    write is logged at debug level, so the cache never fails discovery.
+    """
+
+    # Bump when the entry layout or the parse rules change so stale results are dropped.
+    _VERSION = 1
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or default_cache_dir() / "volumespecs.json"
+        self._known = self._read()
+        self._seen: dict[str, _ParseResult] = {}
+        self._changed = False
+
+    def lookup(self, text: str) -> _ParseResult | None:
+        """Return the cached result for ``text``, or None on a miss."""
+        key = _content_key(text)
+        result = self._known.get(key)
+        if result is not None:
+            self._seen[key] = result
+        return result
+
+    def store(self, text: str, result: _ParseResult) -> None:
+        """Record the parse result for ``text``."""
+        self._seen[_content_key(text)] = result
+        self._changed = True
+
+    def save(self) -> None:
+        """Write the results seen by this discovery, dropping contents no longer present."""
+        if not self._changed and self._seen.keys() == self._known.keys():
+            return
+        payload = msgspec.json.encode(_CacheFile(version=self._VERSION, results=self._seen))
+        atomic_write_bytes(self._path, payload, what="volume spec cache")
+
+    def _read(self) -> dict[str, _ParseResult]:
+        """Read the stored results, treating anything unreadable as an empty cache."""
+        stored = read_versioned(self._path, _CacheFile, self._VERSION, what="volume spec cache")
+        return stored.results if stored is not None else {}
+
+
+class _CacheFile(msgspec.Struct, frozen=True):
+    """The on-disk layout of the volume spec cache."""
+
+    version: int
+    results: dict[str, _ParseResult]
+
+
+def _content_key(text: str) -> str:
+    """Hash a file's contents into its cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parse_volume_spec(path: Path, cache: VolumeSpecCache | None = None) -> VolumeSpec | None:
     """Parse an HCL file into a `VolumeSpec`, or None if it is not a host volume.
 
     Returns None when the file does not parse as HCL, is not ``type = "host"``, or has
     no name, so non-volume files sharing the directory are skipped rather than failing
-    discovery.
+    discovery. A file that never mentions ``type = "host"`` is rejected without
+    parsing, and with a ``cache`` a file whose contents were parsed before is not
+    parsed again.
     """
+    text = _read_candidate(path)
+    if text is None:
+        return None
+
+    result = cache.lookup(text) if cache is not None else None
+    if result is None:
+        result = _parse_text(text)
+        if cache is not None:
+            cache.store(text, result)
+    return _to_spec(path, result)
+
+
+def _read_candidate(path: Path) -> str | None:
+    """Read a file that may be a host-volume spec, or None if it cannot be one."""
     try:
-        data: dict[str, Any] = hcl2.loads(path.read_text(encoding="utf-8"))
-    except (ValueError, OSError, LarkError) as exc:
+        text = path.read_text(encoding="utf-8")
+    except (ValueError, OSError) as exc:
         pp.debug(f"Skipping {path}: not parseable as HCL ({exc})")
         return None
+    return text if _HOST_TYPE_RE.search(text) is not None else None
+
+
+def _to_spec(path: Path, result: _ParseResult) -> VolumeSpec | None:
+    """Turn a parse result for ``path`` into a `VolumeSpec`, logging unparseable files."""
+    if result.error is not None:
+        pp.debug(f"Skipping {path}: not parseable as HCL ({result.error})")
+        return None
+    if result.volume is None:
+        return None
+    return VolumeSpec(
+        path=path,
+        name=result.volume.name,
+        capabilities=[dict(c) for c in result.volume.capabilities],
+        relative_path=result.volume.relative_path,
+    )
+
+
+def _parse_text(text: str) -> _ParseResult:
+    """Run the HCL parser over one file's text and extract the host-volume fields."""
+    try:
+        data: dict[str, Any] = hcl2.loads(text)
+    except (ValueError, LarkError) as exc:
+        return _ParseResult(error=str(exc))
 
     spec_type = _unquote(data.get("type"))
     spec_name = _unquote(data.get("name"))
     # An unresolved interpolation cannot be registered as a literal volume name, so a
     # spec with an interpolated name is skipped (mirrors jobfiles name handling).
     if spec_type != "host" or not spec_name or "${" in str(spec_name):
-        return None
+        return _ParseResult()
 
     capabilities = [
         {
@@ -97,33 +222,70 @@ def parse_volume_spec(path: Path) -> VolumeSpec | None:
     params = _first(data.get("parameters"))
     relative_path = _unquote(params.get("relative_path")) if isinstance(params, dict) else None
 
-    return VolumeSpec(
-        path=path,
-        name=str(spec_name),
-        capabilities=capabilities,
-        relative_path=relative_path,
+    return _ParseResult(
+        volume=_ParsedVolume(
+            name=str(spec_name),
+            capabilities=capabilities,
+            relative_path=relative_path,
+        )
     )
 
 
-def discover_volume_files(directories: list[Path]) -> list[VolumeSpec]:
+def discover_volume_files(
+    directories: list[Path], cache: VolumeSpecCache | None = None, *, parallel: bool = False
+) -> list[VolumeSpec]:
     """Find and parse host-volume specs in each existing directory, sorted by name.
 
     Files are discovered with the same globs as job files (``*.hcl``/``*.nomad``) and
     classified by content, so a directory may hold both job and volume specs. Missing
-    directories are skipped silently.
+    directories are skipped silently. A ``cache`` spares unchanged files the parse and
+    is saved once discovery finishes. With ``parallel``, enough uncached files are
+    parsed on a process pool; the result and its debug messages are the same either way.
     """
-    specs: list[VolumeSpec] = []
+    candidates: list[tuple[Path, str]] = []
     for directory in directories:
         if not directory.is_dir():
             continue
-        specs.extend(
-            spec
+        candidates.extend(
+            (path, text)
             for path in find_files(directory, globs=JOB_FILE_GLOBS)
-            if (spec := parse_volume_spec(path)) is not None
+            if (text := _read_candidate(path)) is not None
         )
+
+    results: dict[str, _ParseResult] = {}
+    if cache is not None:
+        for _, text in candidates:
+            if text not in results and (cached := cache.lookup(text)) is not None:
+                results[text] = cached
+    pending = list(dict.fromkeys(text for _, text in candidates if text not in results))
+    for text, result in zip(pending, _parse_all(pending, parallel=parallel), strict=True):
+        results[text] = result
+        if cache is not None:
+            cache.store(text, result)
+    if cache is not None:
+        cache.save()
+
+    specs = [
+        spec for path, text in candidates if (spec := _to_spec(path, results[text])) is not None
+    ]
     return sorted(specs, key=lambda s: s.name)
 
 
+def _parse_all(texts: list[str], *, parallel: bool) -> list[_ParseResult]:
+    """Parse each text in order, on a process pool when ``parallel`` and there are enough.
+
+    Lark is pure Python, so threads would serialize on the GIL; separate processes are
+    the only way to use more than one core. Workers are spawned rather than forked
+    because discovery runs inside the command's event loop, whose threads a fork would
+    copy in an undefined state.
+    """
+    workers = min(VOLUME_PARSE_MAX_WORKERS, os.process_cpu_count() or 1, len(texts))
+    if not parallel or workers < 2 or len(texts) < VOLUME_PARSE_POOL_MIN_FILES:  # noqa: PLR2004
+        return [_parse_text(text) for text in texts]
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(_parse_text, texts, chunksize=max(1, len(texts) // (workers * 4))))
+
+
 def load_volume_directories(config_path: Path | None = None) -> list[Path]:
     """Read the ``[volumes] directories`` list from the nd TOML config, expanding ``~``.
 
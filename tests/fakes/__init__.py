@@ -0,0 +1,6 @@
+"""Shared fakes for tests and benchmarks: a synthetic cluster and a local Nomad API."""
+
+from tests.fakes.cluster import Cluster, generate_cluster
+from tests.fakes.nomad import FakeNomad
+
+__all__ = ["Cluster", "FakeNomad", "generate_cluster"]
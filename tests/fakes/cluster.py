@@ -0,0 +1,176 @@
+"""Synthetic Nomad clusters built from nd's own response models.
+
+`generate_cluster` fabricates a cluster of any size with the mix of states a real one
+accumulates: drained and down nodes, dead and batch jobs, failed and rescheduled
+allocations, tasks that restarted, and freshly placed allocations whose ``TaskStates``
+is still null. It is seeded, so a given size and seed always yields the same cluster.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+from nd.nomad.models.agent import AgentMember
+from nd.nomad.models.allocation import AllocListStub, TaskState
+from nd.nomad.models.deployment import DeploymentListStub
+from nd.nomad.models.evaluation import EvalListStub
+from nd.nomad.models.job import JobListStub
+from nd.nomad.models.node import NodeListStub
+from nd.nomad.models.volume import HostVolumeListStub
+
+# 2026-01-01T00:00:00Z in Unix nanoseconds, the anchor for synthetic CreateTime values.
+_EPOCH_NS = 1_767_225_600_000_000_000
+_TASK_SETS = (("app",), ("app", "sidecar"), ("init", "app", "log-shipper"))
+_ALLOC_STATUSES = (
+    ("running", 80),
+    ("complete", 8),
+    ("failed", 5),
+    ("pending", 4),
+    ("lost", 3),
+)
+
+
+@dataclass
+class Cluster:
+    """Everything a fake Nomad serves, as lists of the models nd decodes."""
+
+    nodes: list[NodeListStub] = field(default_factory=list)
+    jobs: list[JobListStub] = field(default_factory=list)
+    allocations: list[AllocListStub] = field(default_factory=list)
+    deployments: list[DeploymentListStub] = field(default_factory=list)
+    evaluations: list[EvalListStub] = field(default_factory=list)
+    volumes: list[HostVolumeListStub] = field(default_factory=list)
+    members: list[AgentMember] = field(default_factory=list)
+    leader: str = ""
+
+
+def generate_cluster(*, nodes: int, jobs: int, allocs: int, seed: int = 0) -> Cluster:
+    """Fabricate a cluster of ``nodes`` clients, ``jobs`` jobs and ``allocs`` allocations.
+
+    Allocations are spread round-robin over jobs and randomly over nodes. Each job has a
+    deployment (service jobs) and an evaluation, every fourth node carries a ``data``
+    host volume, and three servers form the quorum.
+    """
+    rng = random.Random(seed)
+    cluster = Cluster(
+        nodes=[_node(i, rng) for i in range(nodes)],
+        jobs=[_job(i, rng) for i in range(jobs)],
+        members=[
+            AgentMember(
+                name=f"server-{i}.global",
+                addr=f"10.1.0.{i + 1}",
+                status="alive",
+                tags={"build": "1.9.0", "port": "4647", "region": "global", "dc": "dc1"},
+            )
+            for i in range(3)
+        ],
+        leader="10.1.0.1:4647",
+    )
+    # Every allocation belongs to a job, so a cluster without jobs has none.
+    cluster.allocations = [
+        _allocation(i, rng, cluster.jobs[i % jobs], cluster.nodes)
+        for i in range(allocs if jobs else 0)
+    ]
+    cluster.deployments = [
+        DeploymentListStub(
+            id=f"deploy-{job.id}",
+            job_id=job.id,
+            status=rng.choices(("successful", "running", "failed"), (90, 7, 3))[0],
+            job_version=rng.randrange(5),
+            create_index=job.create_index,
+            modify_index=job.modify_index,
+        )
+        for job in cluster.jobs
+        if job.type == "service"
+    ]
+    cluster.evaluations = [
+        EvalListStub(
+            id=f"eval-{job.id}",
+            job_id=job.id,
+            status="complete",
+            type=job.type,
+            triggered_by="job-register",
+            create_index=job.create_index,
+            modify_index=job.modify_index,
+        )
+        for job in cluster.jobs
+    ]
+    cluster.volumes = [
+        HostVolumeListStub(id=f"data-{node.id}", name="data", node_id=node.id, state="ready")
+        for node in cluster.nodes[::4]
+    ]
+    return cluster
+
+
+def _node(i: int, rng: random.Random) -> NodeListStub:
+    """Build the ``i``th client node: mostly ready, a few draining, ineligible or down."""
+    status = rng.choices(("ready", "down", "initializing"), (95, 4, 1))[0]
+    drain = status == "ready" and rng.random() < 0.02
+    return NodeListStub(
+        id=f"node-{i:06d}",
+        datacenter=f"dc{i % 3 + 1}",
+        name=f"client-{i:06d}",
+        node_class=rng.choice(("", "", "compute", "storage")),
+        address=f"10.0.{i // 250}.{i % 250 + 1}",
+        drain=drain,
+        scheduling_eligibility="ineligible" if drain else "eligible",
+        status=status,
+        version="1.9.0",
+        create_index=i + 1,
+        modify_index=i + 1,
+    )
+
+
+def _job(i: int, rng: random.Random) -> JobListStub:
+    """Build the ``i``th job: mostly running services, with some batch, system and dead."""
+    kind = rng.choices(("service", "batch", "system"), (80, 15, 5))[0]
+    status = "dead" if kind == "batch" and rng.random() < 0.5 else "running"
+    return JobListStub(
+        id=f"job-{i:05d}",
+        name=f"job-{i:05d}",
+        type=kind,
+        status=status,
+        priority=50,
+        submit_time=_EPOCH_NS + i,
+        create_index=i + 1,
+        modify_index=i + 1,
+    )
+
+
+def _allocation(
+    i: int, rng: random.Random, job: JobListStub, nodes: list[NodeListStub]
+) -> AllocListStub:
+    """Build the ``i``th allocation of ``job`` with per-task states that match its status."""
+    statuses, weights = zip(*_ALLOC_STATUSES, strict=True)
+    status = rng.choices(statuses, weights)[0]
+    create_time = _EPOCH_NS + i * 1_000_000_000
+    started = f"2026-01-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z"
+    task_states: dict[str, TaskState] | None
+    if status == "pending" and rng.random() < 0.5:
+        task_states = None  # freshly placed: Nomad sends TaskStates: null
+    else:
+        task_states = {
+            task: TaskState(
+                state={"running": "running", "pending": "pending"}.get(status, "dead"),
+                failed=status == "failed" and task == "app",
+                restarts=rng.choices((0, 1, 5), (85, 10, 5))[0],
+                started_at_raw=None if status == "pending" else started,
+            )
+            for task in rng.choice(_TASK_SETS)
+        }
+    return AllocListStub(
+        id=f"alloc-{i:08d}",
+        name=f"{job.id}.web[{i}]",
+        node_id=rng.choice(nodes).id if nodes else "",
+        job_id=job.id,
+        task_group="web",
+        client_status=status,
+        desired_status="run" if status in {"running", "pending"} else "stop",
+        # Half of the failed allocations have been rescheduled onto a replacement.
+        next_allocation=f"alloc-{i:08d}-next" if status == "failed" and i % 2 else "",
+        task_states_raw=task_states,
+        create_time=create_time,
+        create_index=job.create_index + i + 1,
+        modify_index=job.create_index + i + 1,
+    )
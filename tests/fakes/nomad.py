@@ -0,0 +1,307 @@
+"""A localhost fake of the Nomad HTTP API, served from a `Cluster`.
+
+`FakeNomad` runs a real HTTP server on an ephemeral port so ``NomadClient`` talks to
+it unchanged, through its own transport, pagination and blocking-query code. It covers
+the read endpoints nd uses, next-token pagination, the ``==``/``!=`` subset of bexpr
+``filter`` expressions that `nd.nomad.filters` builds, ``task_states=false`` pruning,
+and blocking queries: a request carrying ``index`` is held until that table changes or
+``wait`` elapses. Tests change the cluster through `upsert`/`remove`, which bump the
+Raft index and wake held queries.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+import msgspec
+
+from nd.nomad.config import NomadConfig
+from nd.nomad.models.agent import AgentMembers
+from nd.nomad.models.allocation import AllocListStub
+from nd.nomad.models.deployment import DeploymentListStub
+from nd.nomad.models.evaluation import EvalListStub
+from nd.nomad.models.job import JobListStub
+from nd.nomad.models.node import NodeListStub
+from nd.nomad.models.volume import HostVolumeListStub
+from tests.fakes.cluster import Cluster
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+type _Item = (
+    NodeListStub
+    | JobListStub
+    | AllocListStub
+    | DeploymentListStub
+    | EvalListStub
+    | HostVolumeListStub
+)
+
+# Cluster attribute holding each model, which is also the table a blocking query watches.
+_TABLES: dict[type, str] = {
+    NodeListStub: "nodes",
+    JobListStub: "jobs",
+    AllocListStub: "allocations",
+    DeploymentListStub: "deployments",
+    EvalListStub: "evaluations",
+    HostVolumeListStub: "volumes",
+}
+_LIST_PATHS = {f"/v1/{table}": table for table in _TABLES.values()}
+_JOB_PATH_RE = re.compile(r"^/v1/job/(?P<job_id>[^/]+)(?:/(?P<child>allocations|deployments))?$")
+_FILTER_TERM_RE = re.compile(r'^\s*(?P<field>\w+)\s*(?P<op>==|!=)\s*(?P<value>".*")\s*$')
+_GO_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_GO_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+# Nomad's default and maximum hold for a blocking query without (or with a huge) wait.
+_MAX_WAIT_SECONDS = 300.0
+
+
+class FakeNomad:
+    """Serve a `Cluster` over HTTP the way a Nomad agent would.
+
+    Use as a context manager; ``address`` and ``config()`` point a client at it.
+    ``page_size`` forces pagination on every listing even when the client does not ask
+    for it, and ``requests`` records each request's path and query for assertions.
+    """
+
+    def __init__(self, cluster: Cluster | None = None, *, page_size: int | None = None) -> None:
+        self.cluster = cluster or Cluster()
+        self.page_size = page_size
+        self.requests: list[str] = []
+        self._changed = threading.Condition()
+        self._indexes = {
+            table: max((_modify_index(item) for item in getattr(self.cluster, table)), default=1)
+            for table in _TABLES.values()
+        }
+        self._raft_index = max(self._indexes.values())
+        self._encoded: dict[str, tuple[int, bytes]] = {}
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def address(self) -> str:
+        """The ``http://host:port`` the fake listens on."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def config(self, **overrides: Any) -> NomadConfig:
+        """Return a `NomadConfig` aimed at this fake."""
+        return NomadConfig(address=self.address, **overrides)
+
+    def __enter__(self) -> Self:
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Stop serving, releasing any held blocking queries."""
+        with self._changed:
+            self._changed.notify_all()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def index(self, table: str) -> int:
+        """Return the Raft index at which ``table`` last changed."""
+        with self._changed:
+            return self._indexes[table]
+
+    def upsert(self, item: _Item) -> int:
+        """Add ``item``, or replace the one with its ID, and return the new Raft index."""
+        table = _TABLES[type(item)]
+        with self._changed:
+            self._raft_index += 1
+            items: list[_Item] = getattr(self.cluster, table)
+            position = next((i for i, old in enumerate(items) if old.id == item.id), None)
+            # Host volume stubs carry no indexes; everything else records when it changed.
+            if hasattr(item, "modify_index"):
+                created = self._raft_index if position is None else _create_index(items[position])
+                item = msgspec.structs.replace(
+                    item, create_index=created, modify_index=self._raft_index
+                )
+            if position is None:
+                items.append(item)
+            else:
+                items[position] = item
+            return self._bump(table)
+
+    def remove(self, item_type: type[_Item], item_id: str) -> int:
+        """Delete the ``item_type`` with ``item_id`` and return the new Raft index."""
+        table = _TABLES[item_type]
+        with self._changed:
+            self._raft_index += 1
+            items: list[_Item] = getattr(self.cluster, table)
+            items[:] = [item for item in items if item.id != item_id]
+            return self._bump(table)
+
+    def _bump(self, table: str) -> int:
+        """Record that ``table`` changed at the current Raft index and wake held queries."""
+        self._indexes[table] = self._raft_index
+        self._changed.notify_all()
+        return self._raft_index
+
+    def handle(self, method: str, target: str) -> tuple[int, bytes, dict[str, str]]:
+        """Answer one request, returning its status, body and extra headers."""
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        with self._changed:
+            self.requests.append(target)
+        if method == "PUT" and url.path in {"/v1/system/gc", "/v1/system/reconcile/summaries"}:
+            return HTTPStatus.OK, b"", {}
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, b"method not allowed", {}
+        if (payload := self._agent(url.path)) is not None:
+            return HTTPStatus.OK, msgspec.json.encode(payload), {}
+        if (table := _LIST_PATHS.get(url.path)) is not None:
+            return self._listing(table, query)
+        if (match := _JOB_PATH_RE.match(url.path)) is not None:
+            return self._job(match["job_id"], match["child"], query)
+        return HTTPStatus.NOT_FOUND, b"resource not found", {}
+
+    def _agent(self, path: str) -> object | None:
+        """Return the payload for the agent and status endpoints, or None for other paths."""
+        members = self.cluster.members
+        if path == "/v1/agent/members":
+            return AgentMembers(members=members)
+        if path == "/v1/agent/self":
+            return {"member": members[0] if members else {}}
+        if path == "/v1/status/leader":
+            return self.cluster.leader
+        return None
+
+    def _job(
+        self, job_id: str, child: str | None, query: dict[str, str]
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Answer ``/v1/job/:id`` and its allocations and deployments listings."""
+        if child is not None:
+            return self._listing(child, query, lambda item: item.job_id == job_id)
+        with self._changed:
+            job = next((j for j in self.cluster.jobs if j.id == job_id), None)
+            index = self._indexes["jobs"]
+        if job is None:
+            return HTTPStatus.NOT_FOUND, b"job not found", {}
+        return HTTPStatus.OK, msgspec.json.encode(job), {"X-Nomad-Index": str(index)}
+
+    def _listing(
+        self, table: str, query: dict[str, str], keep: Callable[[Any], bool] | None = None
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Answer a listing of ``table``: block if asked, then return one page."""
+        with self._changed:
+            if "index" in query:
+                since = int(query["index"])
+                wait = _parse_wait(query.get("wait"))
+                self._changed.wait_for(lambda: self._indexes[table] > since, timeout=wait)
+            index = self._indexes[table]
+            items = [item for item in getattr(self.cluster, table) if keep is None or keep(item)]
+        if "filter" in query:
+            matches = _compile_filter(query["filter"])
+            items = [item for item in items if matches(item)]
+            keep = matches
+        if query.get("task_states") == "false":
+            items = [msgspec.structs.replace(item, task_states_raw=None) for item in items]
+            keep = keep or (lambda _item: True)
+        headers = {"X-Nomad-Index": str(index)}
+        per_page = int(query["per_page"]) if "per_page" in query else self.page_size
+        if not per_page:
+            body = msgspec.json.encode(items) if keep else self._encode_table(table, index, items)
+            return HTTPStatus.OK, body, headers
+        start = 0
+        if (token := query.get("next_token")) is not None:
+            start = next((i for i, item in enumerate(items) if item.id == token), len(items))
+        page = items[start : start + per_page]
+        if start + per_page < len(items):
+            headers["X-Nomad-Nexttoken"] = items[start + per_page].id
+        return HTTPStatus.OK, msgspec.json.encode(page), headers
+
+    def _encode_table(self, table: str, index: int, items: list[_Item]) -> bytes:
+        """Encode a whole table, reusing the bytes until the table changes.
+
+        Large clusters are listed over and over by benchmarks and pollers, and the fake
+        should not spend longer encoding a listing than the client spends decoding it.
+        """
+        cached = self._encoded.get(table)
+        if cached is None or cached[0] != index:
+            cached = (index, msgspec.json.encode(items))
+            self._encoded[table] = cached
+        return cached[1]
+
+
+def _compile_filter(expression: str) -> Callable[[Any], bool]:
+    """Compile a bexpr filter of ``Field == "v"`` terms joined by all-``or`` or all-``and``.
+
+    Field names are Nomad's PascalCase JSON keys; anything more elaborate than the shapes
+    `nd.nomad.filters` produces is rejected so a test cannot silently match everything.
+    """
+    joiner = " or " if " or " in expression else " and "
+    terms = []
+    for raw in expression.split(joiner):
+        match = _FILTER_TERM_RE.match(raw)
+        if match is None:
+            msg = f"FakeNomad cannot evaluate filter {expression!r}"
+            raise ValueError(msg)
+        value = msgspec.json.decode(match["value"])
+        terms.append((match["field"], match["op"] == "==", value))
+
+    def matches(item: Any) -> bool:  # noqa: ANN401
+        encoded = msgspec.to_builtins(item)
+        results = ((encoded.get(field) == value) is wanted for field, wanted, value in terms)
+        return any(results) if joiner == " or " else all(results)
+
+    return matches
+
+
+def _modify_index(item: _Item) -> int:
+    """Return the index ``item`` last changed at, or 1 for models without indexes."""
+    return getattr(item, "modify_index", 1)
+
+
+def _create_index(item: _Item) -> int:
+    """Return the index ``item`` was created at, or 1 for models without indexes."""
+    return getattr(item, "create_index", 1)
+
+
+def _parse_wait(raw: str | None) -> float:
+    """Parse a Go duration such as ``"5s"`` or ``"1m30s"``, capped like Nomad's own."""
+    if not raw:
+        return _MAX_WAIT_SECONDS
+    seconds = sum(float(n) * _GO_UNITS[unit] for n, unit in _GO_DURATION_RE.findall(raw))
+    return min(seconds, _MAX_WAIT_SECONDS)
+
+
+def _handler_for(fake: FakeNomad) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler class bound to ``fake``."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self._respond("GET")
+
+        def do_PUT(self) -> None:
+            self._respond("PUT")
+
+        def do_DELETE(self) -> None:
+            self._respond("DELETE")
+
+        def _respond(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            status, body, headers = fake.handle(method, self.path)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Keep request logs out of test and benchmark output."""
+
+    return _Handler
@@ -27,7 +27,7 @@ def test_plan_no_directories_exits_clean(monkeypatch, tmp_path) -> None:
     import nd.commands.plan as plan_mod
 
     monkeypatch.setattr(plan_mod, "load_job_directories", list)
-    monkeypatch.setattr(plan_mod, "discover_job_files", lambda dirs: [])
+    monkeypatch.setattr(plan_mod, "discover_job_files", lambda dirs, index=None: [])
     from typer.testing import CliRunner
 
     from nd.cli import app
@@ -9,8 +9,10 @@ from typing import TYPE_CHECKING
 import httpx  # respx-bundled; used to build sequenced mock responses
 from typer.testing import CliRunner
 
+import nd.commands._watch as watch_mod
 import nd.commands.run as run_mod
 from nd.cli import app
+from nd.commands._specs import SpecPipeline
 from nd.commands.run import deploy_phase
 from nd.jobfiles import JobFile, candidates_for
 from nd.nomad import NomadClient, NomadConfig
@@ -98,6 +100,26 @@ def test_deploy_phase_reports_health() -> None:
     assert result == "running: 1/3 healthy"
 
 
+def test_deployment_settling_only_when_every_group_is_healthy() -> None:
+    """Verify a running deployment counts as settling only once all groups are healthy."""
+    from nd.nomad.models.deployment import Deployment, TaskGroupDeploymentState
+
+    # Given deployments that are fully healthy, partially healthy, and already finished
+    def dep(status: str, healthy: int) -> Deployment:
+        return Deployment(
+            id="d1",
+            job_id="web",
+            status=status,
+            task_groups={"app": TaskGroupDeploymentState(desired_total=2, healthy_allocs=healthy)},
+        )
+
+    # When / Then only the running, fully healthy one is about to flip to successful
+    assert run_mod.deployment_settling(dep("running", 2))
+    assert not run_mod.deployment_settling(dep("running", 1))
+    assert not run_mod.deployment_settling(dep("successful", 2))
+    assert not run_mod.deployment_settling(None)
+
+
 def test_task_lifecycle_orders_tasks_and_excludes_poststop() -> None:
     """Verify lifecycle parsing orders prestart, main, sidecar and drops poststop."""
     import msgspec
@@ -193,7 +215,7 @@ def test_run_no_candidates_exits_clean(monkeypatch) -> None:
     """Verify run exits 0 with a message when no deployable files exist."""
     # Given no job directories and no running jobs
     monkeypatch.setattr(run_mod, "load_job_directories", list)
-    monkeypatch.setattr(run_mod, "discover_job_files", lambda dirs: [])
+    monkeypatch.setattr(run_mod, "discover_job_files", lambda dirs, index=None: [])
     # Avoid a real Nomad call: stub the cluster job listing to empty.
     monkeypatch.setattr(run_mod, "_cluster_job_states", _async_return((set(), set())))
 
@@ -219,7 +241,7 @@ def test_register_detached_registers_without_watching(httpx2_mock: respx.Router,
     # When registering with detach
     async def go() -> int:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
-            return await run_mod._register_detached(client, [candidate], nomad)
+            return await run_mod._register_detached(client, [candidate], SpecPipeline(nomad))
 
     exit_code = asyncio.run(go())
 
@@ -241,7 +263,7 @@ def test_run_app_detach_skips_watch(
     monkeypatch.setattr(
         run_mod,
         "discover_job_files",
-        lambda dirs: [JobFile(path=Path("/j/web.hcl"), job_names=["web"])],
+        lambda dirs, index=None: [JobFile(path=Path("/j/web.hcl"), job_names=["web"])],
     )
     monkeypatch.setattr(run_mod, "_cluster_job_states", _async_return((set(), set())))
     # Isolate the config so NomadConfig.resolve() targets the mock, not a real ~/.config/nd.
@@ -382,7 +404,7 @@ def test_watch_ignores_stale_successful_deployment_from_prior_run(
     """Verify a re-run job's watch ignores the prior run's already-successful deployment."""
     # Given zero-duration timeout and poll interval so the test completes instantly
     monkeypatch.setattr(run_mod, "DEPLOY_TIMEOUT_SECONDS", 0.0)
-    monkeypatch.setattr(run_mod, "POLL_INTERVAL_SECONDS", 0.0)
+    monkeypatch.setattr(watch_mod, "POLL_INTERVAL_SECONDS", 0.0)
 
     # Given the only deployment present is a stale, already-successful one from the
     # previous run (created at index 1), while this registration happened at index 10
@@ -476,7 +498,7 @@ def test_watch_times_out_when_never_terminal(
     """Verify watch_deploy returns TIMEOUT when the deployment never reaches a terminal state."""
     # Given zero-duration timeout and poll interval so the test completes instantly
     monkeypatch.setattr(run_mod, "DEPLOY_TIMEOUT_SECONDS", 0.0)
-    monkeypatch.setattr(run_mod, "POLL_INTERVAL_SECONDS", 0.0)
+    monkeypatch.setattr(watch_mod, "POLL_INTERVAL_SECONDS", 0.0)
 
     # Given a deployment that perpetually stays in running state
     httpx2_mock.get(f"{_ADDR}/v1/job/web/deployments").respond(json=[_DEPLOY_LIST_STUB])
@@ -599,7 +621,7 @@ def test_run_clean_purges_dead_before_register(
     monkeypatch.setattr(
         run_mod,
         "discover_job_files",
-        lambda dirs: [JobFile(path=tmp_path / "web.hcl", job_names=["web"])],
+        lambda dirs, index=None: [JobFile(path=tmp_path / "web.hcl", job_names=["web"])],
     )
     monkeypatch.setattr(run_mod, "_cluster_job_states", _async_return((set(), {"web"})))
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
@@ -633,7 +655,7 @@ def test_run_clean_dry_run_does_not_purge(
     monkeypatch.setattr(
         run_mod,
         "discover_job_files",
-        lambda dirs: [JobFile(path=tmp_path / "web.hcl", job_names=["web"])],
+        lambda dirs, index=None: [JobFile(path=tmp_path / "web.hcl", job_names=["web"])],
     )
     monkeypatch.setattr(run_mod, "_cluster_job_states", _async_return((set(), {"web"})))
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
@@ -0,0 +1,74 @@
+"""Tests for the concurrent validate/compile pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nd.binary import NomadBinaryError
+from nd.commands._specs import SpecPipeline
+
+
+def test_pipeline_validates_files_concurrently(mocker) -> None:
+    """Verify validations overlap rather than running one file after another."""
+    # Given a binary whose validation only returns once two run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    nomad = mocker.MagicMock()
+    nomad.validate.side_effect = lambda _path: barrier.wait()
+
+    # When validating two files with two workers
+    async def go() -> None:
+        async with SpecPipeline(nomad, workers=2) as specs:
+            await specs.validate_all([Path("/j/a.hcl"), Path("/j/b.hcl")])
+
+    # Then both validations were in flight together (a serial run would break the barrier)
+    asyncio.run(go())
+    assert nomad.validate.call_count == 2
+
+
+def test_pipeline_compiles_a_shared_file_once(mocker) -> None:
+    """Verify two jobs from one file share a single compile."""
+    # Given a binary that compiles any file
+    nomad = mocker.MagicMock()
+    nomad.compile_to_json.return_value = b'{"Job": {}}'
+    path = Path("/j/multi.hcl")
+
+    # When two consumers ask for the same file's payload
+    async def go() -> list[bytes]:
+        async with SpecPipeline(nomad) as specs:
+            specs.prefetch([path, path])
+            return await asyncio.gather(specs.compiled(path), specs.compiled(path))
+
+    bodies = asyncio.run(go())
+
+    # Then both get the payload from one compile and one validation
+    assert bodies == [b'{"Job": {}}', b'{"Job": {}}']
+    nomad.compile_to_json.assert_called_once_with(path)
+    nomad.validate.assert_called_once_with(path)
+
+
+def test_pipeline_reports_first_failure_in_file_order(mocker) -> None:
+    """Verify the reported validation error follows file order, not completion order."""
+
+    # Given two failing files where the first one listed is the slower to fail
+    def validate(path: Path) -> None:
+        if path.name == "a.hcl":
+            time.sleep(0.05)
+        msg = f"{path.name} is invalid"
+        raise NomadBinaryError(msg)
+
+    nomad = mocker.MagicMock()
+    nomad.validate.side_effect = validate
+
+    # When validating both
+    async def go() -> None:
+        async with SpecPipeline(nomad, workers=2) as specs:
+            await specs.validate_all([Path("/j/a.hcl"), Path("/j/b.hcl")])
+
+    # Then the first file's error is the one raised
+    with pytest.raises(NomadBinaryError, match=r"a\.hcl"):
+        asyncio.run(go())
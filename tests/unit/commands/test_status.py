@@ -1,13 +1,23 @@
 """Tests for the status command."""
 
 import asyncio
+import io
+import random
 
+import msgspec
 import respx
 from nclutils import pp
 from rich.console import Console
 from typer.testing import CliRunner
 
-from nd.commands.status import Health, StatusReport, build_report
+from nd.commands.status import (
+    Health,
+    ReportBuilder,
+    StatusReport,
+    build_report,
+    build_status,
+    watch_status,
+)
 from nd.commands.status.report import (
     _alloc_run_start_ns,
     _rfc3339_to_ns,
@@ -21,6 +31,7 @@ from nd.nomad.models.evaluation import EvalListStub
 from nd.nomad.models.job import JobListStub
 from nd.nomad.models.node import NodeListStub
 from nd.nomad.models.volume import HostVolumeListStub
+from tests.fakes import FakeNomad, generate_cluster
 
 _CONFIG = NomadConfig(address="http://nomad.test:4646", region="global", namespace="default")
 
@@ -1104,6 +1115,90 @@ def test_collect_aggregates_all_endpoints(httpx2_mock: respx.Router, monkeypatch
     assert report.leader_name == "srv1"
 
 
+def test_collect_against_large_generated_cluster(monkeypatch, tmp_path):
+    """Verify _collect reads a paginated, generated cluster end to end without mocks."""
+    # Given a fake Nomad serving a generated cluster in pages of 250
+    cluster = generate_cluster(nodes=200, jobs=150, allocs=3000)
+    with FakeNomad(cluster, page_size=250) as fake:
+        monkeypatch.setenv("NOMAD_ADDR", fake.address)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        # When collecting status
+        from nd.commands.status import _collect
+
+        report, panels = asyncio.run(_collect(verbose=0))
+
+    # Then every page was read and the counts match the generated cluster
+    assert report.nodes_total == 200
+    assert report.nodes_ready == sum(n.status == "ready" for n in cluster.nodes)
+    assert report.allocs_running == sum(a.client_status == "running" for a in cluster.allocations)
+    assert len(panels) == 200
+
+
+def test_collect_tallies_allocations_page_by_page(monkeypatch, tmp_path):
+    """Verify _collect streams bounded allocation pages and reports as a whole listing would."""
+    # Given a fake Nomad with more allocations than one streamed page holds
+    from nd.nomad.resources.allocations import AllocationsResource
+
+    monkeypatch.setitem(AllocationsResource.iter_pages.__kwdefaults__, "per_page", 40)
+    cluster = generate_cluster(nodes=6, jobs=5, allocs=100)
+    with FakeNomad(cluster) as fake:
+        monkeypatch.setenv("NOMAD_ADDR", fake.address)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        # When collecting status
+        from nd.commands.status import _collect
+
+        report, panels = asyncio.run(_collect(verbose=0))
+        config = NomadConfig.resolve()
+
+    # Then the allocations arrived in three bounded pages, and the result equals one built
+    # from the whole listing
+    pages = [r for r in fake.requests if r.startswith("/v1/allocations")]
+    assert len(pages) == 3
+    assert all("per_page=40" in page for page in pages)
+    expected = build_status(
+        nodes=cluster.nodes,
+        jobs=cluster.jobs,
+        allocs=cluster.allocations,
+        config=config,
+        members=cluster.members,
+        leader=cluster.leader,
+        deployments=cluster.deployments,
+        evals=[e for e in cluster.evaluations if e.status not in {"complete", "canceled"}],
+        volumes=cluster.volumes,
+    )
+    assert report.allocs_total == expected[0].allocs_total == 100
+    assert report.node_alloc_counts == expected[0].node_alloc_counts
+    assert report.job_nodes == expected[0].job_nodes
+    assert panels == expected[1]
+
+
+def test_collect_filters_evaluations_and_prunes_task_states(monkeypatch, tmp_path):
+    """Verify _collect drops terminal evaluations server-side and, without hosts, task states."""
+    # Given a fake Nomad holding one terminal and one blocked evaluation
+    cluster = generate_cluster(nodes=3, jobs=2, allocs=6)
+    cluster.evaluations[1] = msgspec.structs.replace(cluster.evaluations[1], status="blocked")
+    with FakeNomad(cluster) as fake:
+        monkeypatch.setenv("NOMAD_ADDR", fake.address)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        # When collecting status without the per-host task breakdown
+        from nd.commands.status import _collect
+
+        report, panels = asyncio.run(_collect(verbose=0, hosts=False))
+
+    # Then evaluations were filtered server-side, allocations came without task states, and
+    # no host panels were built
+    evals = next(r for r in fake.requests if r.startswith("/v1/evaluations"))
+    allocs = next(r for r in fake.requests if r.startswith("/v1/allocations"))
+    assert "filter=" in evals
+    assert "task_states=false" in allocs
+    assert [e.id for e in report.evals_problem] == [cluster.evaluations[1].id]
+    assert panels == []
+    assert report.allocs_running == sum(a.client_status == "running" for a in cluster.allocations)
+
+
 def test_status_command_exits_zero(httpx2_mock: respx.Router, monkeypatch, tmp_path):
     """Verify the status command runs end to end and exits successfully."""
     # Given a fully mocked cluster and an isolated config environment
@@ -1383,3 +1478,190 @@ def test_render_report_shows_volumes_panel() -> None:
     assert "data" in text
     assert "n1" in text
     assert "n2" in text
+
+
+def _one_shot(cluster) -> tuple[StatusReport, list]:
+    """Build the report and host panels for a generated cluster from scratch."""
+    report = build_report(
+        nodes=cluster.nodes,
+        jobs=cluster.jobs,
+        allocs=cluster.allocations,
+        config=_CONFIG,
+        members=cluster.members,
+        leader=cluster.leader,
+        deployments=cluster.deployments,
+        evals=cluster.evaluations,
+        volumes=cluster.volumes,
+    )
+    panels = build_host_report(nodes=cluster.nodes, jobs=cluster.jobs, allocs=cluster.allocations)
+    return report, panels
+
+
+def _update_from(builder: ReportBuilder, cluster) -> None:
+    """Bring a builder up to every listing of a generated cluster."""
+    builder.update(
+        nodes=cluster.nodes,
+        jobs=cluster.jobs,
+        allocs=cluster.allocations,
+        members=cluster.members,
+        leader=cluster.leader,
+        deployments=cluster.deployments,
+        evals=cluster.evaluations,
+        volumes=cluster.volumes,
+    )
+
+
+def test_build_status_matches_separate_builders() -> None:
+    """Verify build_status's shared pass yields what build_report and build_host_report do."""
+    # Given a generated cluster mixing running, pending, failed, lost and retired allocations
+    cluster = generate_cluster(nodes=30, jobs=20, allocs=600, seed=3)
+    listings = {
+        "nodes": cluster.nodes,
+        "jobs": cluster.jobs,
+        "allocs": cluster.allocations,
+        "config": _CONFIG,
+        "members": cluster.members,
+        "leader": cluster.leader,
+        "deployments": cluster.deployments,
+        "evals": cluster.evaluations,
+        "volumes": cluster.volumes,
+    }
+
+    # When building both views together, and the report alone
+    both = build_status(**listings)
+    report_only = build_status(**listings, hosts=False)
+
+    # Then both match the separate builders, and the report alone carries no panels
+    assert both == _one_shot(cluster)
+    assert report_only == (both[0], [])
+
+
+def test_report_builder_matches_one_shot_builders_across_deltas() -> None:
+    """Verify ReportBuilder agrees with build_report and build_host_report after every delta."""
+    # Given a builder loaded with a generated cluster
+    rng = random.Random(7)
+    cluster = generate_cluster(nodes=12, jobs=10, allocs=150, seed=7)
+    builder = ReportBuilder(_CONFIG)
+    _update_from(builder, cluster)
+    assert (builder.report(), builder.host_panels()) == _one_shot(cluster)
+
+    # When applying a long run of random node, job and allocation deltas
+    for step in range(300):
+        table = rng.choice(("allocations", "allocations", "allocations", "jobs", "nodes"))
+        items = getattr(cluster, table)
+        victim = rng.randrange(len(items))
+        if table == "allocations":
+            changed = msgspec.structs.replace(
+                items[victim],
+                client_status=rng.choice(("running", "pending", "failed", "lost", "complete")),
+                desired_status=rng.choice(("run", "run", "stop", "evict")),
+                next_allocation=rng.choice(("", "", "next")),
+                node_id=rng.choice(cluster.nodes).id,
+            )
+            apply = builder.apply_allocs
+        elif table == "jobs":
+            changed = msgspec.structs.replace(
+                items[victim],
+                status=rng.choice(("running", "pending", "dead")),
+                name=rng.choice((items[victim].name, f"renamed-{step}")),
+            )
+            apply = builder.apply_jobs
+        else:
+            changed = msgspec.structs.replace(
+                items[victim],
+                status=rng.choice(("ready", "ready", "down")),
+                drain=rng.random() < 0.2,
+                name=rng.choice((items[victim].name, f"host-{step}")),
+            )
+            apply = builder.apply_nodes
+        if rng.random() < 0.15 and len(items) > 1:
+            removed = items.pop(victim)
+            apply(removed=[removed.id])
+        else:
+            items[victim] = changed
+            apply(upserted=[changed])
+
+        # Then the builder agrees with a from-scratch build at every step
+        assert (builder.report(), builder.host_panels()) == _one_shot(cluster), step
+
+
+def test_report_builder_reuses_outputs_a_delta_did_not_touch() -> None:
+    """Verify a node-only delta keeps the job outputs as the same objects and moves health."""
+    # Given a builder that has produced a report once
+    cluster = generate_cluster(nodes=5, jobs=4, allocs=20)
+    builder = ReportBuilder(_CONFIG)
+    _update_from(builder, cluster)
+    first = builder.report()
+
+    # When one node goes down
+    builder.apply_nodes(upserted=[msgspec.structs.replace(cluster.nodes[0], status="down")])
+    second = builder.report()
+
+    # Then the job outputs are reused while the node outputs and the verdict reflect it
+    assert second.jobs is first.jobs
+    assert second.job_statuses is first.job_statuses
+    assert second.nodes is not first.nodes
+    assert second.nodes_ready == first.nodes_ready - (cluster.nodes[0].status == "ready")
+    assert second.health is Health.CRITICAL
+
+
+def test_report_builder_update_applies_only_what_changed(monkeypatch) -> None:
+    """Verify update() skips a listing it already holds and diffs a new one into a delta."""
+    # Given a builder brought up to a cluster, recording the allocation deltas it applies
+    cluster = generate_cluster(nodes=3, jobs=3, allocs=30)
+    builder = ReportBuilder(_CONFIG)
+    _update_from(builder, cluster)
+    deltas = []
+    apply_allocs = builder.apply_allocs
+    monkeypatch.setattr(
+        builder,
+        "apply_allocs",
+        lambda upserted=(), removed=(): (
+            deltas.append((list(upserted), list(removed))),
+            apply_allocs(upserted, removed),
+        ),
+    )
+
+    # When updating with the same listing, then with a copy that changes one alloc and drops one
+    _update_from(builder, cluster)
+    changed = msgspec.structs.replace(cluster.allocations[0], client_status="failed")
+    dropped = cluster.allocations[1]
+    cluster.allocations = [changed, *cluster.allocations[2:]]
+    _update_from(builder, cluster)
+
+    # Then only the second update applied a delta, holding just the two differences
+    assert deltas == [([changed], [dropped.id])]
+    assert builder.report() == _one_shot(cluster)[0]
+
+
+def test_watch_status_redraws_when_the_cluster_changes() -> None:
+    """Verify nd status --watch draws the dashboard, then redraws it when a job appears."""
+    # Given a fake Nomad and a console capturing the live display
+    cluster = generate_cluster(nodes=3, jobs=2, allocs=6)
+    fresh = msgspec.structs.replace(cluster.jobs[0], id="zz-fresh", name="zz-fresh")
+    console = Console(file=io.StringIO(), force_terminal=True, width=140, height=200)
+
+    async def wait_for(text: str) -> None:
+        for _ in range(100):
+            if text in console.file.getvalue():
+                return
+            await asyncio.sleep(0.05)
+        msg = f"{text!r} never drawn"
+        raise AssertionError(msg)
+
+    # When watching, then registering a job once the first dashboard is up
+    async def watch(fake: FakeNomad) -> None:
+        watcher = asyncio.create_task(watch_status(fake.config(), hosts=False, console=console))
+        try:
+            await wait_for(cluster.jobs[1].name)
+            fake.upsert(fresh)
+            await wait_for("zz-fresh")
+        finally:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+
+    with FakeNomad(cluster) as fake:
+        asyncio.run(watch(fake))
+
+    # Then the redraw carries the new job under the watching caption
+    assert "Watching" in console.file.getvalue()
@@ -237,6 +237,35 @@ def test_stop_and_wait_skips_transient_alloc_decode_error(httpx2_mock: respx.Rou
     assert outcome.status is StopStatus.STOPPED
 
 
+def test_stop_and_wait_blocks_on_alloc_index_instead_of_sleeping(httpx2_mock: respx.Router, mocker):
+    """Verify the drain long-polls from the reported index rather than sleeping between reads."""
+    # Given a stop call and an allocations endpoint that reports an index
+    httpx2_mock.delete(f"{_ADDR}/v1/job/web").respond(json={"EvalID": "e1"})
+    route = httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").mock(
+        side_effect=[
+            httpx.Response(200, json=[_alloc_json("running")], headers={"X-Nomad-Index": "10"}),
+            httpx.Response(200, json=[_alloc_json("complete")], headers={"X-Nomad-Index": "11"}),
+        ]
+    )
+    sleep = mocker.patch("nd.commands.stop.asyncio.sleep", autospec=True)
+
+    # When stopping and waiting
+    async def run() -> object:
+        async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
+            return await stop_and_wait(
+                client, _job("web"), purge=False, node_names={}, update=lambda *_a: None
+            )
+
+    outcome = asyncio.run(run())
+
+    # Then the second read blocks from the first read's index and no sleep was needed
+    assert outcome.status is StopStatus.STOPPED
+    assert route.calls[0].request.url.params["index"] == "0"
+    assert route.calls[1].request.url.params["index"] == "10"
+    assert "wait" in route.calls[1].request.url.params
+    sleep.assert_not_called()
+
+
 def test_stop_and_wait_times_out_when_never_terminal(httpx2_mock: respx.Router, mocker):
     """Verify stop_and_wait reports TIMEOUT when allocations never drain."""
     # Given a stop call and allocations that stay running
@@ -245,7 +274,7 @@ def test_stop_and_wait_times_out_when_never_terminal(httpx2_mock: respx.Router,
     # And a tiny timeout budget plus a no-op sleep so the loop ends quickly
     mocker.patch("nd.commands.stop.asyncio.sleep", autospec=True)
     mocker.patch("nd.commands.stop.STOP_TIMEOUT_SECONDS", 0.03)
-    mocker.patch("nd.commands.stop.POLL_INTERVAL_SECONDS", 0.01)
+    mocker.patch("nd.commands._watch.POLL_INTERVAL_SECONDS", 0.01)
 
     # When stopping and waiting
     async def run() -> object:
@@ -375,7 +404,7 @@ def test_stop_and_wait_does_not_purge_on_timeout(httpx2_mock: respx.Router, mock
     httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(json=[_alloc_json("running")])
     mocker.patch("nd.commands.stop.asyncio.sleep", autospec=True)
     mocker.patch("nd.commands.stop.STOP_TIMEOUT_SECONDS", 0.03)
-    mocker.patch("nd.commands.stop.POLL_INTERVAL_SECONDS", 0.01)
+    mocker.patch("nd.commands._watch.POLL_INTERVAL_SECONDS", 0.01)
 
     # When stopping with purge=True
     async def run() -> object:
@@ -532,6 +561,32 @@ def test_stop_app_force_stops_single_match(
     assert result.exit_code == 0
 
 
+def test_stop_app_jsonl_output_writes_one_event_per_line(
+    httpx2_mock: respx.Router, monkeypatch, tmp_path, mocker
+):
+    """Verify --output jsonl reports the drain as JSON events and nothing else on stdout."""
+    # Given an isolated config and one running job that drains immediately
+    monkeypatch.setenv("NOMAD_ADDR", _ADDR)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    httpx2_mock.get(f"{_ADDR}/v1/jobs").respond(json=[_running_job_json()])
+    httpx2_mock.get(f"{_ADDR}/v1/nodes").respond(json=[])
+    httpx2_mock.delete(f"{_ADDR}/v1/job/web").respond(json={"EvalID": "e1"})
+    httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(json=[])
+    mocker.patch("nd.commands.stop.asyncio.sleep", autospec=True)
+
+    # When stopping with JSON-lines output
+    result = CliRunner().invoke(stop_module.app, ["we", "--force", "--output", "jsonl"])
+    pp.configure(quiet=False)
+
+    # Then every stdout line is an event, ending with the job's outcome and a summary
+    events = [msgspec.json.decode(line) for line in result.stdout.splitlines()]
+    assert result.exit_code == 0
+    assert [e["event"] for e in events] == ["progress", "finished", "done"]
+    assert events[0]["job"] == "web"
+    assert events[1]["status"] == "stopped"
+    assert "[" not in events[2]["summary"]
+
+
 def test_stop_app_detach_issues_stop_without_watching(
     httpx2_mock: respx.Router, monkeypatch, tmp_path
 ):
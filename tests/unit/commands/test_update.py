@@ -11,6 +11,7 @@ from typer.testing import CliRunner
 import nd.commands.update as update_mod
 from nd.binary import NomadBinaryError
 from nd.cli import app
+from nd.commands._specs import SpecPipeline
 from nd.commands.stop import StopOutcome, StopStatus
 from nd.commands.update import UpdateOutcome, UpdateStatus, UpdateTarget, build_update_targets
 from nd.jobfiles import JobFile
@@ -82,7 +83,12 @@ def test_update_one_compile_failure_skips_stop(httpx2_mock: respx.Router, mocker
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -111,7 +117,12 @@ def test_update_one_aborts_register_when_stop_fails(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -138,7 +149,12 @@ def test_update_one_register_failure_reports_job_down(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -178,7 +194,12 @@ def test_update_one_recreate_sequence_succeeds(httpx2_mock: respx.Router, mocker
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -223,7 +244,12 @@ def test_update_one_no_purge_skips_purge(httpx2_mock: respx.Router, mocker) -> N
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=False
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=False,
             )
 
     outcome = asyncio.run(go())
@@ -262,7 +288,12 @@ def test_update_one_watch_error_does_not_escape(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -308,7 +339,12 @@ def test_update_one_purge_failed_still_redeploys(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -336,7 +372,12 @@ def test_update_one_drain_timeout_maps_to_timeout(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=lambda *_a: None, nomad=nomad, purge=True
+                client,
+                target,
+                node_names={},
+                update=lambda *_a: None,
+                specs=SpecPipeline(nomad),
+                purge=True,
             )
 
     outcome = asyncio.run(go())
@@ -389,7 +430,7 @@ def test_update_one_marks_previous_version_stopped(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=_update, nomad=nomad, purge=True
+                client, target, node_names={}, update=_update, specs=SpecPipeline(nomad), purge=True
             )
 
     outcome = asyncio.run(go())
@@ -426,7 +467,7 @@ def test_update_one_no_marker_when_stop_times_out(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=_update, nomad=nomad, purge=True
+                client, target, node_names={}, update=_update, specs=SpecPipeline(nomad), purge=True
             )
 
     outcome = asyncio.run(go())
@@ -479,7 +520,7 @@ def test_update_one_no_marker_when_nothing_was_running(
     async def go() -> UpdateOutcome:
         async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
             return await update_mod._update_one(
-                client, target, node_names={}, update=_update, nomad=nomad, purge=True
+                client, target, node_names={}, update=_update, specs=SpecPipeline(nomad), purge=True
             )
 
     outcome = asyncio.run(go())
@@ -493,7 +534,7 @@ def test_update_no_candidates_exits_clean(monkeypatch, httpx2_mock: respx.Router
     """Verify update exits 0 with a message when no running job has a local file."""
     # Given no local files and an empty cluster job list
     monkeypatch.setattr(update_mod, "load_job_directories", list)
-    monkeypatch.setattr(update_mod, "discover_job_files", lambda dirs: [])
+    monkeypatch.setattr(update_mod, "discover_job_files", lambda dirs, index=None: [])
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
     monkeypatch.setenv("NOMAD_ADDR", _ADDR)
     httpx2_mock.get(f"{_ADDR}/v1/jobs").respond(json=[])
@@ -514,7 +555,7 @@ def test_update_dry_run_reports_without_acting(
     monkeypatch.setattr(
         update_mod,
         "discover_job_files",
-        lambda dirs: [JobFile(path=Path("/j/web.hcl"), job_names=["web"])],
+        lambda dirs, index=None: [JobFile(path=Path("/j/web.hcl"), job_names=["web"])],
     )
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
     monkeypatch.setenv("NOMAD_ADDR", _ADDR)
@@ -550,7 +591,7 @@ def test_update_confirm_decline_aborts(monkeypatch, httpx2_mock: respx.Router, t
     monkeypatch.setattr(
         update_mod,
         "discover_job_files",
-        lambda dirs: [JobFile(path=Path("/j/web.hcl"), job_names=["web"])],
+        lambda dirs, index=None: [JobFile(path=Path("/j/web.hcl"), job_names=["web"])],
     )
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
     monkeypatch.setenv("NOMAD_ADDR", _ADDR)
@@ -0,0 +1,327 @@
+"""Tests for the deploy/drain watch feeds."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING
+
+import httpx  # respx-bundled; used to build streamed mock responses
+
+from nd.commands._watch import (
+    BlockingFeed,
+    EventFeed,
+    PollSchedule,
+    SharedFeed,
+    open_feed,
+)
+from nd.commands._watch_mode import WatchMode
+from nd.nomad import NomadClient, NomadConfig, NomadError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    import respx
+
+_ADDR = "http://nomad.test:4646"
+
+
+def _alloc_event(job_id: str) -> bytes:
+    """Build one event-stream line for an allocation of ``job_id``."""
+    event = {
+        "Topic": "Allocation",
+        "Type": "AllocationUpdated",
+        "Key": "a1",
+        "FilterKeys": [job_id],
+    }
+    return json.dumps({"Index": 5, "Events": [event]}).encode() + b"\n"
+
+
+def test_event_feed_wakes_only_the_job_an_event_names(httpx2_mock: respx.Router):
+    """Verify an event for one job wakes its watcher and leaves the others waiting."""
+    # Given an event stream that delivers one event for "web" and then stays open
+    hold = asyncio.Event()
+
+    async def body() -> AsyncIterator[bytes]:
+        yield _alloc_event("web")
+        await hold.wait()
+
+    httpx2_mock.get(f"{_ADDR}/v1/event/stream").mock(
+        side_effect=lambda _req: httpx.Response(200, content=body())
+    )
+
+    # When both jobs wait for a change under one shared subscription
+    async def run() -> tuple[bool, bool, bool]:
+        async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
+            async with EventFeed(client, ["web", "api"]) as feed:
+                deadline = time.monotonic() + 30
+                web = asyncio.create_task(feed.changed("web", deadline=deadline))
+                api = asyncio.create_task(feed.changed("api", deadline=deadline))
+                await asyncio.wait_for(web, timeout=5)
+                api_done = api.done()
+                api.cancel()
+                live = feed.live
+                hold.set()
+            return web.done(), api_done, live
+
+    web_done, api_done, live = asyncio.run(run())
+
+    # Then only the named job woke, while the stream stayed live
+    assert web_done
+    assert not api_done
+    assert live
+
+
+def test_event_feed_falls_back_to_blocking_queries_when_refused(httpx2_mock: respx.Router):
+    """Verify a refused event stream degrades the feed to blocking allocation reads."""
+    # Given a token without event-stream access and an allocations endpoint with an index
+    httpx2_mock.get(f"{_ADDR}/v1/event/stream").respond(403, text="Permission denied")
+    route = httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(
+        json=[], headers={"X-Nomad-Index": "7"}
+    )
+
+    # When the watcher waits for a change and then reads again
+    async def run() -> bool:
+        async with (
+            NomadClient.from_config(NomadConfig(address=_ADDR)) as client,
+            open_feed(client, WatchMode.EVENTS, ["web"]) as feed,
+        ):
+            await feed.changed("web", deadline=time.monotonic() + 30)
+            await feed.allocations("web")
+            await feed.changed("web", deadline=time.monotonic() + 30)
+            await feed.allocations("web")
+            return feed.live
+
+    live = asyncio.run(run())
+
+    # Then the feed reports the stream dead and reads via blocking queries
+    assert not live
+    assert route.calls[0].request.url.params["index"] == "0"
+    assert route.calls[1].request.url.params["index"] == "7"
+
+
+def test_blocking_feed_sleeps_without_an_index(httpx2_mock: respx.Router, mocker):
+    """Verify the blocking feed paces reads with a sleep when Nomad reports no index."""
+    # Given an allocations endpoint that reports no index
+    httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(json=[])
+    sleep = mocker.patch("nd.commands._watch.asyncio.sleep", autospec=True)
+
+    # When reading and waiting for a change
+    async def run() -> None:
+        async with NomadClient.from_config(NomadConfig(address=_ADDR)) as client:
+            feed = BlockingFeed(client)
+            await feed.allocations("web")
+            await feed.changed("web", deadline=time.monotonic() + 30)
+
+    asyncio.run(run())
+
+    # Then the wait fell back to a paced sleep
+    sleep.assert_called_once()
+
+
+def test_poll_schedule_backs_off_until_a_change(monkeypatch):
+    """Verify paced waits double while nothing changes, cap out, and reset on change."""
+    # Given a schedule starting at one second and capped at five
+    monkeypatch.setattr("nd.commands._watch.POLL_INTERVAL_SECONDS", 1.0)
+    schedule = PollSchedule(5.0)
+    schedule.observe("web", "allocations", ["pending"])
+
+    # When the job stays the same for several ticks, then changes
+    quiet = [schedule.delay("web") for _ in range(5)]
+    schedule.observe("web", "allocations", ["pending"])
+    unchanged = schedule.delay("web")
+    schedule.observe("web", "allocations", ["running"])
+    changed = schedule.delay("web")
+
+    # Then the intervals grew to the cap, an equal read kept them, and a change reset them
+    assert quiet == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert unchanged == 5.0
+    assert changed == 1.0
+
+
+def test_poll_schedule_never_waits_past_the_deadline(monkeypatch):
+    """Verify a paced wait is cut short so the watch deadline is reported on time."""
+    # Given a schedule whose next interval is longer than the time left
+    monkeypatch.setattr("nd.commands._watch.POLL_INTERVAL_SECONDS", 8.0)
+    schedule = PollSchedule(30.0)
+
+    # When asking for the delay with half a second left, and with the deadline passed
+    near = schedule.delay("web", time.monotonic() + 0.5)
+    passed = schedule.delay("web", time.monotonic() - 1)
+
+    # Then the waits are bounded by the deadline
+    assert 0 < near <= 0.5
+    assert passed == 0.0
+
+
+def test_blocking_feed_backs_off_while_allocations_stand_still(httpx2_mock: respx.Router, mocker):
+    """Verify unindexed polling slows while allocations repeat and speeds up on change."""
+    # Given an unindexed allocations endpoint that repeats itself, then changes
+    route = httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations")
+    route.side_effect = [
+        httpx.Response(200, json=[_alloc_json("web", "pending")]),
+        httpx.Response(200, json=[_alloc_json("web", "pending")]),
+        httpx.Response(200, json=[_alloc_json("web", "pending")]),
+        httpx.Response(200, json=[_alloc_json("web", "running")]),
+    ]
+    mocker.patch("nd.commands._watch.POLL_INTERVAL_SECONDS", 1.0)
+    sleep = mocker.patch("nd.commands._watch.asyncio.sleep", autospec=True)
+
+    # When reading and waiting four times
+    async def run() -> None:
+        config = NomadConfig(address=_ADDR, poll_max_interval=3.0)
+        async with NomadClient.from_config(config) as client:
+            feed = BlockingFeed(client)
+            for _ in range(4):
+                await feed.allocations("web")
+                await feed.changed("web", deadline=time.monotonic() + 60)
+
+    asyncio.run(run())
+
+    # Then the sleeps doubled up to the ceiling and reset once the allocations moved
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0, 3.0, 1.0]
+
+
+def _alloc_json(job_id: str, client_status: str) -> dict:
+    return {
+        "ID": f"{job_id}-a",
+        "Name": "n",
+        "NodeID": "x",
+        "JobID": job_id,
+        "TaskGroup": job_id,
+        "ClientStatus": client_status,
+        "DesiredStatus": "stop",
+        "CreateIndex": 1,
+        "ModifyIndex": 2,
+    }
+
+
+def _blocking_listing(payload: list[dict], index: str) -> Callable[..., Awaitable[httpx.Response]]:
+    """Answer the first read at once, then hold later reads like an unchanged blocking query."""
+    calls = 0
+
+    async def respond(_request: object) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            await asyncio.Event().wait()
+        return httpx.Response(200, json=payload, headers={"X-Nomad-Index": index})
+
+    return respond
+
+
+def test_shared_feed_fans_one_listing_out_to_every_job(httpx2_mock: respx.Router):
+    """Verify the shared feed serves each job its slice of one cluster-wide listing."""
+    # Given cluster-wide listings holding two watched jobs, one unwatched job and a deployment
+    allocs = [
+        _alloc_json("web", "running"),
+        _alloc_json("api", "complete"),
+        _alloc_json("db", "running"),
+    ]
+    deployment = {
+        "ID": "d1",
+        "JobID": "web",
+        "Status": "running",
+        "CreateIndex": 4,
+        "ModifyIndex": 5,
+        "TaskGroups": {"web": {"DesiredTotal": 1, "HealthyAllocs": 1}},
+    }
+    alloc_route = httpx2_mock.get(f"{_ADDR}/v1/allocations").mock(
+        side_effect=_blocking_listing(allocs, "10")
+    )
+    httpx2_mock.get(f"{_ADDR}/v1/deployments").mock(
+        side_effect=_blocking_listing([deployment], "10")
+    )
+
+    # When both jobs read through one shared feed
+    async def run() -> tuple[list[str], list[str], int, int]:
+        async with (
+            NomadClient.from_config(NomadConfig(address=_ADDR)) as client,
+            SharedFeed(client, ["web", "api"]) as feed,
+        ):
+            web = await feed.allocations("web")
+            api = await feed.allocations("api")
+            stubs = await feed.deployments("web")
+            dep = await feed.deployment(stubs[0].id)
+            return (
+                [a.client_status for a in web],
+                [a.client_status for a in api],
+                stubs[0].create_index,
+                dep.task_groups["web"].healthy_allocs,
+            )
+
+    web, api, create_index, healthy = asyncio.run(run())
+
+    # Then one listing filtered server-side to the watched jobs serves each job only its
+    # own allocations, and the deployment needs no extra read
+    assert alloc_route.calls[0].request.url.params["index"] == "0"
+    assert alloc_route.calls[0].request.url.params["filter"] == 'JobID == "api" or JobID == "web"'
+    assert web == ["running"]
+    assert api == ["complete"]
+    assert create_index == 4
+    assert healthy == 1
+
+
+def test_shared_feed_raises_a_listing_failure_to_watchers(httpx2_mock: respx.Router):
+    """Verify a listing that never loads fails the watcher's read instead of hanging it."""
+    # Given a cluster-wide allocations listing that Nomad refuses
+    httpx2_mock.get(f"{_ADDR}/v1/allocations").respond(403, text="Permission denied")
+    httpx2_mock.get(f"{_ADDR}/v1/deployments").mock(side_effect=_blocking_listing([], "3"))
+
+    # When a watcher reads its allocations
+    async def run() -> str:
+        async with (
+            NomadClient.from_config(NomadConfig(address=_ADDR)) as client,
+            SharedFeed(client, ["web"]) as feed,
+        ):
+            try:
+                await feed.allocations("web")
+            except NomadError as exc:
+                return type(exc).__name__
+            return "no error"
+
+    # Then the refusal surfaces as a Nomad error, as a per-job read would have
+    assert asyncio.run(run()) == "NomadAuthError"
+
+
+def test_shared_feed_outlives_a_listing_failure(httpx2_mock: respx.Router, monkeypatch):
+    """Verify a failure after the first listing is retried instead of failing watchers."""
+    # Given an allocations listing that loads, fails once, then shows the job finished
+    monkeypatch.setattr("nd.commands._watch.POLL_INTERVAL_SECONDS", 0.01)
+    later = _blocking_listing([_alloc_json("web", "complete")], "11")
+    answers = iter(
+        [
+            httpx.Response(
+                200, json=[_alloc_json("web", "running")], headers={"X-Nomad-Index": "10"}
+            ),
+            httpx.Response(500, text="No cluster leader"),
+        ]
+    )
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        return next(answers, None) or await later(request)
+
+    httpx2_mock.get(f"{_ADDR}/v1/allocations").mock(side_effect=respond)
+    httpx2_mock.get(f"{_ADDR}/v1/deployments").mock(side_effect=_blocking_listing([], "3"))
+
+    # When a watcher reads until its job finishes, waiting between reads
+    async def run() -> list[str]:
+        seen: list[str] = []
+        deadline = time.monotonic() + 30
+        async with (
+            NomadClient.from_config(NomadConfig(address=_ADDR, retries=0)) as client,
+            SharedFeed(client, ["web"]) as feed,
+        ):
+            while time.monotonic() < deadline:
+                seen.extend(a.client_status for a in await feed.allocations("web"))
+                if "complete" in seen:
+                    break
+                await feed.changed("web", deadline=deadline)
+        return seen
+
+    seen = asyncio.run(run())
+
+    # Then the poll recovered and the watcher saw the job finish with no error
+    assert seen[0] == "running"
+    assert seen[-1] == "complete"
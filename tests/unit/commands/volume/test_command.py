@@ -46,7 +46,9 @@ def test_volume_register_dry_run_makes_no_api_calls(monkeypatch, typer_runner) -
         relative_path="data",
     )
     monkeypatch.setattr(cmd, "load_volume_directories", list)
-    monkeypatch.setattr(cmd, "discover_volume_files", lambda dirs: [spec])
+    monkeypatch.setattr(
+        cmd, "discover_volume_files", lambda dirs, cache=None, parallel=False: [spec]
+    )
 
     # Stub the async cluster fetch so no network or registration happens
     async def _fake_collect(client) -> tuple:
@@ -103,7 +105,9 @@ def test_volume_register_no_name_match_exits_one(monkeypatch, typer_runner) -> N
         relative_path="data",
     )
     monkeypatch.setattr(cmd, "load_volume_directories", list)
-    monkeypatch.setattr(cmd, "discover_volume_files", lambda dirs: [spec])
+    monkeypatch.setattr(
+        cmd, "discover_volume_files", lambda dirs, cache=None, parallel=False: [spec]
+    )
 
     # When naming a volume that matches nothing
     result = typer_runner.invoke(app, ["register", "zzz"])
@@ -129,7 +133,9 @@ def test_volume_delete_dry_run_with_name_selects_match(monkeypatch, typer_runner
         VolumeSpec(path=Path("/v/logs.hcl"), name="logs", capabilities=[], relative_path="logs"),
     ]
     monkeypatch.setattr(cmd, "load_volume_directories", list)
-    monkeypatch.setattr(cmd, "discover_volume_files", lambda dirs: specs)
+    monkeypatch.setattr(
+        cmd, "discover_volume_files", lambda dirs, cache=None, parallel=False: specs
+    )
 
     registered = msgspec.convert(
         {"ID": "v1", "Name": "data", "NodeID": "n1", "State": "ready"},
@@ -169,7 +175,9 @@ def _delete_fixture(monkeypatch) -> tuple:
 
     spec = VolumeSpec(path=Path("/v/data.hcl"), name="data", capabilities=[], relative_path="data")
     monkeypatch.setattr(cmd, "load_volume_directories", list)
-    monkeypatch.setattr(cmd, "discover_volume_files", lambda dirs: [spec])
+    monkeypatch.setattr(
+        cmd, "discover_volume_files", lambda dirs, cache=None, parallel=False: [spec]
+    )
 
     registered = msgspec.convert(
         {"ID": "v1", "Name": "data", "NodeID": "n1", "State": "ready"},
@@ -3,6 +3,7 @@
 import asyncio
 import json
 
+import httpx  # respx-bundled; used to build sequenced mock responses
 import respx
 
 from nd.nomad.config import NomadConfig
@@ -44,6 +45,44 @@ def test_list_decodes_allocations(httpx2_mock: respx.Router):
     assert route.calls.last.request.url.path == "/v1/allocations"
 
 
+def test_list_sends_filter_page_size_and_prunes_task_states(httpx2_mock: respx.Router):
+    """Verify allocations.list forwards the filter and page size and can drop task states."""
+    # Given a mocked allocations listing endpoint
+    route = httpx2_mock.get(f"{_ADDR}/v1/allocations").respond(json=[_STUB])
+    resource = AllocationsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When listing with a filter, a page size and no task states
+    async def run() -> None:
+        await resource.list(filter_expr='JobID == "web"', per_page=100, task_states=False)
+        await resource._transport.aclose()
+
+    asyncio.run(run())
+
+    # Then every option reaches Nomad as a query parameter
+    params = route.calls.last.request.url.params
+    assert params["filter"] == 'JobID == "web"'
+    assert params["per_page"] == "100"
+    assert params["task_states"] == "false"
+
+
+def test_list_omits_optional_params_by_default(httpx2_mock: respx.Router):
+    """Verify a plain allocations.list sends no filter, page size or task_states flag."""
+    # Given a mocked allocations listing endpoint
+    route = httpx2_mock.get(f"{_ADDR}/v1/allocations").respond(json=[_STUB])
+    resource = AllocationsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When listing without options
+    async def run() -> None:
+        await resource.list()
+        await resource._transport.aclose()
+
+    asyncio.run(run())
+
+    # Then the request carries none of them
+    params = route.calls.last.request.url.params
+    assert {"filter", "per_page", "task_states"}.isdisjoint(params.keys())
+
+
 def test_read_decodes_task_states(httpx2_mock: respx.Router):
     """Verify allocations.read decodes the per-task states map."""
     # Given a mocked single-allocation endpoint carrying task states
@@ -83,3 +122,28 @@ def test_signal_posts_signal_and_task(httpx2_mock: respx.Router):
     # Then the request carries both fields in Nomad's PascalCase form
     assert route.calls.last.request.url.path == "/v1/client/allocation/a1/signal"
     assert json.loads(route.calls.last.request.content) == {"Signal": "SIGUSR1", "Task": "server"}
+
+
+def test_iter_pages_yields_decoded_pages(httpx2_mock: respx.Router):
+    """Verify allocations.iter_pages decodes each page separately with a bounded page size."""
+    # Given a listing split over two pages
+    route = httpx2_mock.get(f"{_ADDR}/v1/allocations").mock(
+        side_effect=[
+            httpx.Response(200, json=[_STUB], headers={"X-Nomad-Nexttoken": "a2"}),
+            httpx.Response(200, json=[{**_STUB, "ID": "a2"}, {**_STUB, "ID": "a3"}]),
+        ]
+    )
+    resource = AllocationsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When streaming the pages without task states
+    async def run() -> list[list[str]]:
+        pages = [[a.id for a in page] async for page in resource.iter_pages(task_states=False)]
+        await resource._transport.aclose()
+        return pages
+
+    pages = asyncio.run(run())
+
+    # Then each page arrives as its own decoded list, requested with a page size
+    assert pages == [["a1"], ["a2", "a3"]]
+    assert route.calls[0].request.url.params["per_page"] == "500"
+    assert route.calls[0].request.url.params["task_states"] == "false"
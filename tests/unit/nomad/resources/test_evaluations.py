@@ -41,3 +41,24 @@ def test_evaluations_list_decodes_stubs(httpx2_mock: respx.Router):
     assert [e.job_id for e in evals] == ["web"]
     assert evals[0].queued_allocations == {"web": 1}
     assert route.calls.last.request.url.path == "/v1/evaluations"
+
+
+def test_evaluations_list_indexed_sends_filter(httpx2_mock: respx.Router):
+    """Verify evaluations.list_indexed forwards the filter alongside the blocking index."""
+    # Given a mocked evaluations endpoint
+    route = httpx2_mock.get(f"{_ADDR}/v1/evaluations").respond(
+        json=[_STUB], headers={"X-Nomad-Index": "9"}
+    )
+    resource = EvaluationsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When blocking on a filtered listing
+    async def run() -> None:
+        await resource.list_indexed(index=3, wait=5, filter_expr='Status != "complete"')
+        await resource._transport.aclose()
+
+    asyncio.run(run())
+
+    # Then the filter and the blocking parameters are both sent
+    params = route.calls.last.request.url.params
+    assert params["filter"] == 'Status != "complete"'
+    assert params["index"] == "3"
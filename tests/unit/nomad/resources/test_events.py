@@ -0,0 +1,61 @@
+"""Tests for the events resource."""
+
+import asyncio
+import json
+
+import respx
+
+from nd.nomad.config import NomadConfig
+from nd.nomad.models.event import EventBatch
+from nd.nomad.resources.events import EventsResource
+from nd.nomad.transport import AsyncTransport
+
+_ADDR = "http://nomad.test:4646"
+_BATCH = {
+    "Index": 42,
+    "Events": [
+        {
+            "Topic": "Allocation",
+            "Type": "AllocationUpdated",
+            "Key": "a1",
+            "FilterKeys": ["web", "d1"],
+            "Index": 42,
+        }
+    ],
+}
+
+
+def test_events_stream_decodes_batches_and_drops_heartbeats(httpx2_mock: respx.Router):
+    """Verify events.stream yields decoded batches and skips heartbeat lines."""
+    # Given an event stream with a heartbeat between two copies of a batch
+    lines = [json.dumps(_BATCH), "{}", json.dumps(_BATCH)]
+    route = httpx2_mock.get(f"{_ADDR}/v1/event/stream").respond(text="\n".join(lines) + "\n")
+    resource = EventsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When subscribing to allocation and job events for one job
+    async def run() -> list[EventBatch]:
+        batches = [b async for b in resource.stream({"Job": ["web"], "Allocation": ["web"]})]
+        await resource._transport.aclose()
+        return batches
+
+    batches = asyncio.run(run())
+
+    # Then only the non-empty batches decode, with their filter keys
+    assert [b.index for b in batches] == [42, 42]
+    assert batches[0].events[0].filter_keys == ["web", "d1"]
+    # And each topic filter is sent as its own repeated query param
+    params = route.calls.last.request.url.params
+    assert params.get_list("topic") == ["Job:web", "Allocation:web"]
+
+
+def test_event_filter_keys_read_null_as_empty():
+    """Verify an event with null FilterKeys exposes an empty list."""
+    # Given a batch whose event carries null FilterKeys
+    raw = {"Index": 1, "Events": [{"Topic": "Job", "Type": "JobRegistered", "FilterKeys": None}]}
+    resource = EventsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When decoding it
+    batch = resource._decode_bytes(json.dumps(raw), EventBatch)
+
+    # Then the filter keys read as empty
+    assert batch.events[0].filter_keys == []
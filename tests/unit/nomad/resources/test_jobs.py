@@ -194,3 +194,48 @@ def test_jobs_deployments_lists_for_job(httpx2_mock: respx.Router):
     # Then the stub decodes and the expected path was called
     assert [d.id for d in deps] == ["d1"]
     assert route.calls.last.request.url.path == "/v1/job/web/deployments"
+
+
+def test_allocations_indexed_resumes_from_last_index(httpx2_mock: respx.Router):
+    """Verify allocations_indexed returns the index and resumes from it on the next call."""
+    # Given a job-allocations endpoint reporting an index
+    route = httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(
+        json=[_ALLOC], headers={"X-Nomad-Index": "9"}
+    )
+    resource = JobsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When querying twice, the second time without an explicit index
+    async def run() -> tuple:
+        first = await resource.allocations_indexed("web", index=0)
+        second = await resource.allocations_indexed("web", wait=1)
+        await resource._transport.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    # Then the index is returned and the second query blocks from the tracked index
+    assert first.index == 9
+    assert first.value[0].id == "a1"
+    assert route.calls[0].request.url.params["index"] == "0"
+    assert route.calls[1].request.url.params["index"] == "9"
+    assert second.index == 9
+
+
+def test_allocations_indexed_resets_when_index_goes_backwards(httpx2_mock: respx.Router):
+    """Verify a regressed X-Nomad-Index resets the returned index to zero."""
+    # Given an endpoint whose index is lower than the one queried from
+    httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(
+        json=[], headers={"X-Nomad-Index": "3"}
+    )
+    resource = JobsResource(AsyncTransport(NomadConfig(address=_ADDR)))
+
+    # When querying from a higher index
+    async def run() -> object:
+        result = await resource.allocations_indexed("web", index=50)
+        await resource._transport.aclose()
+        return result
+
+    result = asyncio.run(run())
+
+    # Then the index resets so the next query reads current state immediately
+    assert result.index == 0
@@ -127,3 +127,53 @@ def test_to_env_omits_unset_optional_fields():
     assert "NOMAD_TOKEN" not in env
     assert "NOMAD_NAMESPACE" not in env
     assert "NOMAD_CLIENT_CERT" not in env
+
+
+def test_resolve_reads_retry_settings_from_file(clean_env, tmp_path):
+    """Verify retries and retry_backoff come from the [nomad] table."""
+    # Given a config file disabling retries
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("[nomad]\nretries = 0\nretry_backoff = 1.5\n")
+
+    # When resolving config
+    cfg = NomadConfig.resolve(config_path=cfg_file)
+
+    # Then both settings are applied
+    assert cfg.retries == 0
+    assert cfg.retry_backoff == 1.5
+
+
+def test_resolve_rejects_negative_retries(clean_env, tmp_path):
+    """Verify a negative retry count is a configuration error."""
+    # Given a config file with a negative retry count
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("[nomad]\nretries = -1\n")
+
+    # When resolving config
+    # Then a NomadConfigError is raised
+    with pytest.raises(NomadConfigError):
+        NomadConfig.resolve(config_path=cfg_file)
+
+
+def test_resolve_rejects_a_zero_concurrency_cap(clean_env, tmp_path):
+    """Verify a concurrency cap below one is a configuration error."""
+    # Given a config file allowing no requests in flight
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("[nomad]\nmax_concurrency = 0\n")
+
+    # When resolving config
+    # Then a NomadConfigError is raised
+    with pytest.raises(NomadConfigError):
+        NomadConfig.resolve(config_path=cfg_file)
+
+
+def test_resolve_rejects_a_zero_poll_max_interval(clean_env, tmp_path):
+    """Verify a watch poll ceiling of zero is a configuration error."""
+    # Given a config file that would let watchers poll without pause
+    cfg_file = tmp_path / "config.toml"
+    cfg_file.write_text("[nomad]\npoll_max_interval = 0\n")
+
+    # When resolving config
+    # Then a NomadConfigError is raised
+    with pytest.raises(NomadConfigError):
+        NomadConfig.resolve(config_path=cfg_file)
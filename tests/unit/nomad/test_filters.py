@@ -0,0 +1,42 @@
+"""Tests for the server-side filter expression builders."""
+
+from nd.nomad.filters import any_equal, none_equal, quote
+
+
+def test_quote_escapes_quotes_and_backslashes():
+    """Verify values are rendered as escaped bexpr string literals."""
+    # Given a value holding a quote and a backslash
+    # When quoting it
+    quoted = quote('we"b\\1')
+
+    # Then both are escaped inside double quotes
+    assert quoted == '"we\\"b\\\\1"'
+
+
+def test_any_equal_sorts_and_dedupes_into_a_disjunction():
+    """Verify any_equal joins one sorted equality per distinct value with or."""
+    # Given repeated, unsorted values
+    # When building the filter
+    expression = any_equal("JobID", ["web", "api", "web"])
+
+    # Then each value appears once, in order
+    assert expression == 'JobID == "api" or JobID == "web"'
+
+
+def test_none_equal_builds_a_conjunction():
+    """Verify none_equal joins one inequality per value with and."""
+    # Given two statuses to exclude
+    # When building the filter
+    expression = none_equal("Status", {"complete", "failed"})
+
+    # Then both are excluded
+    assert expression == 'Status != "complete" and Status != "failed"'
+
+
+def test_builders_return_none_without_values():
+    """Verify an empty value set yields no filter rather than invalid bexpr."""
+    # Given no values
+    # When building either filter
+    # Then there is nothing to send
+    assert any_equal("JobID", []) is None
+    assert none_equal("Status", []) is None
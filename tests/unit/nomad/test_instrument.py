@@ -0,0 +1,69 @@
+"""Tests for per-request instrumentation hooks."""
+
+import asyncio
+
+import httpx  # respx-bundled; used to build sequenced mock responses
+import pytest
+import respx
+
+from nd.nomad import NomadClient, NomadConfig
+from nd.nomad.instrument import (
+    RequestRecord,
+    add_request_hook,
+    endpoint,
+    remove_request_hook,
+)
+
+_ADDR = "http://nomad.test:4646"
+
+
+def test_hooks_see_every_attempt_with_its_decode_time(httpx2_mock: respx.Router):
+    """Verify a hook gets one record per attempt, and decode time lands on the answer's."""
+    # Given a leader endpoint failing once before answering, and a process-wide hook
+    httpx2_mock.get(f"{_ADDR}/v1/status/leader").mock(
+        side_effect=[httpx.Response(500), httpx.Response(200, json="10.0.0.1:4647")]
+    )
+    records: list[RequestRecord] = []
+    add_request_hook(records.append)
+
+    # When reading the leader through the client
+    async def run() -> str:
+        async with NomadClient.from_config(NomadConfig(address=_ADDR, retry_backoff=0)) as client:
+            return await client.status.leader()
+
+    try:
+        leader = asyncio.run(run())
+    finally:
+        remove_request_hook(records.append)
+
+    # Then both attempts were recorded, and only the decoded one carries decode time
+    assert leader == "10.0.0.1:4647"
+    assert [(r.method, r.path, r.status, r.attempt) for r in records] == [
+        ("GET", "/status/leader", 500, 0),
+        ("GET", "/status/leader", 200, 1),
+    ]
+    assert records[0].failed
+    assert records[0].decode == 0
+    assert records[1].bytes == len(b'"10.0.0.1:4647"')
+    assert records[1].decode > 0
+    assert records[1].latency > 0
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/jobs", "/jobs"),
+        ("/job/web", "/job/{id}"),
+        ("/job/web/allocations", "/job/{id}/allocations"),
+        ("/node/8f2c", "/node/{id}"),
+        ("/client/allocation/ab12/signal", "/client/allocation/{id}/signal"),
+        ("/volume/host/register", "/volume/host/register"),
+        ("/volume/host/vol-1/delete", "/volume/host/{id}/delete"),
+    ],
+)
+def test_endpoint_replaces_object_ids(path, expected):
+    """Verify reads of different objects of one kind group under one endpoint."""
+    # Given a request path
+    # When templating it
+    # Then object IDs become {id} and fixed paths are left alone
+    assert endpoint(path) == expected
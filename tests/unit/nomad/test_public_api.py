@@ -11,6 +11,7 @@ _EXPECTED_ALL = {
     "NomadDecodeError",
     "NomadHTTPError",
     "NomadBadRequestError",
+    "NomadCircuitOpenError",
     "NomadAuthError",
     "NomadNotFoundError",
     "NomadServerError",
@@ -18,7 +19,7 @@ _EXPECTED_ALL = {
 
 
 def test_all_contains_exactly_expected_names():
-    """Verify that __all__ contains exactly the 11 expected public names."""
+    """Verify that __all__ contains exactly the 12 expected public names."""
     # Given: the nomad module
     # When: reading the __all__ definition
     # Then: it should match exactly the expected set
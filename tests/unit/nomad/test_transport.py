@@ -1,6 +1,7 @@
 """Tests for the async Nomad transport."""
 
 import asyncio
+import sys
 
 import httpx2
 import pytest
@@ -9,6 +10,7 @@ import respx
 from nd.nomad.config import NomadConfig
 from nd.nomad.errors import (
     NomadAuthError,
+    NomadConfigError,
     NomadConnectionError,
     NomadNotFoundError,
     NomadServerError,
@@ -51,7 +53,7 @@ def test_request_maps_http_error_status(status, expected, httpx2_mock: respx.Rou
     """Verify non-2xx responses raise the matching typed error with context."""
     # Given an endpoint returning an error status
     httpx2_mock.get(f"{_ADDR}/v1/nodes").respond(status, text="nope")
-    transport = AsyncTransport(NomadConfig(address=_ADDR))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retries=0))
 
     # When the request is made
     async def run() -> None:
@@ -71,7 +73,7 @@ def test_request_maps_transport_failure_to_connection_error(httpx2_mock: respx.R
     """Verify a transport failure becomes a NomadConnectionError."""
     # Given an endpoint that raises a connect error
     httpx2_mock.get(f"{_ADDR}/v1/nodes").mock(side_effect=httpx2.ConnectError("refused"))
-    transport = AsyncTransport(NomadConfig(address=_ADDR))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retries=0))
 
     # When the request is made
     async def run() -> None:
@@ -83,3 +85,75 @@ def test_request_maps_transport_failure_to_connection_error(httpx2_mock: respx.R
     # Then it surfaces as a NomadConnectionError
     with pytest.raises(NomadConnectionError):
         asyncio.run(run())
+
+
+def test_request_sends_blocking_params_and_tracks_index(httpx2_mock: respx.Router):
+    """Verify a blocking request sends index/wait and records the response's index per path."""
+    # Given an endpoint that reports an X-Nomad-Index header
+    route = httpx2_mock.get(f"{_ADDR}/v1/job/web/allocations").respond(
+        json=[], headers={"X-Nomad-Index": "42"}
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR))
+
+    # When a blocking query is made
+    async def run() -> None:
+        await transport.request("GET", "/job/web/allocations", index=7, wait=2.5)
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    # Then the query carries Nomad's blocking params and the index is tracked for the path
+    sent = route.calls.last.request
+    assert sent.url.params["index"] == "7"
+    assert sent.url.params["wait"] == "2.5s"
+    assert transport.last_index("/job/web/allocations") == 42
+    assert transport.last_index("/nodes") == 0
+
+
+def test_request_omits_blocking_params_by_default(httpx2_mock: respx.Router):
+    """Verify a plain request sends no index/wait params."""
+    # Given a mocked endpoint
+    route = httpx2_mock.get(f"{_ADDR}/v1/nodes").respond(json=[])
+    transport = AsyncTransport(NomadConfig(address=_ADDR))
+
+    # When a plain request is made
+    async def run() -> None:
+        await transport.request("GET", "/nodes")
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    # Then neither blocking param is present
+    params = route.calls.last.request.url.params
+    assert "index" not in params
+    assert "wait" not in params
+
+
+def test_client_uses_configured_pool_limits_and_http2(mocker):
+    """Verify the HTTP client is built with the pool limits and HTTP version from config."""
+    # Given a config opting into HTTP/2 with a small pool
+    client = mocker.patch("nd.nomad.transport.httpx2.AsyncClient")
+    config = NomadConfig(
+        address=_ADDR, http2=True, max_connections=4, max_keepalive=2, keepalive_expiry=10
+    )
+
+    # When building the transport
+    AsyncTransport(config)
+
+    # Then the client gets both
+    kwargs = client.call_args.kwargs
+    assert kwargs["http2"] is True
+    assert kwargs["limits"] == httpx2.Limits(
+        max_connections=4, max_keepalive_connections=2, keepalive_expiry=10
+    )
+
+
+def test_http2_without_h2_is_a_config_error(monkeypatch):
+    """Verify opting into HTTP/2 without the h2 package names the missing install."""
+    # Given h2 cannot be imported
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    # When building a transport with HTTP/2 enabled
+    # Then a NomadConfigError is raised
+    with pytest.raises(NomadConfigError, match="h2"):
+        AsyncTransport(NomadConfig(address=_ADDR, http2=True))
@@ -0,0 +1,105 @@
+"""Tests for the transport's concurrency cap and rate limiter."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx  # respx-bundled; used to build mock responses
+import respx
+
+from nd.nomad.config import NomadConfig
+from nd.nomad.limits import RateLimiter
+from nd.nomad.transport import AsyncTransport
+
+_ADDR = "http://nomad.test:4646"
+
+
+def _track_in_flight(peak: list[int]) -> Callable[[httpx.Request], Awaitable[httpx.Response]]:
+    """Return a side effect answering after a pause, recording the most requests in flight."""
+    in_flight = [0]
+
+    async def side_effect(_request: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.02)
+        in_flight[0] -= 1
+        return httpx.Response(200, json=[])
+
+    return side_effect
+
+
+def test_requests_beyond_the_cap_wait_for_a_slot(httpx2_mock: respx.Router):
+    """Verify no more than max_concurrency requests are in flight at once."""
+    # Given a transport capped at three concurrent requests
+    peak = [0]
+    route = httpx2_mock.get(f"{_ADDR}/v1/node/n").mock(side_effect=_track_in_flight(peak))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, max_concurrency=3))
+
+    # When twelve reads are gathered at once
+    async def run() -> None:
+        await asyncio.gather(*(transport.request("GET", "/node/n") for _ in range(12)))
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    # Then every read completed, three at a time
+    assert route.call_count == 12
+    assert peak[0] == 3
+
+
+def test_blocking_queries_do_not_hold_a_slot(httpx2_mock: respx.Router):
+    """Verify long polls run side by side even when the cap is one."""
+    # Given a transport capped at one concurrent request
+    peak = [0]
+    httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(side_effect=_track_in_flight(peak))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, max_concurrency=1))
+
+    # When two blocking queries run at once
+    async def run() -> None:
+        await asyncio.gather(
+            transport.request("GET", "/jobs", index=5, wait=1),
+            transport.request("GET", "/jobs", index=5, wait=1),
+        )
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    # Then neither waited for the other
+    assert peak[0] == 2
+
+
+def test_rate_limit_paces_requests_past_the_burst(httpx2_mock: respx.Router):
+    """Verify requests beyond the burst are spaced at the configured rate."""
+    # Given a transport allowing 20 requests per second with a burst of one
+    httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(return_value=httpx.Response(200, json=[]))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, rate_limit=20, rate_burst=1))
+
+    # When five requests are gathered at once
+    async def run() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(transport.request("GET", "/jobs") for _ in range(5)))
+        await transport.aclose()
+        return loop.time() - started
+
+    elapsed = asyncio.run(run())
+
+    # Then the four past the burst waited 50ms each in turn
+    assert elapsed >= 0.19
+
+
+def test_rate_limiter_reserves_tokens_in_order():
+    """Verify the bucket spends its burst, then queues reservations one interval apart."""
+    # Given a bucket of two tokens refilling at ten per second, on a fake clock
+    now = [0.0]
+    limiter = RateLimiter(rate=10, burst=2, clock=lambda: now[0])
+
+    # When four requests reserve at the same instant, then half a second passes
+    delays = [limiter.reserve() for _ in range(4)]
+    now[0] = 0.5
+    later = limiter.reserve()
+
+    # Then the burst is free, the rest queue, and the refill never exceeds the burst
+    assert delays == [0.0, 0.0, 0.1, 0.2]
+    assert later == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() > 0
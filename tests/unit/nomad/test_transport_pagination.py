@@ -1,6 +1,7 @@
 """Tests for transport pagination."""
 
 import asyncio
+import contextlib
 
 import httpx  # respx-bundled; used to build sequenced mock responses
 import respx
@@ -34,3 +35,66 @@ def test_paginate_follows_next_token(httpx2_mock: respx.Router):
     assert pages == [[1], [2]]
     assert route.call_count == 2
     assert route.calls.last.request.url.params["next_token"] == "t2"  # noqa: S105
+
+
+def test_paginate_prefetch_requests_next_page_before_yielding(httpx2_mock: respx.Router):
+    """Verify prefetch has the next page in flight while the caller holds the current one."""
+    # Given three pages linked by next-token headers
+    route = httpx2_mock.get(f"{_ADDR}/v1/nodes").mock(
+        side_effect=[
+            httpx.Response(200, json=[1], headers={"X-Nomad-Nexttoken": "t2"}),
+            httpx.Response(200, json=[2], headers={"X-Nomad-Nexttoken": "t3"}),
+            httpx.Response(200, json=[3]),
+        ]
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR))
+
+    # When iterating with prefetch and noting how many requests were issued at each yield
+    async def run() -> tuple[list[list[int]], list[int]]:
+        pages: list[list[int]] = []
+        issued: list[int] = []
+        async for resp in transport.paginate("/nodes", prefetch=True):
+            await asyncio.sleep(0.01)
+            issued.append(route.call_count)
+            pages.append(resp.json())
+        await transport.aclose()
+        return pages, issued
+
+    pages, issued = asyncio.run(run())
+
+    # Then every page arrives in order, each time with the following page already requested
+    assert pages == [[1], [2], [3]]
+    assert issued == [2, 3, 3]
+    assert [call.request.url.params.get("next_token") for call in route.calls] == [
+        None,
+        "t2",
+        "t3",
+    ]
+
+
+def test_paginate_prefetch_stops_when_the_caller_breaks(httpx2_mock: respx.Router):
+    """Verify breaking out of a prefetching iteration requests no further pages."""
+    # Given a listing that would run to many pages
+    route = httpx2_mock.get(f"{_ADDR}/v1/nodes").mock(
+        side_effect=[
+            httpx.Response(200, json=[n], headers={"X-Nomad-Nexttoken": f"t{n + 1}"})
+            for n in range(10)
+        ]
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR))
+
+    # When the caller stops after the first page
+    async def run() -> list[int]:
+        async with contextlib.aclosing(transport.paginate("/nodes", prefetch=True)) as pages:
+            async for resp in pages:
+                first = resp.json()
+                break
+        await asyncio.sleep(0.01)
+        await transport.aclose()
+        return first
+
+    first = asyncio.run(run())
+
+    # Then only the first page and at most the one prefetch were requested
+    assert first == [0]
+    assert route.call_count <= 2
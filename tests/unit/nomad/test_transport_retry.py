@@ -0,0 +1,236 @@
+"""Tests for transport retries, backoff and the circuit breaker."""
+
+import asyncio
+
+import httpx  # respx-bundled; used to build sequenced mock responses
+import httpx2
+import pytest
+import respx
+
+from nd.nomad.config import NomadConfig
+from nd.nomad.errors import (
+    NomadCircuitOpenError,
+    NomadConnectionError,
+    NomadServerError,
+)
+from nd.nomad.retry import CircuitBreaker, backoff
+from nd.nomad.transport import AsyncTransport
+
+_ADDR = "http://nomad.test:4646"
+
+
+def _request(transport: AsyncTransport, method: str, path: str) -> httpx.Response:
+    """Send one request through ``transport`` and close it."""
+
+    async def run() -> httpx.Response:
+        try:
+            return await transport.request(method, path)
+        finally:
+            await transport.aclose()
+
+    return asyncio.run(run())
+
+
+def test_get_is_retried_after_a_transient_server_error(httpx2_mock: respx.Router):
+    """Verify a GET answered 500 during a leader election succeeds on the retry."""
+    # Given an endpoint that fails once, then answers
+    route = httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(
+        side_effect=[
+            httpx.Response(500, text="No cluster leader"),
+            httpx.Response(200, json=[]),
+        ]
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retry_backoff=0))
+
+    # When requesting the listing
+    response = _request(transport, "GET", "/jobs")
+
+    # Then the second attempt's answer is returned
+    assert response.status_code == 200
+    assert route.call_count == 2
+
+
+def test_post_is_not_retried_after_a_server_error(httpx2_mock: respx.Router):
+    """Verify a write that Nomad may have acted on is not sent twice."""
+    # Given a job register endpoint failing with a 500
+    route = httpx2_mock.post(f"{_ADDR}/v1/jobs").mock(return_value=httpx.Response(500))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retry_backoff=0))
+
+    # When registering
+    # Then the error is raised after a single attempt
+    with pytest.raises(NomadServerError):
+        _request(transport, "POST", "/jobs")
+    assert route.call_count == 1
+
+
+def test_post_is_retried_when_the_connection_was_refused(httpx2_mock: respx.Router):
+    """Verify a write that never reached Nomad is retried."""
+    # Given an endpoint refusing the first connection
+    route = httpx2_mock.post(f"{_ADDR}/v1/jobs").mock(
+        side_effect=[httpx2.ConnectError("refused"), httpx.Response(200, json={})]
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retry_backoff=0))
+
+    # When registering
+    response = _request(transport, "POST", "/jobs")
+
+    # Then the retry succeeds
+    assert response.status_code == 200
+    assert route.call_count == 2
+
+
+def test_retry_waits_for_retry_after(httpx2_mock: respx.Router):
+    """Verify a 503 with Retry-After is retried no sooner than the header asks."""
+    # Given an endpoint that asks to be retried after 0.2 seconds
+    httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(
+        side_effect=[
+            httpx.Response(503, headers={"Retry-After": "0.2"}),
+            httpx.Response(200, json=[]),
+        ]
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retry_backoff=0))
+
+    # When requesting
+    loop_time: list[float] = []
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        loop_time.append(loop.time())
+        await transport.request("GET", "/jobs")
+        loop_time.append(loop.time())
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    # Then the retry waited out the delay
+    assert loop_time[1] - loop_time[0] >= 0.2
+
+
+def test_long_retry_after_is_not_waited_for(httpx2_mock: respx.Router):
+    """Verify a Retry-After beyond the cap raises instead of stalling the command."""
+    # Given an endpoint asking for a two-minute pause
+    route = httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "120"})
+    )
+    transport = AsyncTransport(NomadConfig(address=_ADDR))
+
+    # When requesting
+    # Then the 429 is raised at once
+    with pytest.raises(Exception, match="429"):
+        _request(transport, "GET", "/jobs")
+    assert route.call_count == 1
+
+
+def test_retries_give_up_with_the_last_error(httpx2_mock: respx.Router):
+    """Verify a request is tried retries + 1 times before its failure is raised."""
+    # Given an agent that cannot be reached
+    route = httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(side_effect=httpx2.ConnectError("refused"))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retries=2, retry_backoff=0))
+
+    # When requesting
+    # Then the connection error surfaces after three attempts
+    with pytest.raises(NomadConnectionError, match="Could not reach Nomad"):
+        _request(transport, "GET", "/jobs")
+    assert route.call_count == 3
+
+
+def test_concurrent_requests_are_held_back_by_the_open_circuit(
+    httpx2_mock: respx.Router, monkeypatch
+):
+    """Verify many requests against a failing agent do not each retry at full rate."""
+    # Given a failing agent and a short circuit cooldown
+    monkeypatch.setattr("nd.nomad.transport.CIRCUIT_BREAKER_COOLDOWN_SECONDS", 0.05)
+    route = httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(return_value=httpx.Response(502))
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retries=3, retry_backoff=0))
+
+    # When twenty requests run at once
+    async def run() -> list[BaseException | httpx.Response]:
+        results = await asyncio.gather(
+            *(transport.request("GET", "/jobs") for _ in range(20)), return_exceptions=True
+        )
+        await transport.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    # Then each fails, but the circuit kept the agent from seeing all 80 attempts
+    assert all(isinstance(result, Exception) for result in results)
+    assert route.call_count < 20 * 4
+
+
+def test_circuit_breaker_opens_then_probes():
+    """Verify the breaker refuses after the threshold and admits one probe per cooldown."""
+    # Given a breaker on a fake clock
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, cooldown=1.0, clock=lambda: now[0])
+
+    # When two admitted requests fail
+    for _ in range(2):
+        breaker.admit()
+        breaker.record_failure()
+
+    # Then requests are refused until the cooldown passes
+    with pytest.raises(NomadCircuitOpenError) as refused:
+        breaker.admit()
+    assert refused.value.retry_in == pytest.approx(1.0)
+
+    # And after it, one probe is admitted while others are still refused
+    now[0] = 1.5
+    breaker.admit()
+    with pytest.raises(NomadCircuitOpenError):
+        breaker.admit()
+
+    # And the probe's success closes the circuit
+    breaker.record_success()
+    breaker.admit()
+
+
+def test_backoff_grows_and_is_capped():
+    """Verify backoff waits at least half its doubling step, up to the cap."""
+    # Given a base delay
+    # When computing delays for successive retries
+    delays = [backoff(attempt, 0.5) for attempt in range(10)]
+
+    # Then each lies within its jittered step and none exceeds the cap
+    assert 0.25 <= delays[0] <= 0.5
+    assert 0.5 <= delays[1] <= 1.0
+    assert all(delay <= 4.0 for delay in delays)
+
+
+def test_long_poll_does_not_claim_the_circuit_probe(httpx2_mock: respx.Router, monkeypatch):
+    """Verify a blocking query held past the cooldown leaves the probe to a short request."""
+    # Given a transport whose circuit has opened and cooled down
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=1, cooldown=1.0, clock=lambda: now[0])
+    breaker.admit()
+    breaker.record_failure()
+    now[0] = 1.5
+    transport = AsyncTransport(NomadConfig(address=_ADDR, retries=0))
+    monkeypatch.setattr(transport, "_breaker", breaker)
+    answered = asyncio.Event()
+
+    async def hold(_request: httpx.Request) -> httpx.Response:
+        await answered.wait()
+        return httpx.Response(200, json=[], headers={"X-Nomad-Index": "8"})
+
+    httpx2_mock.get(f"{_ADDR}/v1/jobs", params={"index": "7"}).mock(side_effect=hold)
+    httpx2_mock.get(f"{_ADDR}/v1/job/web").mock(return_value=httpx.Response(200, json={}))
+
+    async def run() -> tuple[httpx.Response, httpx.Response]:
+        try:
+            poll = asyncio.create_task(transport.request("GET", "/jobs", index=7, wait=60))
+            await asyncio.sleep(0)
+            probe = await transport.request("GET", "/job/web")
+            answered.set()
+            return await poll, probe
+        finally:
+            await transport.aclose()
+
+    # When a long poll is in flight as a short request arrives
+    poll, probe = asyncio.run(run())
+
+    # Then the short request is admitted as the probe and its success closes the circuit
+    assert poll.status_code == 200
+    assert probe.status_code == 200
+    breaker.admit()
+    breaker.admit()
@@ -0,0 +1,79 @@
+"""Tests for the on-disk job spec cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from nd.binary.cache import JobSpecCache
+from nd.nomad.config import NomadConfig
+
+
+def test_cache_misses_when_cluster_settings_change(tmp_path) -> None:
+    """Verify an entry recorded for one cluster is not served for another."""
+    # Given a compile cached against one namespace
+    job = tmp_path / "web.hcl"
+    job.write_text('job "web" {}')
+    binary = Path("/usr/bin/nomad")
+    root = tmp_path / "cache"
+    JobSpecCache(NomadConfig(namespace="a"), binary, root=root).store_compiled(job, b"{}")
+
+    # When reading it back under the same and a different namespace
+    same = JobSpecCache(NomadConfig(namespace="a"), binary, root=root).compiled(job)
+    other = JobSpecCache(NomadConfig(namespace="b"), binary, root=root).compiled(job)
+
+    # Then only the matching settings hit
+    assert same == b"{}"
+    assert other is None
+
+
+def test_cache_misses_when_a_job_variable_changes(tmp_path, monkeypatch) -> None:
+    """Verify a compile cached under one NOMAD_VAR_ value is not served for another."""
+    # Given a compile cached while NOMAD_VAR_image_tag was "1.0"
+    job = tmp_path / "web.hcl"
+    job.write_text('job "web" {}')
+    binary = Path("/usr/bin/nomad")
+    root = tmp_path / "cache"
+    monkeypatch.setenv("NOMAD_VAR_image_tag", "1.0")
+    JobSpecCache(NomadConfig(), binary, root=root).store_compiled(job, b"{}")
+
+    # When reading it back under the same value and after the variable changes
+    same = JobSpecCache(NomadConfig(), binary, root=root).compiled(job)
+    monkeypatch.setenv("NOMAD_VAR_image_tag", "1.1")
+    changed = JobSpecCache(NomadConfig(), binary, root=root).compiled(job)
+
+    # Then only the unchanged variables hit
+    assert same == b"{}"
+    assert changed is None
+
+
+def test_cache_keeps_validation_and_compile_apart(tmp_path) -> None:
+    """Verify recording a compile and a validation never drops the other."""
+    # Given a file that validated and was then compiled
+    job = tmp_path / "web.hcl"
+    job.write_text('job "web" {}')
+    cache = JobSpecCache(NomadConfig(), Path("/usr/bin/nomad"), root=tmp_path / "cache")
+    cache.store_validated(job)
+    cache.store_compiled(job, b'{"Job": {}}')
+    stale = JobSpecCache(NomadConfig(), Path("/usr/bin/nomad"), root=tmp_path / "cache")
+    stale.store_validated(job)
+
+    # When reading both facts back, after a second handle re-recorded the validation
+    # Then both are present
+    assert cache.validated(job)
+    assert cache.compiled(job) == b'{"Job": {}}'
+
+
+def test_cache_treats_corrupt_entry_as_miss(tmp_path) -> None:
+    """Verify an unreadable entry is ignored rather than raised."""
+    # Given a cached compile whose entry file was corrupted
+    job = tmp_path / "web.hcl"
+    job.write_text('job "web" {}')
+    root = tmp_path / "cache"
+    cache = JobSpecCache(NomadConfig(), Path("/usr/bin/nomad"), root=root)
+    cache.store_compiled(job, b"{}")
+    for entry in (root / "jobspecs").iterdir():
+        entry.write_text("not json")
+
+    # When reading it
+    # Then it is a miss
+    assert cache.compiled(job) is None
@@ -0,0 +1,57 @@
+"""Tests for the shared on-disk cache file helpers."""
+
+from __future__ import annotations
+
+import msgspec
+
+from nd.cachefiles import atomic_write_bytes, read_json, read_versioned
+
+
+class _Stored(msgspec.Struct, frozen=True):
+    """A minimal versioned cache layout."""
+
+    version: int
+    items: list[str]
+
+
+def test_atomic_write_round_trips_and_leaves_no_temp_file(tmp_path) -> None:
+    """Verify a write creates the directory, replaces the file and cleans up after itself."""
+    # Given a cache path in a directory that does not exist yet
+    path = tmp_path / "cache" / "index.json"
+
+    # When writing it twice
+    atomic_write_bytes(path, msgspec.json.encode(_Stored(1, ["old"])), what="test cache")
+    atomic_write_bytes(path, msgspec.json.encode(_Stored(1, ["new"])), what="test cache")
+
+    # Then the last payload is read back and only the cache file remains
+    assert read_json(path, _Stored, what="test cache") == _Stored(1, ["new"])
+    assert [p.name for p in path.parent.iterdir()] == ["index.json"]
+
+
+def test_atomic_write_failure_is_not_raised(tmp_path) -> None:
+    """Verify an unwritable cache location is logged, not raised."""
+    # Given a cache path whose parent is a regular file
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    # When writing beneath it
+    # Then nothing is raised and nothing is written
+    atomic_write_bytes(blocker / "index.json", b"{}", what="test cache")
+    assert blocker.read_text() == ""
+
+
+def test_readers_treat_missing_corrupt_and_stale_files_as_misses(tmp_path) -> None:
+    """Verify a missing, corrupt or older-layout file reads as None."""
+    # Given a corrupt file and a file written in an older layout
+    missing = tmp_path / "missing.json"
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    stale = tmp_path / "stale.json"
+    stale.write_bytes(msgspec.json.encode(_Stored(1, ["a"])))
+
+    # When reading each, expecting layout version 2 where it matters
+    # Then every one is a miss, while the stale file still decodes as plain JSON
+    assert read_json(missing, _Stored, what="test cache") is None
+    assert read_json(corrupt, _Stored, what="test cache") is None
+    assert read_versioned(stale, _Stored, 2, what="test cache") is None
+    assert read_versioned(stale, _Stored, 1, what="test cache") == _Stored(1, ["a"])
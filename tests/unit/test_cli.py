@@ -1,5 +1,6 @@
 """Tests for the root CLI app."""
 
+import subprocess
 import sys
 
 import httpx2
@@ -50,14 +51,58 @@ def test_cli_no_subcommand_runs_status(mocker, typer_runner):
     assert render_mock.called
 
 
-def test_stop_command_is_registered():
+def test_stop_command_is_registered(typer_runner):
     """Verify the stop subcommand is wired into the root app."""
     # Given the root CLI app
-    # When listing registered typer groups
-    names = {group.name for group in app.registered_groups}
+    # When asking the stop subcommand for its help
+    result = typer_runner.invoke(app, ["stop", "--help"])
 
-    # Then stop is present
-    assert "stop" in names
+    # Then the lazily imported command resolves and describes itself
+    assert result.exit_code == 0, result.output
+    assert "Stop (and optionally purge)" in result.output
+
+
+def _modules_after(*args: str) -> set[str]:
+    """Invoke the CLI with ``args`` in a fresh interpreter and return the loaded modules."""
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from nd.cli import app\n"
+        f"CliRunner().invoke(app, {list(args)!r})\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = subprocess.run(  # noqa: S603 - runs this interpreter on a fixed script
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_version_imports_no_subcommands():
+    """Verify `nd --version` loads no command module, Nomad client, or HCL parser."""
+    # Given a fresh interpreter
+    # When printing the version
+    modules = _modules_after("--version")
+
+    # Then only the root CLI module of nd is imported
+    assert {m for m in modules if m.startswith("nd.")} == {"nd.cli"}
+    assert not modules & {"hcl2", "lark", "httpx2", "msgspec", "questionary"}
+
+
+def test_subcommand_imports_only_its_own_module():
+    """Verify invoking one subcommand leaves every other command module unimported."""
+    # Given a fresh interpreter
+    # When asking the logs subcommand for its help
+    modules = _modules_after("logs", "--help")
+
+    # Then logs is loaded but no sibling command is
+    commands = {m for m in modules if m.startswith("nd.commands.") and "._" not in m}
+    assert commands == {"nd.commands.logs"}
+    # And neither the watch feeds, the live panel nor the daemon's server side come along
+    assert "hcl2" not in modules
+    assert "nd.commands._watch" not in modules
+    assert "nd.ui.live_panel" not in modules
+    assert "nd.daemon.server" not in modules
+    assert "nd.daemon.mirror" not in modules
 
 
 def test_main_handles_keyboard_interrupt(mocker):
@@ -77,16 +122,10 @@ def test_main_maps_connection_error_to_clean_exit(httpx2_mock: respx.Router, mon
     # Given every endpoint failing at the transport level
     monkeypatch.setenv("NOMAD_ADDR", _ADDR)
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    for path in (
-        "/v1/nodes",
-        "/v1/jobs",
-        "/v1/allocations",
-        "/v1/agent/members",
-        "/v1/status/leader",
-        "/v1/deployments",
-        "/v1/evaluations",
-    ):
-        httpx2_mock.get(f"{_ADDR}{path}").mock(side_effect=httpx2.ConnectError("unreachable"))
+    (tmp_path / "nd").mkdir()
+    (tmp_path / "nd" / "config.toml").write_text("[nomad]\nretries = 0\n")
+    # One catch-all route: once the circuit breaker opens, later endpoints are not requested.
+    httpx2_mock.route(host="nomad.test").mock(side_effect=httpx2.ConnectError("unreachable"))
     monkeypatch.setattr(sys, "argv", ["nd", "status"])
 
     # When running main()
@@ -0,0 +1,240 @@
+"""Tests for the nd daemon's cluster mirror, socket server and client."""
+
+import asyncio
+import socket
+import stat
+import tempfile
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from nd.daemon import Snapshot, config_fingerprint, fetch_snapshot
+from nd.daemon.mirror import ClusterMirror
+from nd.daemon.server import DaemonRunningError, serve
+from nd.nomad import NomadClient
+from nd.nomad.config import NomadConfig
+from tests.fakes import FakeNomad, generate_cluster
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """A socket path short enough for AF_UNIX, unlike pytest's tmp_path."""
+    with tempfile.TemporaryDirectory(prefix="nd-", dir="/tmp") as tmp:
+        yield Path(tmp) / "daemon.sock"
+
+
+def _with_daemon[T](config: NomadConfig, path: Path, body: Callable[[], Awaitable[T]]) -> T:
+    """Run ``body`` while a daemon serves ``config`` on ``path``, then stop the daemon."""
+
+    async def run() -> T:
+        ready = asyncio.Event()
+        server = asyncio.create_task(serve(config, path, ready=ready))
+        await asyncio.wait_for(ready.wait(), timeout=5)
+        try:
+            return await body()
+        finally:
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+
+    return asyncio.run(run())
+
+
+async def _loaded(config: NomadConfig, path: Path) -> Snapshot:
+    """Fetch a snapshot, retrying while the daemon is still loading its first listings."""
+    for _ in range(50):
+        if (snapshot := await fetch_snapshot(config, path=path)) is not None:
+            return snapshot
+        await asyncio.sleep(0.05)
+    msg = "daemon never served a snapshot"
+    raise AssertionError(msg)
+
+
+def test_daemon_serves_the_mirrored_cluster(socket_path):
+    """Verify a command fetching from the daemon gets every listing of the cluster."""
+    # Given a daemon mirroring a fake cluster
+    cluster = generate_cluster(nodes=5, jobs=4, allocs=20)
+    with FakeNomad(cluster) as fake:
+        config = fake.config()
+
+        # When a command asks for a snapshot
+        snapshot = _with_daemon(config, socket_path, lambda: _loaded(config, socket_path))
+
+    # Then it holds the cluster's listings, task states included, and the socket is gone
+    assert [n.id for n in snapshot.nodes] == [n.id for n in cluster.nodes]
+    assert snapshot.allocations == cluster.allocations
+    assert snapshot.leader == cluster.leader
+    assert len(snapshot.members) == 3
+    assert not socket_path.exists()
+
+
+def test_daemon_mirror_follows_cluster_changes(socket_path):
+    """Verify a change in Nomad reaches the next snapshot without a restart."""
+    # Given a daemon that has loaded a cluster
+    cluster = generate_cluster(nodes=2, jobs=2, allocs=4)
+    changed = msgspec.structs.replace(cluster.jobs[0], status="dead")
+    with FakeNomad(cluster) as fake:
+        config = fake.config()
+
+        # When a job changes after the first snapshot
+        async def body() -> Snapshot:
+            await _loaded(config, socket_path)
+            fake.upsert(changed)
+            for _ in range(50):
+                snapshot = await _loaded(config, socket_path)
+                if snapshot.jobs[0].status == "dead":
+                    return snapshot
+                await asyncio.sleep(0.05)
+            return snapshot
+
+        snapshot = _with_daemon(config, socket_path, body)
+
+    # Then the blocking query woke and the snapshot carries the new state
+    assert snapshot.jobs[0].status == "dead"
+
+
+def test_mirror_signals_only_real_changes():
+    """Verify changed() wakes for an upsert, but an unchanged re-read keeps the listing as is."""
+    # Given a mirror that has loaded a cluster, re-reading its unindexed listings quickly
+    cluster = generate_cluster(nodes=2, jobs=2, allocs=4)
+    changed = msgspec.structs.replace(cluster.jobs[0], status="dead")
+
+    async def run(fake: FakeNomad) -> tuple[bool, bool, bool]:
+        async with (
+            NomadClient.from_config(fake.config()) as client,
+            ClusterMirror(client, poll_interval=0.05) as mirror,
+        ):
+            await mirror.snapshot(wait=5)
+            await mirror.changed(wait=0.2)
+            before = mirror.current()
+
+            # When nothing changes for several polls, then a job changes
+            quiet = await mirror.changed(wait=0.3)
+            after_quiet = mirror.current()
+            fake.upsert(changed)
+            woke = await mirror.changed(wait=5)
+            return quiet, after_quiet.jobs is before.jobs, woke
+
+    with FakeNomad(cluster) as fake:
+        quiet, kept, woke = asyncio.run(run(fake))
+
+    # Then the quiet polls neither signalled nor replaced a listing, and the upsert did
+    assert quiet is False
+    assert kept is True
+    assert woke is True
+
+
+def test_daemon_declines_a_different_configuration(socket_path):
+    """Verify a caller with another token or cluster is sent to Nomad instead."""
+    # Given a daemon mirroring a cluster without a token
+    with FakeNomad(generate_cluster(nodes=1, jobs=1, allocs=1)) as fake:
+        config = fake.config()
+
+        # When a caller resolving a different token asks for a snapshot
+        async def body() -> Snapshot | None:
+            await _loaded(config, socket_path)
+            return await fetch_snapshot(fake.config(token="other"), path=socket_path)  # noqa: S106
+
+        snapshot = _with_daemon(config, socket_path, body)
+
+    # Then the daemon declines
+    assert snapshot is None
+
+
+def test_config_fingerprint_ignores_client_tuning():
+    """Verify only the cluster and credentials decide whether the daemon answers."""
+    # Given a configuration and variants of it
+    base = NomadConfig(address="http://nomad.test:4646", namespace="apps")
+    tuned = NomadConfig(
+        address="http://nomad.test:4646", namespace="apps", retries=0, http2=True, timeout=5
+    )
+    other_token = NomadConfig(
+        address="http://nomad.test:4646",
+        namespace="apps",
+        token="other",  # noqa: S106
+    )
+    other_region = NomadConfig(address="http://nomad.test:4646", namespace="apps", region="eu")
+
+    # When fingerprinting each
+    # Then tuning leaves the fingerprint alone while a token or region changes it
+    assert config_fingerprint(tuned) == config_fingerprint(base)
+    assert config_fingerprint(other_token) != config_fingerprint(base)
+    assert config_fingerprint(other_region) != config_fingerprint(base)
+
+
+def test_fetch_snapshot_without_a_daemon(socket_path):
+    """Verify fetch_snapshot returns None when nothing listens, even on a stale socket."""
+    # Given no socket, then a socket file nobody listens on
+    config = NomadConfig(address="http://nomad.test:4646")
+    missing = asyncio.run(fetch_snapshot(config, path=socket_path))
+    with socket.socket(socket.AF_UNIX) as stale:
+        stale.bind(str(socket_path))
+
+    # When fetching from each
+    refused = asyncio.run(fetch_snapshot(config, path=socket_path))
+
+    # Then both fall back
+    assert missing is None
+    assert refused is None
+
+
+def test_daemon_socket_is_private_to_its_owner(socket_path):
+    """Verify the socket is bound owner-only even in a directory others can enter."""
+    # Given a socket directory open to every user
+    socket_path.parent.chmod(0o755)
+    with FakeNomad(generate_cluster(nodes=1, jobs=1, allocs=1)) as fake:
+        config = fake.config()
+
+        # When the daemon starts listening
+        async def body() -> int:
+            return stat.S_IMODE(socket_path.stat().st_mode)
+
+        mode = _with_daemon(config, socket_path, body)
+
+    # Then only its owner can connect
+    assert mode == 0o600
+
+
+def test_serve_refuses_a_second_daemon(socket_path):
+    """Verify a second daemon on the same socket fails instead of stealing it."""
+    # Given a running daemon
+    with FakeNomad(generate_cluster(nodes=1, jobs=1, allocs=1)) as fake:
+        config = fake.config()
+
+        # When another daemon starts on its socket
+        async def body() -> None:
+            await serve(config, socket_path)
+
+        # Then it reports the running one
+        with pytest.raises(DaemonRunningError, match="already listening"):
+            _with_daemon(config, socket_path, body)
+
+
+def test_status_collect_answers_from_the_daemon(socket_path, monkeypatch, tmp_path):
+    """Verify nd status reads a running daemon's mirror instead of querying Nomad."""
+    # Given a daemon mirroring the cluster nd status resolves to
+    cluster = generate_cluster(nodes=4, jobs=3, allocs=12)
+    with FakeNomad(cluster) as fake:
+        monkeypatch.setenv("NOMAD_ADDR", fake.address)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(socket_path.parent))
+        path = socket_path.parent / "nd" / "daemon.sock"
+        config = NomadConfig.resolve()
+
+        # When collecting status once the mirror has loaded
+        from nd.commands.status import _collect
+
+        async def body() -> tuple[int, int]:
+            await _loaded(config, path)
+            before = len(fake.requests)
+            report, _panels = await _collect(verbose=0)
+            return before, report.nodes_total
+
+        before, nodes_total = _with_daemon(config, path, body)
+        during = fake.requests[before:]
+
+    # Then the report is built with no direct read of Nomad; only the mirror's own
+    # blocking queries may have been issued meanwhile
+    assert nodes_total == 4
+    assert all("index=" in request for request in during)
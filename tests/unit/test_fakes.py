@@ -0,0 +1,144 @@
+"""Tests for the shared synthetic cluster and the local fake Nomad API."""
+
+import asyncio
+import threading
+import time
+
+import msgspec
+
+from nd.nomad import NomadClient
+from nd.nomad.models.allocation import AllocListStub
+from nd.nomad.models.job import JobListStub
+from nd.nomad.resources.base import QueryResult
+from tests.fakes import FakeNomad, generate_cluster
+
+
+def test_generate_cluster_sizes_and_is_deterministic():
+    """Verify the generator honours the requested sizes and repeats for a seed."""
+    # Given a requested cluster size
+    # When generating it twice with the same seed and once with another
+    first = generate_cluster(nodes=20, jobs=10, allocs=200, seed=7)
+    again = generate_cluster(nodes=20, jobs=10, allocs=200, seed=7)
+    other = generate_cluster(nodes=20, jobs=10, allocs=200, seed=8)
+
+    # Then the sizes match, the same seed repeats, and another seed differs
+    assert (len(first.nodes), len(first.jobs), len(first.allocations)) == (20, 10, 200)
+    assert first == again
+    assert first != other
+
+
+def test_generate_cluster_has_realistic_task_states():
+    """Verify allocations carry a realistic mix of statuses and task states."""
+    # Given a reasonably large cluster
+    cluster = generate_cluster(nodes=50, jobs=40, allocs=2000)
+
+    # When inspecting its allocations
+    statuses = {alloc.client_status for alloc in cluster.allocations}
+
+    # Then running, failed and pending allocations appear, with null and multi-task states
+    assert {"running", "failed", "pending"} <= statuses
+    assert any(alloc.task_states_raw is None for alloc in cluster.allocations)
+    assert any(len(alloc.task_states) > 1 for alloc in cluster.allocations)
+    assert any(
+        state.failed for alloc in cluster.allocations for state in alloc.task_states.values()
+    )
+
+
+def test_fake_nomad_serves_listings_through_pagination():
+    """Verify NomadClient reads every item when the fake splits listings into pages."""
+    # Given a fake that pages every listing seven items at a time
+    cluster = generate_cluster(nodes=30, jobs=12, allocs=100)
+    with FakeNomad(cluster, page_size=7) as fake:
+        # When listing through an unmodified client
+        async def _list() -> tuple[list, list]:
+            async with NomadClient.from_config(fake.config()) as client:
+                return await client.nodes.list(), await client.allocations.list()
+
+        nodes, allocs = asyncio.run(_list())
+
+    # Then every item comes back in order, fetched over several next-token pages
+    assert [n.id for n in nodes] == [n.id for n in cluster.nodes]
+    assert [a.id for a in allocs] == [a.id for a in cluster.allocations]
+    assert sum("next_token=" in r for r in fake.requests if r.startswith("/v1/nodes")) == 4
+
+
+def test_fake_nomad_blocking_query_wakes_on_change():
+    """Verify a blocking query is held until the watched table changes."""
+    # Given a fake and an allocation that will change shortly after the query starts
+    cluster = generate_cluster(nodes=3, jobs=2, allocs=4)
+    changed = msgspec.structs.replace(cluster.allocations[0], client_status="failed")
+    with FakeNomad(cluster) as fake:
+        since = fake.index("allocations")
+        timer = threading.Timer(0.2, fake.upsert, args=(changed,))
+
+        # When blocking on the allocations listing from the current index
+        async def _watch() -> QueryResult[list[AllocListStub]]:
+            async with NomadClient.from_config(fake.config()) as client:
+                timer.start()
+                return await client.allocations.list_indexed(index=since, wait=10)
+
+        started = time.monotonic()
+        result = asyncio.run(_watch())
+        elapsed = time.monotonic() - started
+
+    # Then it returns the change at a higher index, well before the wait elapses
+    assert result.index > since
+    assert result.value[0].client_status == "failed"
+    assert 0.15 < elapsed < 5
+
+
+def test_fake_nomad_blocking_query_returns_after_wait():
+    """Verify a blocking query with no change returns the unchanged index after the wait."""
+    # Given a fake whose jobs never change
+    with FakeNomad(generate_cluster(nodes=1, jobs=3, allocs=0)) as fake:
+        since = fake.index("jobs")
+
+        # When blocking on the jobs listing with a short wait
+        async def _watch() -> QueryResult[list[JobListStub]]:
+            async with NomadClient.from_config(fake.config()) as client:
+                return await client.jobs.list_indexed(index=since, wait=0.2)
+
+        result = asyncio.run(_watch())
+
+    # Then the listing comes back at the same index
+    assert result.index == since
+    assert len(result.value) == 3
+
+
+def test_fake_nomad_job_scoped_listings_and_removal():
+    """Verify job-scoped allocation listings filter by job and removals take effect."""
+    # Given a cluster whose allocations spread over two jobs
+    cluster = generate_cluster(nodes=2, jobs=2, allocs=6)
+    with FakeNomad(cluster) as fake:
+        fake.remove(AllocListStub, "alloc-00000000")
+
+        # When listing one job's allocations
+        async def _list() -> list[AllocListStub]:
+            async with NomadClient.from_config(fake.config()) as client:
+                return await client.jobs.allocations("job-00000")
+
+        allocs = asyncio.run(_list())
+
+    # Then only that job's remaining allocations are returned
+    assert [a.id for a in allocs] == ["alloc-00000002", "alloc-00000004"]
+
+
+def test_fake_nomad_applies_filters_and_prunes_task_states():
+    """Verify the fake honours bexpr equality filters and task_states=false."""
+    # Given a cluster whose allocations spread over three jobs
+    cluster = generate_cluster(nodes=2, jobs=3, allocs=9)
+    with FakeNomad(cluster) as fake:
+        # When listing two jobs' allocations without task states
+        async def _list() -> list[AllocListStub]:
+            async with NomadClient.from_config(fake.config()) as client:
+                return await client.allocations.list(
+                    filter_expr='JobID == "job-00000" or JobID == "job-00002"',
+                    task_states=False,
+                )
+
+        allocs = asyncio.run(_list())
+
+    # Then only those jobs' allocations come back, with no task states
+    assert {a.job_id for a in allocs} == {"job-00000", "job-00002"}
+    assert len(allocs) == 6
+    assert all(a.task_states_raw is None for a in allocs)
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from nd.jobfiles import (
+    JobFileIndex,
     discover_job_files,
     extract_job_names,
     is_job_file,
@@ -123,3 +124,59 @@ def test_load_job_directories_non_list_directories(tmp_path: Path) -> None:
     # Then a NomadConfigError is raised because directories must be a list
     with pytest.raises(NomadConfigError):
         load_job_directories(cfg)
+
+
+def test_discover_job_files_reuses_index_for_unchanged_files(tmp_path: Path, mocker) -> None:
+    """Verify a second discovery only re-reads files whose stat changed."""
+    # Given a job file, a non-job file, and an index stored in the cache dir
+    d = tmp_path / "jobs"
+    d.mkdir()
+    web = d / "web.hcl"
+    web.write_text('job "web" {}\n')
+    (d / "vars.hcl").write_text('variable "x" {}\n')
+    index_path = tmp_path / "cache" / "jobfiles.json"
+    discover_job_files([d], JobFileIndex(index_path))
+
+    # When discovering again after editing only the job file
+    web.write_text('job "web-v2" {}\n')
+    read_text = mocker.spy(Path, "read_text")
+    files = discover_job_files([d], JobFileIndex(index_path))
+
+    # Then only the edited file is read, and the non-job file stays excluded
+    assert [f.job_names for f in files] == [["web-v2"]]
+    assert [call.args[0].name for call in read_text.call_args_list] == ["web.hcl"]
+
+
+def test_discover_job_files_rescan_ignores_index(tmp_path: Path, mocker) -> None:
+    """Verify --rescan re-reads every file even when the index is current."""
+    # Given an index built from one job file
+    d = tmp_path / "jobs"
+    d.mkdir()
+    (d / "web.hcl").write_text('job "web" {}\n')
+    index_path = tmp_path / "cache" / "jobfiles.json"
+    discover_job_files([d], JobFileIndex(index_path))
+
+    # When discovering with a rescan
+    read_text = mocker.spy(Path, "read_text")
+    files = discover_job_files([d], JobFileIndex(index_path, rescan=True))
+
+    # Then the unchanged file was read again
+    assert [f.job_names for f in files] == [["web"]]
+    assert read_text.call_count == 1
+
+
+def test_job_file_index_treats_corrupt_index_as_empty(tmp_path: Path) -> None:
+    """Verify an unreadable index falls back to a full scan instead of failing."""
+    # Given a corrupt index file
+    d = tmp_path / "jobs"
+    d.mkdir()
+    (d / "web.hcl").write_text('job "web" {}\n')
+    index_path = tmp_path / "jobfiles.json"
+    index_path.write_text("not json")
+
+    # When discovering with it
+    files = discover_job_files([d], JobFileIndex(index_path))
+
+    # Then discovery succeeds and the index is rewritten
+    assert [f.job_names for f in files] == [["web"]]
+    assert index_path.read_bytes().startswith(b"{")
@@ -9,6 +9,7 @@ import pytest
 
 from nd.binary import NomadBinary, NomadBinaryError
 from nd.binary import runner as runner_mod
+from nd.binary.cache import JobSpecCache
 from nd.nomad.config import NomadConfig
 
 
@@ -340,3 +341,66 @@ def test_stream_logs_export_with_tail_writes_snapshot(monkeypatch, tmp_path, nom
     assert "10" in argv
     assert "-f" not in argv
     assert out.read_bytes() == b"x\n"
+
+
+# --- job spec cache ---------------------------------------------------------------
+
+
+def _cached_nomad(tmp_path: Path) -> NomadBinary:
+    config = NomadConfig(address="http://nomad.test:4646")
+    binary = Path("/usr/bin/nomad")
+    return NomadBinary(config, binary, JobSpecCache(config, binary, root=tmp_path / "cache"))
+
+
+def test_compile_to_json_reuses_cached_output_for_unchanged_file(monkeypatch, tmp_path) -> None:
+    """Verify a second compile of an unchanged file skips the binary."""
+    # Given a job file and a binary that counts its launches
+    job = tmp_path / "web.hcl"
+    job.write_text('job "web" {}')
+    calls: list[list[str]] = []
+
+    def fake_run(argv, **kw) -> _FakeResult:
+        calls.append(argv)
+        return _FakeResult(stdout='{"Job": {"ID": "web"}}')
+
+    monkeypatch.setattr(runner_mod, "run_command", fake_run)
+    nomad = _cached_nomad(tmp_path)
+
+    # When compiling twice, then again after the file changes
+    first = nomad.compile_to_json(job)
+    second = nomad.compile_to_json(job)
+    job.write_text('job "web" { type = "batch" }')
+    nomad.compile_to_json(job)
+
+    # Then the cached payload is returned and only a changed file re-runs the binary
+    assert first == second == b'{"Job": {"ID": "web"}}'
+    assert len(calls) == 2
+
+
+def test_validate_skips_binary_after_success_but_retries_failure(monkeypatch, tmp_path) -> None:
+    """Verify only a successful validation is cached."""
+    from nclutils.sh import ShellCommandFailedError
+
+    # Given a job file whose first validation fails and later ones pass
+    job = tmp_path / "web.hcl"
+    job.write_text('job "web" {}')
+    outcomes = iter([ShellCommandFailedError(msg="boom"), None])
+    calls: list[list[str]] = []
+
+    def fake_run(argv, **kw) -> _FakeResult:
+        calls.append(argv)
+        if (outcome := next(outcomes)) is not None:
+            raise outcome
+        return _FakeResult()
+
+    monkeypatch.setattr(runner_mod, "run_command", fake_run)
+    nomad = _cached_nomad(tmp_path)
+
+    # When validating three times
+    with pytest.raises(NomadBinaryError):
+        nomad.validate(job)
+    nomad.validate(job)
+    nomad.validate(job)
+
+    # Then the failure was retried and the success served the third call from cache
+    assert len(calls) == 2
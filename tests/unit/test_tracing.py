@@ -0,0 +1,119 @@
+"""Tests for OTLP JSON tracing of command phases and Nomad requests."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx  # respx-bundled; used to build mock responses
+import pytest
+import respx
+
+from nd.cli import app
+from nd.commands._specs import SpecPipeline
+from nd.nomad import NomadConfig
+from nd.nomad.transport import AsyncTransport
+from nd.tracing import span, start_tracing
+
+_ADDR = "http://nomad.test:4646"
+
+
+def _spans(path: Path) -> dict[str, dict]:
+    """Read an exported trace and index its spans by name."""
+    doc = json.loads(path.read_text())
+    spans = doc["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    return {s["name"]: s for s in spans}
+
+
+def test_span_is_a_no_op_without_tracing():
+    """Verify spans cost nothing and yield nothing while tracing is off."""
+    # Given tracing was never started
+    # When opening a span
+    with span("discover job files") as traced:
+        pass
+
+    # Then there is no span to annotate
+    assert traced is None
+
+
+def test_trace_nests_phases_and_requests_under_the_command(httpx2_mock: respx.Router, tmp_path):
+    """Verify phases, their requests and failures export as one linked OTLP trace."""
+    # Given tracing to a file, and a Nomad endpoint
+    httpx2_mock.post(f"{_ADDR}/v1/jobs").mock(return_value=httpx.Response(200, json={}))
+    out = tmp_path / "trace.json"
+    finish = start_tracing(str(out), "nd run")
+
+    # When a phase sends a request, and another phase fails
+    async def run() -> None:
+        transport = AsyncTransport(NomadConfig(address=_ADDR))
+        with span("register", **{"nd.job": "web"}):
+            await transport.request("POST", "/jobs")
+        await transport.aclose()
+
+    asyncio.run(run())
+    msg = "bad spec"
+    with pytest.raises(ValueError, match=msg), span("compile"):
+        raise ValueError(msg)
+    finish()
+
+    # Then each span links to its parent under one trace, with typed attributes
+    spans = _spans(out)
+    root, register, request = spans["nd run"], spans["register"], spans["POST /jobs"]
+    assert "parentSpanId" not in root
+    assert register["parentSpanId"] == root["spanId"]
+    assert request["parentSpanId"] == register["spanId"]
+    assert len({s["traceId"] for s in spans.values()}) == 1
+    assert {"key": "nd.job", "value": {"stringValue": "web"}} in register["attributes"]
+    assert {
+        "key": "http.response.status_code",
+        "value": {"intValue": "200"},
+    } in request["attributes"]
+    assert int(request["startTimeUnixNano"]) >= int(register["startTimeUnixNano"])
+    assert spans["compile"]["status"] == {"code": 2, "message": "ValueError: bad spec"}
+
+    # And the trace stops once finished
+    with span("after") as traced:
+        assert traced is None
+
+
+def test_spec_pipeline_carries_the_span_into_its_workers(mocker, tmp_path):
+    """Verify a subprocess span on the worker pool nests under the span that queued it."""
+    # Given a binary whose validation opens a span, as the real one does
+    nomad = mocker.MagicMock()
+
+    def validate(_path: Path) -> None:
+        with span("nomad job validate"):
+            pass
+
+    nomad.validate.side_effect = validate
+    out = tmp_path / "trace.json"
+    finish = start_tracing(str(out), "nd plan")
+
+    # When validating inside a phase span
+    async def go() -> None:
+        async with SpecPipeline(nomad, workers=2) as specs:
+            with span("validate"):
+                await specs.validate_all([Path("/j/a.hcl")])
+
+    asyncio.run(go())
+    finish()
+
+    # Then the worker's span is the phase's child
+    spans = _spans(out)
+    assert spans["nomad job validate"]["parentSpanId"] == spans["validate"]["spanId"]
+
+
+def test_trace_option_writes_a_trace_when_the_command_exits(typer_runner, monkeypatch, tmp_path):
+    """Verify --trace exports the command's root span and its discovery phase."""
+    # Given no job directories configured and no reachable agent
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("NOMAD_ADDR", "http://127.0.0.1:9")
+    (tmp_path / "nd").mkdir()
+    (tmp_path / "nd" / "config.toml").write_text("[nomad]\nretries = 0\n")
+    out = tmp_path / "trace.json"
+
+    # When listing job files with tracing on, even though the command then fails
+    typer_runner.invoke(app, ["--trace", str(out), "list"])
+
+    # Then discovery is a child of the command's root span
+    spans = _spans(out)
+    assert spans["discover job files"]["parentSpanId"] == spans["nd list"]["spanId"]
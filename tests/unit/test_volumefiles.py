@@ -4,8 +4,11 @@ from pathlib import Path
 
 import pytest
 
+from nd import volumefiles
+from nd.constants import VOLUME_PARSE_POOL_MIN_FILES
 from nd.nomad.errors import NomadConfigError
 from nd.volumefiles import (
+    VolumeSpecCache,
     discover_volume_files,
     load_volume_directories,
     parse_volume_spec,
@@ -106,6 +109,105 @@ def test_discover_volume_files_keeps_only_host_specs(tmp_path: Path) -> None:
     assert [s.name for s in specs] == ["data"]
 
 
+def test_parse_volume_spec_prefilter_skips_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a file that never mentions type = "host" is rejected without parsing."""
+    # Given a job file and a parser that records its calls
+    f = tmp_path / "web.hcl"
+    f.write_text('job "web" {\n  type = "service"\n}', encoding="utf-8")
+    calls: list[str] = []
+    monkeypatch.setattr(volumefiles.hcl2, "loads", lambda text: calls.append(text) or {})
+    # When parsing
+    spec = parse_volume_spec(f)
+    # Then the HCL parser never runs
+    assert spec is None
+    assert calls == []
+
+
+def test_discover_volume_files_cache_skips_reparse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a second discovery answers unchanged files from the cache."""
+    # Given a dir with a host volume discovered once through a cache
+    d = tmp_path / "vols"
+    d.mkdir()
+    (d / "data.hcl").write_text(_HOST_SPEC, encoding="utf-8")
+    cache_path = tmp_path / "cache" / "volumespecs.json"
+    first = discover_volume_files([d], VolumeSpecCache(cache_path))
+
+    # When discovering again with a parser that must not be called
+    def _fail(text: str) -> dict:
+        raise AssertionError(text)
+
+    monkeypatch.setattr(volumefiles.hcl2, "loads", _fail)
+    second = discover_volume_files([d], VolumeSpecCache(cache_path))
+
+    # Then the cached spec matches the parsed one
+    assert cache_path.exists()
+    assert second == first
+    assert second[0].path == d / "data.hcl"
+
+
+def test_volume_spec_cache_ignores_corrupt_file(tmp_path: Path) -> None:
+    """Verify an unreadable cache file is treated as empty and rewritten."""
+    # Given a corrupt cache file
+    cache_path = tmp_path / "volumespecs.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+    d = tmp_path / "vols"
+    d.mkdir()
+    (d / "data.hcl").write_text(_HOST_SPEC, encoding="utf-8")
+    # When discovering through it
+    specs = discover_volume_files([d], VolumeSpecCache(cache_path))
+    # Then discovery succeeds and the cache is replaced with a valid one
+    assert [s.name for s in specs] == ["data"]
+    assert VolumeSpecCache(cache_path).lookup(_HOST_SPEC) is not None
+
+
+def _write_host_specs(directory: Path, count: int) -> None:
+    """Write ``count`` host specs named in reverse file order, plus one unparseable file."""
+    directory.mkdir()
+    for i in range(count):
+        spec = _HOST_SPEC.replace('"data"', f'"vol-{count - i:03d}"', 1)
+        (directory / f"{i:03d}.hcl").write_text(spec, encoding="utf-8")
+    (directory / "broken.hcl").write_text('type = "host"\nname = = "x"', encoding="utf-8")
+
+
+def test_discover_volume_files_parallel_matches_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a pooled discovery returns the same name-sorted specs as a sequential one."""
+    # Given more host specs than the pool threshold on a machine with two cores
+    d = tmp_path / "vols"
+    _write_host_specs(d, VOLUME_PARSE_POOL_MIN_FILES + 2)
+    monkeypatch.setattr(volumefiles.os, "process_cpu_count", lambda: 2)
+    # When discovering sequentially and in parallel
+    sequential = discover_volume_files([d])
+    parallel = discover_volume_files([d], parallel=True)
+    # Then both agree and are sorted by name, skipping the broken file
+    assert parallel == sequential
+    assert [s.name for s in parallel] == sorted(s.name for s in parallel)
+    assert len(parallel) == VOLUME_PARSE_POOL_MIN_FILES + 2
+
+
+def test_discover_volume_files_small_parallel_stays_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a parallel discovery below the threshold never starts a process pool."""
+    # Given a few host specs and a pool that must not be created
+    d = tmp_path / "vols"
+    _write_host_specs(d, 3)
+
+    def _no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError((args, kwargs))
+
+    monkeypatch.setattr(volumefiles, "ProcessPoolExecutor", _no_pool)
+    # When discovering in parallel mode
+    specs = discover_volume_files([d], parallel=True)
+    # Then the specs are parsed in-process
+    assert [s.name for s in specs] == ["vol-001", "vol-002", "vol-003"]
+
+
 def test_load_volume_directories_reads_table(tmp_path: Path) -> None:
     """Verify the [volumes] directories list is read and ~ is expanded."""
     # Given an nd config with a [volumes] table
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
 from rich.console import Console
 
@@ -11,7 +12,9 @@ from nd.ui.live_panel import (
     LiveRow,
     _build_panel,
     _last_siblings,
+    _PanelRenderer,
     finish_row,
+    run_event_lines,
     run_live_panel,
 )
 from nd.ui.styles import OUTCOME_GLYPH
@@ -162,3 +165,107 @@ def test_build_panel_dims_children_after_healthy_finish() -> None:
     # Then the finished parent's child status is dim-wrapped and the in-flight one's is not
     assert "\x1b[2mrunning" in child_line(finished)
     assert "\x1b[2mrunning" not in child_line(running)
+
+
+def test_renderer_reuses_the_panel_until_something_changes() -> None:
+    """Verify frames with no update, elapsed tick or title change return the same panel."""
+    # Given a renderer over two rows on a clock frozen within one second
+    rows = [LiveRow(label=f"job{i}", phase="starting", started_at=0.0) for i in range(2)]
+    renderer = _PanelRenderer(
+        rows, title="Running", console=Console(force_terminal=False), clock=lambda: 0.5
+    )
+
+    # When rendering several frames, then marking one row changed, then retitling
+    first = renderer()
+    idle = renderer()
+    rows[0].phase = "deploying"
+    renderer.mark(rows[0])
+    updated = renderer()
+    renderer.retitle("Done")
+    retitled = renderer()
+
+    # Then idle frames reuse the panel and each change builds a new one
+    assert idle is first
+    assert updated is not first
+    assert retitled is not updated
+    assert retitled.title is not None
+    assert "Done" in str(retitled.title)
+
+
+def test_renderer_rebuilds_only_the_rows_that_changed() -> None:
+    """Verify an update re-renders its own row while other rows keep their cached cells."""
+    # Given a renderer over two in-flight rows
+    rows = [LiveRow(label=f"job{i}", phase="starting", started_at=0.0) for i in range(2)]
+    console = Console(record=True, force_terminal=False, width=60)
+    renderer = _PanelRenderer(rows, title="Running", console=console, clock=lambda: 0.5)
+    renderer()
+    spinners = [renderer._built[id(row)][1][0][0] for row in rows]
+
+    # When many updates land on the first row between two frames
+    for count in range(5):
+        rows[0].phase = f"tick {count}"
+        renderer.mark(rows[0])
+    console.print(renderer())
+
+    # Then the frame shows the latest phase, the first row was rebuilt once with a fresh
+    # spinner, and the second row kept its cells, spinner included
+    assert "tick 4" in console.export_text()
+    assert renderer._built[id(rows[0])][0] == 5
+    assert renderer._built[id(rows[0])][1][0][0] is not spinners[0]
+    assert renderer._built[id(rows[1])][1][0][0] is spinners[1]
+
+
+def test_renderer_matches_a_panel_built_from_scratch() -> None:
+    """Verify cached, pre-parsed cells render exactly like the plain markup they replace."""
+    # Given an in-flight row with a detail row and a finished row
+    rows = [
+        LiveRow(
+            label="web",
+            phase="running: 1/2 healthy",
+            started_at=0.0,
+            children=[LiveChild(cells=["node1", "", "running"])],
+        ),
+        LiveRow(label="api", phase="deployed", started_at=0.0, glyph="ok", ended_at=3.0),
+    ]
+    renderer = _PanelRenderer(rows, title="Deploying", console=Console(), clock=lambda: 5.0)
+
+    def styled(panel) -> str:
+        console = Console(record=True, force_terminal=True, width=60)
+        console.print(panel)
+        return console.export_text(styles=True)
+
+    # When rendering through the renderer and from scratch
+    # Then both draw the same styled text
+    assert styled(renderer()) == styled(_build_panel(rows, title="Deploying", now=5.0))
+
+
+def test_run_event_lines_reports_changes_as_plain_json(capsys) -> None:
+    """Verify each changing update is one markup-free event and repeated ticks are skipped."""
+    # Given a worker that reports the same tick twice before its allocation starts running
+    row = LiveRow(label="web", phase="registering", started_at=0.0)
+    pending = [LiveChild(cells=["[cyan]node1[/]", "", "[yellow]pending[/]"])]
+    running = [LiveChild(cells=["[cyan]node1[/]", "", "[green]running[/]"])]
+
+    async def worker(row: LiveRow, update) -> None:
+        update("placing 0/1 allocs", pending)
+        update("placing 0/1 allocs", pending)
+        update("placing 1/1 allocs", running)
+        finish_row(row, OUTCOME_GLYPH["ok"], "[green]deployed[/]", clock=lambda: 4.0)
+
+    # When running it headless
+    asyncio.run(
+        run_event_lines([row], worker, final_title=lambda secs: "Deployed 1 job", clock=lambda: 2.0)
+    )
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    # Then the duplicate tick is dropped, and statuses and details arrive without markup
+    assert [e["event"] for e in events] == ["progress", "progress", "finished", "done"]
+    assert events[1]["details"] == [{"name": "node1", "role": "", "status": "running", "depth": 1}]
+    assert events[2] | {"ts": None} == {
+        "ts": None,
+        "event": "finished",
+        "job": "web",
+        "status": "deployed",
+        "elapsed": 4.0,
+    }
+    assert events[3]["summary"] == "Deployed 1 job"
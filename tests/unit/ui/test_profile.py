@@ -0,0 +1,65 @@
+"""Tests for the --profile request report."""
+
+import asyncio
+
+import httpx  # respx-bundled; used to build mock responses
+import respx
+from rich.console import Console
+
+from nd.nomad import NomadConfig
+from nd.nomad.instrument import RequestRecord
+from nd.nomad.transport import AsyncTransport
+from nd.ui.profile import profile_table, start_profile
+
+_ADDR = "http://nomad.test:4646"
+
+
+def _record(path: str, latency: float, *, status: int | None = 200) -> RequestRecord:
+    """Build a record for ``GET path`` that took ``latency`` seconds."""
+    return RequestRecord(
+        method="GET", path=path, status=status, bytes=2048, queued=0, latency=latency
+    )
+
+
+def _text(records: list[RequestRecord]) -> list[str]:
+    """Render the profile table and return its lines."""
+    console = Console(width=120, record=True)
+    console.print(profile_table(records))
+    return console.export_text().splitlines()
+
+
+def test_profile_table_groups_endpoints_slowest_first():
+    """Verify reads of different jobs share a row and the costliest endpoint leads."""
+    # Given many fast node reads and two slower job reads, one of which failed
+    records = [_record(f"/node/n{i}", 0.001) for i in range(10)]
+    records += [_record("/job/web", 0.2), _record("/job/db", 0.4, status=None)]
+
+    # When rendering the report
+    lines = _text(records)
+
+    # Then each endpoint is one row, ordered by total time, with its count and failures
+    rows = [line.split() for line in lines if line.strip().startswith("GET")]
+    assert [row[1] for row in rows] == ["/job/{id}", "/node/{id}"]
+    assert rows[0][2:8] == ["2", "1", "200.0ms", "400.0ms", "600.0ms", "4.0KiB"]
+    assert rows[1][2] == "10"
+
+
+def test_start_profile_reports_requests_on_stderr(httpx2_mock: respx.Router, capsys):
+    """Verify the report lists requests sent after profiling started, on stderr."""
+    # Given profiling has started
+    httpx2_mock.get(f"{_ADDR}/v1/jobs").mock(return_value=httpx.Response(200, json=[]))
+    finish = start_profile()
+
+    # When a request is sent and the command finishes
+    async def run() -> None:
+        transport = AsyncTransport(NomadConfig(address=_ADDR))
+        await transport.request("GET", "/jobs")
+        await transport.aclose()
+
+    asyncio.run(run())
+    finish()
+
+    # Then the endpoint appears on stderr, not stdout
+    captured = capsys.readouterr()
+    assert "GET /jobs" in captured.err
+    assert "GET /jobs" not in captured.out